@@ -6,15 +6,21 @@ Manages queuing and processing of multiple images with progress tracking.
 import logging
 import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
 import threading
 import gc
 import os
 import asyncio
 
+try:
+    import psutil  # Current resident memory; peak usage is used without it
+except ImportError:
+    psutil = None
+
 from .processor import ImageProcessor
 from ..presets.profiles import PresetProfile, get_preset
 from .alt_text_generator import AltTextStatus, AltTextGenerator
@@ -23,6 +29,109 @@ from ..utils.filename_template import FilenameTemplate
 
 logger = logging.getLogger(__name__)
 
+# Supported extensions as a tuple for a single str.endswith check per name
+_IMAGE_EXTENSIONS = tuple(ImageProcessor.SUPPORTED_FORMATS)
+
+# Files probed concurrently when adding images in bulk
+_PROBE_WORKERS = 8
+
+# Images handed to the batch executor per worker ahead of the one being
+# collected; bounds what a cancel or error has to wait for
+_SUBMIT_WINDOW_PER_WORKER = 2
+
+
+def _memory_usage_mb() -> float:
+    """Get the resident memory of the calling process in MB."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / 1024 / 1024
+        
+    # Without psutil only the peak is available, which never goes down
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    
+    # On macOS, ru_maxrss is in bytes, on Linux it's in KB
+    if os.name == 'posix' and os.uname().sysname == 'Darwin':
+        return peak / 1024 / 1024
+    return peak / 1024
+
+
+def _probe_image_file(path: Path) -> Tuple[int, Optional[str]]:
+    """
+    Size a file and check that its header is a supported image format.
+    
+    Only the first few bytes are read, so nothing is decoded.
+    
+    Returns:
+        The file size and None, or 0 and the reason the file was rejected
+    """
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(ImageProcessor.SIGNATURE_LENGTH)
+            file_size = os.fstat(f.fileno()).st_size
+    except OSError:
+        return 0, "File does not exist"
+        
+    if not ImageProcessor.has_supported_signature(header):
+        return 0, "Not a supported image file"
+    return file_size, None
+
+
+def _process_image_file(source_path: Path, output_path: Path, preset: PresetProfile,
+                        output_config: Dict[str, Any]) -> Tuple[Optional[str], float, int, float]:
+    """
+    Load an image, apply a preset and save the result.
+    
+    Runs in a batch worker process, or inline for a single worker, with its
+    own processor; the preset and its output configuration are resolved once
+    per batch by the caller.
+    
+    Returns:
+        None or the reason processing failed, the processing time, and the
+        process id and its memory usage in MB
+    """
+    start_time = time.time()
+    try:
+        processor = ImageProcessor()
+        
+        # Load image
+        if not processor.load_image(source_path):
+            raise Exception("Failed to load image")
+            
+        # Apply preset
+        if not preset.process(processor):
+            raise Exception("Failed to apply preset")
+            
+        # Save image
+        if not processor.save_image(output_path, output_config):
+            raise Exception("Failed to save image")
+            
+        error_message = None
+    except Exception as e:
+        error_message = str(e)
+    return error_message, time.time() - start_time, os.getpid(), _memory_usage_mb()
+
+
+def scan_image_files(folder: str, recursive: bool) -> Iterator[str]:
+    """
+    Yield the paths of supported image files in a folder.
+    
+    Uses os.scandir so file types come from the directory listing instead of
+    a stat per entry. Symlinked folders are not descended into.
+    """
+    subfolders = []
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(_IMAGE_EXTENSIONS) and entry.is_file():
+                    yield entry.path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    subfolders.append(entry.path)
+    except OSError as e:
+        logger.warning(f"Could not read folder {folder}: {e}")
+        
+    for subfolder in subfolders:
+        yield from scan_image_files(subfolder, recursive)
+
 
 class ProcessingStatus(Enum):
     """Status of image processing."""
@@ -54,10 +163,20 @@ class BatchItem:
     tag_error: Optional[str] = None
     tag_application_time: float = 0.0
     
+    # Display strings, formatted once for the queue table
+    filename: str = field(init=False, default="")
+    size_text: str = field(init=False, default="")
+    
     def __post_init__(self):
-        """Initialize file size."""
-        if self.source_path.exists():
-            self.file_size = self.source_path.stat().st_size
+        """Initialize file size unless the caller already knows it."""
+        if not self.file_size:
+            try:
+                self.file_size = self.source_path.stat().st_size
+            except OSError:
+                pass
+                
+        self.filename = self.source_path.name
+        self.size_text = f"{self.file_size / (1024 * 1024):.1f} MB"
 
 
 @dataclass
@@ -85,7 +204,8 @@ class BatchProcessor:
         Initialize the batch processor.
         
         Args:
-            max_workers: Maximum number of concurrent processing threads
+            max_workers: Maximum number of images processed at once; more
+                than one processes them in worker processes
         """
         self.queue: List[BatchItem] = []
         self.progress = BatchProgress()
@@ -112,16 +232,15 @@ class BatchProcessor:
         """
         Add an image to the processing queue.
         
+        As in add_images_bulk, the file's header must match a supported image
+        format.
+        
         Args:
             image_path: Path to the image file
             
         Returns:
             bool: True if image was added, False if invalid
         """
-        if not image_path.exists():
-            logger.error(f"File does not exist: {image_path}")
-            return False
-            
         if image_path.suffix.lower() not in ImageProcessor.SUPPORTED_FORMATS:
             logger.error(f"Unsupported format: {image_path.suffix}")
             return False
@@ -132,11 +251,83 @@ class BatchProcessor:
                 logger.warning(f"Image already in queue: {image_path}")
                 return False
                 
-        self.queue.append(BatchItem(source_path=image_path))
+        # A single open checks the file exists, sizes it and checks its header
+        file_size, error = _probe_image_file(image_path)
+        if error:
+            logger.error(f"{error}: {image_path}")
+            return False
+            
+        self.queue.append(BatchItem(source_path=image_path, file_size=file_size))
         self.progress.total_items = len(self.queue)
         logger.info(f"Added to queue: {image_path.name}")
         return True
         
+    def add_images_bulk(self, image_paths: Iterable[Path]) -> int:
+        """
+        Add several images to the processing queue in one pass.
+        
+        Paths are validated as in add_image, but duplicates are looked up in a
+        set rather than by scanning the queue. The remaining files are then
+        opened on a small thread pool, so that slow disks and network shares
+        have several requests in flight, and their headers are checked for a
+        supported image format.
+        
+        Files with an image extension but some other content are rejected
+        here on purpose: they used to be queued and only fail once processing
+        tried to decode them.
+        
+        Args:
+            image_paths: Paths to the image files
+            
+        Returns:
+            int: Number of images added
+        """
+        queued = {item.source_path for item in self.queue}
+        candidates = []
+        
+        for image_path in image_paths:
+            if image_path.suffix.lower() not in ImageProcessor.SUPPORTED_FORMATS:
+                logger.error(f"Unsupported format: {image_path.suffix}")
+                continue
+                
+            if image_path in queued:
+                logger.warning(f"Image already in queue: {image_path}")
+                continue
+                
+            queued.add(image_path)
+            candidates.append(image_path)
+            
+        new_items = []
+        if candidates:
+            with ThreadPoolExecutor(max_workers=min(_PROBE_WORKERS, len(candidates))) as executor:
+                # map keeps the results in selection order
+                for image_path, (file_size, error) in zip(candidates, executor.map(_probe_image_file, candidates)):
+                    if error:
+                        logger.error(f"{error}: {image_path}")
+                        continue
+                        
+                    new_items.append(BatchItem(source_path=image_path, file_size=file_size))
+                    
+        return self.add_validated_items(new_items)
+        
+    def add_validated_items(self, items: List[BatchItem]) -> int:
+        """
+        Append items whose files have already been checked to the queue.
+        
+        Does no file I/O. Callers are responsible for validation and for
+        leaving out paths that are already queued.
+        
+        Args:
+            items: Batch items to append, in order
+            
+        Returns:
+            int: Number of items added
+        """
+        self.queue.extend(items)
+        self.progress.total_items = len(self.queue)
+        logger.info(f"Added {len(items)} images to queue")
+        return len(items)
+        
     def add_folder(self, folder_path: Path, recursive: bool = True) -> int:
         """
         Add all compatible images from a folder to the queue.
@@ -152,14 +343,10 @@ class BatchProcessor:
             logger.error(f"Not a directory: {folder_path}")
             return 0
             
-        added_count = 0
-        pattern = "**/*" if recursive else "*"
+        added_count = self.add_images_bulk(
+            map(Path, scan_image_files(str(folder_path), recursive))
+        )
         
-        for file_path in folder_path.glob(pattern):
-            if file_path.is_file() and file_path.suffix.lower() in ImageProcessor.SUPPORTED_FORMATS:
-                if self.add_image(file_path):
-                    added_count += 1
-                    
         logger.info(f"Added {added_count} images from {folder_path}")
         return added_count
         
@@ -242,34 +429,41 @@ class BatchProcessor:
             except Exception as e:
                 logger.error(f"Error in item complete callback: {e}")
                 
-    def _check_memory_usage(self):
-        """Check and manage memory usage during processing."""
-        try:
-            # Get current process memory usage
-            import resource
-            memory_usage_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    def _check_memory_usage(self, worker_memory_mb: float = 0.0) -> bool:
+        """
+        Check and manage memory usage during processing.
+        
+        Args:
+            worker_memory_mb: Memory used by batch worker processes, added to
+                this process's own usage
             
-            # On macOS, ru_maxrss is in bytes, on Linux it's in KB
-            if os.name == 'posix' and os.uname().sysname == 'Darwin':
-                memory_usage_mb = memory_usage_mb / 1024 / 1024
-            else:
-                memory_usage_mb = memory_usage_mb / 1024
-                
+        Returns:
+            True if usage is approaching the memory limit
+        """
+        try:
+            memory_usage_mb = _memory_usage_mb() + worker_memory_mb
             logger.debug(f"Current memory usage: {memory_usage_mb:.1f} MB")
             
             # If approaching limit, force garbage collection
             if memory_usage_mb > self.memory_limit_mb * 0.8:
                 logger.warning(f"Memory usage high ({memory_usage_mb:.1f} MB), running garbage collection")
                 gc.collect()
+                return True
                 
         except Exception as e:
             logger.debug(f"Could not check memory usage: {e}")
+        return False
             
     def set_memory_limit(self, limit_mb: int):
         """Set the memory limit for batch processing."""
         self.memory_limit_mb = limit_mb
         logger.info(f"Memory limit set to {limit_mb} MB")
         
+    def set_max_workers(self, max_workers: int):
+        """Set how many images are processed at once."""
+        self.max_workers = max(1, max_workers)
+        logger.info(f"Batch workers set to {self.max_workers}")
+        
     def set_memory_optimization(self, enabled: bool):
         """Enable or disable memory optimization."""
         self.enable_memory_optimization = enabled
@@ -337,69 +531,99 @@ class BatchProcessor:
         start_time = time.time()
         processing_times = []
         
-        # Process each image
-        for index, item in enumerate(self.queue):
-            if self._cancel_flag.is_set():
-                item.status = ProcessingStatus.SKIPPED
-                continue
-                
-            # Update progress
-            self.progress.current_item_index = index
-            self.progress.current_item_name = item.source_path.name
-            self._notify_progress()
-            
-            # Process the image
-            item_start_time = time.time()
-            item.status = ProcessingStatus.PROCESSING
-            
-            try:
-                processor = ImageProcessor()
-                
-                # Check memory before loading
-                if self.enable_memory_optimization:
-                    self._check_memory_usage()
+        # With more than one worker, images are decoded, resized and encoded
+        # in worker processes so several are processed at once; results are
+        # collected in queue order. Spawned workers don't inherit this
+        # process's Qt threads. A single worker processes images inline.
+        workers = min(self.max_workers, len(self.queue))
+        executor = None
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+        window = _SUBMIT_WINDOW_PER_WORKER * workers
+        
+        output_config = preset.get_output_config()
+        futures: Dict[int, Future] = {}  # Submitted, not yet collected, by queue index
+        next_index = 0
+        
+        # Memory last reported by each worker process; while usage is near
+        # the limit only one image is in flight at a time
+        worker_memory_mb: Dict[int, float] = {}
+        memory_high = False
+        
+        try:
+            # Process each image
+            for index, item in enumerate(self.queue):
+                limit = 1 if memory_high else window
+                while (executor is not None and next_index < len(self.queue)
+                       and next_index - index < limit and not self._cancel_flag.is_set()):
+                    queued = self.queue[next_index]
+                    futures[next_index] = executor.submit(
+                        _process_image_file, queued.source_path, queued.output_path, preset, output_config
+                    )
+                    next_index += 1
+                    
+                # On cancel, images not yet handed to a worker are skipped;
+                # images already being processed are still collected
+                future = futures.pop(index, None)
+                if self._cancel_flag.is_set() and (future is None or future.cancel()):
+                    item.status = ProcessingStatus.SKIPPED
+                    continue
+                    
+                # Update progress
+                self.progress.current_item_index = index
+                self.progress.current_item_name = item.source_path.name
+                self._notify_progress()
                 
-                # Load image
-                if not processor.load_image(item.source_path):
-                    raise Exception("Failed to load image")
+                # Wait for the image
+                item.status = ProcessingStatus.PROCESSING
+                try:
+                    if future is None:
+                        error_message, item.processing_time, _, _ = _process_image_file(
+                            item.source_path, item.output_path, preset, output_config
+                        )
+                    else:
+                        error_message, item.processing_time, worker_pid, memory_mb = future.result()
+                        worker_memory_mb[worker_pid] = memory_mb
+                except Exception as e:
+                    # The worker process died
+                    error_message, item.processing_time = str(e), 0.0
                     
-                # Apply preset
-                if not preset.process(processor):
-                    raise Exception("Failed to apply preset")
+                if error_message is None:
+                    item.status = ProcessingStatus.COMPLETED
+                    self.progress.completed_items += 1
+                    logger.info(f"Processed: {item.source_path.name}")
+                else:
+                    item.status = ProcessingStatus.FAILED
+                    item.error_message = error_message
+                    self.progress.failed_items += 1
+                    logger.error(f"Failed to process {item.source_path.name}: {error_message}")
                     
-                # Save image
-                output_config = preset.get_output_config()
-                if not processor.save_image(item.output_path, output_config):
-                    raise Exception("Failed to save image")
+                # Check memory, including the workers', before submitting more
+                if self.enable_memory_optimization:
+                    memory_high = self._check_memory_usage(sum(worker_memory_mb.values()))
                     
-                item.status = ProcessingStatus.COMPLETED
-                self.progress.completed_items += 1
-                logger.info(f"Processed: {item.source_path.name}")
+                # Update timing
+                processing_times.append(item.processing_time)
                 
-            except Exception as e:
-                item.status = ProcessingStatus.FAILED
-                item.error_message = str(e)
-                self.progress.failed_items += 1
-                logger.error(f"Failed to process {item.source_path.name}: {e}")
+                # Calculate average and estimate remaining time; the remaining
+                # items are shared between the workers
+                self.progress.average_processing_time = sum(processing_times) / len(processing_times)
+                remaining_items = len(self.queue) - index - 1
+                self.progress.estimated_time_remaining = remaining_items * self.progress.average_processing_time / workers
+                self.progress.elapsed_time = time.time() - start_time
                 
-            # Update timing
-            item.processing_time = time.time() - item_start_time
-            processing_times.append(item.processing_time)
-            
-            # Calculate average and estimate remaining time
-            self.progress.average_processing_time = sum(processing_times) / len(processing_times)
-            remaining_items = len(self.queue) - index - 1
-            self.progress.estimated_time_remaining = remaining_items * self.progress.average_processing_time
-            self.progress.elapsed_time = time.time() - start_time
-            
-            # Notify callbacks
-            self._notify_item_complete(item)
-            self._notify_progress()
-            
-            # Periodic garbage collection for memory optimization
-            if self.enable_memory_optimization and (index + 1) % self.images_per_gc == 0:
-                gc.collect()
-                logger.debug(f"Garbage collection performed after {index + 1} images")
+                # Notify callbacks
+                self._notify_item_complete(item)
+                self._notify_progress()
+                
+                # Periodic garbage collection for memory optimization
+                if self.enable_memory_optimization and (index + 1) % self.images_per_gc == 0:
+                    gc.collect()
+                    logger.debug(f"Garbage collection performed after {index + 1} images")
+        finally:
+            # Only the images in the submit window can still be running
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
             
         # Final progress update
         self.progress.elapsed_time = time.time() - start_time
@@ -798,9 +1022,10 @@ class BatchProcessor:
         """
         return [{
             "index": i,
-            "filename": item.source_path.name,
+            "filename": item.filename,
             "path": str(item.source_path),
             "size": item.file_size,
+            "size_text": item.size_text,
             "status": item.status.value,
             "error": item.error_message,
             "alt_text": item.alt_text,
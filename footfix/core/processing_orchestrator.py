@@ -4,6 +4,7 @@ Coordinates batch processing execution, thread management, and result handling.
 """
 
 import logging
+import threading
 from pathlib import Path
 from typing import Optional, Dict, Any, Callable
 from dataclasses import dataclass
@@ -67,8 +68,9 @@ class ProcessingResults:
 class ProcessingThread(QThread):
     """Thread for batch processing images without blocking the UI."""
     
-    # Signals
-    progress_updated = Signal(object)  # BatchProgress
+    # Signals; progress_available is emitted once per take_latest_progress
+    # call, so at most one progress event is queued to the GUI thread
+    progress_available = Signal()
     item_completed = Signal(object)    # BatchItem
     batch_completed = Signal(dict)     # Results dict
     status_message = Signal(str)
@@ -80,6 +82,10 @@ class ProcessingThread(QThread):
         self.config = config
         self._is_cancelled = False
         
+        # Latest progress not yet taken by the orchestrator
+        self._progress_lock = threading.Lock()
+        self._latest_progress: Optional[BatchProgress] = None
+        
     def run(self):
         """Run the batch processing."""
         try:
@@ -126,7 +132,19 @@ class ProcessingThread(QThread):
             
     def _on_progress(self, progress: BatchProgress):
         """Handle progress updates."""
-        self.progress_updated.emit(progress)
+        with self._progress_lock:
+            notify = self._latest_progress is None
+            self._latest_progress = progress
+            
+        # Updates arriving before the last one was taken just replace it
+        if notify:
+            self.progress_available.emit()
+            
+    def take_latest_progress(self) -> Optional[BatchProgress]:
+        """Get the progress reported since the last call, or None if there was none."""
+        with self._progress_lock:
+            progress, self._latest_progress = self._latest_progress, None
+        return progress
         
     def _on_item_complete(self, item: BatchItem):
         """Handle item completion."""
@@ -196,7 +214,7 @@ class ProcessingOrchestrator(QObject):
         self.processing_thread = ProcessingThread(self.batch_processor, config)
         
         # Connect thread signals
-        self.processing_thread.progress_updated.connect(self._on_progress_updated)
+        self.processing_thread.progress_available.connect(self._on_progress_available)
         self.processing_thread.item_completed.connect(self._on_item_completed)
         self.processing_thread.batch_completed.connect(self._on_batch_completed)
         self.processing_thread.status_message.connect(self._on_status_message)
@@ -225,9 +243,11 @@ class ProcessingOrchestrator(QObject):
             
         return False
         
-    def _on_progress_updated(self, progress: BatchProgress):
-        """Handle progress updates from processing thread."""
-        self.progress_updated.emit(progress)
+    def _on_progress_available(self):
+        """Pass on the latest progress from the processing thread."""
+        progress = self.processing_thread.take_latest_progress()
+        if progress is not None:
+            self.progress_updated.emit(progress)
         
     def _on_item_completed(self, item: BatchItem):
         """Handle item completion from processing thread."""
@@ -22,6 +22,10 @@ class ImageProcessor:
     MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB in bytes
     MIN_FILE_SIZE = 1024  # 1KB in bytes
     
+    # Leading bytes of JPEG, PNG and little/big-endian TIFF files
+    FILE_SIGNATURES = (b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n', b'II*\x00', b'MM\x00*')
+    SIGNATURE_LENGTH = 8
+    
     def __init__(self, preferences_manager=None):
         """Initialize the image processor."""
         self.current_image: Optional[Image.Image] = None
@@ -29,6 +33,19 @@ class ImageProcessor:
         self.source_path: Optional[Path] = None
         self.preferences_manager = preferences_manager
         
+    @classmethod
+    def has_supported_signature(cls, header: bytes) -> bool:
+        """
+        Check whether a file's first bytes mark it as a supported image.
+        
+        Args:
+            header: At least SIGNATURE_LENGTH bytes from the start of the file
+            
+        Returns:
+            bool: True if the header matches a supported format
+        """
+        return header.startswith(cls.FILE_SIGNATURES)
+        
     def load_image(self, image_path: str | Path) -> bool:
         """
         Load an image from the specified path.
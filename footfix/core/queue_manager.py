@@ -4,12 +4,14 @@ Handles image queue operations, file validation, and queue state management.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Set
 
 from PySide6.QtCore import QObject, Signal
 
-from .batch_processor import BatchProcessor, BatchItem, ProcessingStatus
+from .batch_processor import BatchProcessor, BatchItem, ProcessingStatus, scan_image_files
+from .processor import ImageProcessor
 from .alt_text_generator import AltTextStatus
 from .tag_manager import TagStatus
 
@@ -32,6 +34,9 @@ class QueueManager(QObject):
     # Supported image formats
     SUPPORTED_FORMATS = {'.jpg', '.jpeg', '.png', '.tiff', '.tif'}
     
+    # Files validated concurrently, so slow disks have several stats in flight
+    VALIDATION_WORKERS = 8
+    
     def __init__(self, batch_processor: BatchProcessor):
         """
         Initialize the queue manager.
@@ -58,29 +63,36 @@ class QueueManager(QObject):
             self.validation_error.emit("Cannot modify queue while processing is active.")
             return 0
             
-        added_count = 0
+        file_paths = list(file_paths)
         invalid_files = []
         duplicate_files = []
+        new_items = []
+        
+        # Validation is all file I/O, so it runs on a thread pool; the results
+        # come back in order and the queue is then updated in one pass
+        validation_results = []
+        if file_paths:
+            with ThreadPoolExecutor(max_workers=min(self.VALIDATION_WORKERS, len(file_paths))) as executor:
+                validation_results = list(executor.map(self._validate_file, file_paths))
+                
+        queued = {item.source_path for item in self.batch_processor.queue}
         
-        for path in file_paths:
-            # Validate file
-            validation_result = self._validate_file(path)
+        for path, validation_result in zip(file_paths, validation_results):
             if not validation_result['valid']:
                 invalid_files.append((path.name, validation_result['error']))
                 continue
                 
             # Check for duplicates
-            if self._is_duplicate(path):
+            if path in queued:
                 duplicate_files.append(path.name)
                 continue
                 
-            # Add to queue
-            if self.batch_processor.add_image(path):
-                added_count += 1
-                logger.debug(f"Added image to queue: {path}")
-            else:
-                invalid_files.append((path.name, "Failed to add to queue"))
-                
+            queued.add(path)
+            new_items.append(BatchItem(source_path=path, file_size=validation_result['file_size']))
+            logger.debug(f"Added image to queue: {path}")
+            
+        added_count = self.batch_processor.add_validated_items(new_items)
+        
         # Report any issues
         if invalid_files:
             error_msg = "Invalid files:\n" + "\n".join(f"• {name}: {error}" for name, error in invalid_files)
@@ -303,7 +315,7 @@ class QueueManager(QObject):
         Returns:
             Dictionary with validation result
         """
-        result = {'valid': False, 'error': None}
+        result = {'valid': False, 'error': None, 'file_size': 0}
         
         # Check if file exists
         if not file_path.exists():
@@ -332,24 +344,22 @@ class QueueManager(QObject):
             result['error'] = f"File too large ({file_size / (1024*1024):.1f}MB > 100MB)"
             return result
             
+        # Check the header matches an image format, without decoding anything
+        try:
+            with open(file_path, 'rb') as f:
+                header = f.read(ImageProcessor.SIGNATURE_LENGTH)
+        except OSError as e:
+            result['error'] = f"Could not read file ({e.strerror})"
+            return result
+            
+        if not ImageProcessor.has_supported_signature(header):
+            result['error'] = "Not a valid image file"
+            return result
+            
         result['valid'] = True
+        result['file_size'] = file_size
         return result
         
-    def _is_duplicate(self, file_path: Path) -> bool:
-        """
-        Check if a file is already in the queue.
-        
-        Args:
-            file_path: Path to check
-            
-        Returns:
-            True if file is already in queue
-        """
-        for item in self.batch_processor.queue:
-            if item.source_path == file_path:
-                return True
-        return False
-        
     def _discover_images(self, folder_path: Path, recursive: bool = False) -> List[Path]:
         """
         Discover image files in a folder.
@@ -364,25 +374,9 @@ class QueueManager(QObject):
         image_files = []
         
         try:
-            if recursive:
-                # Recursive search
-                for ext in self.SUPPORTED_FORMATS:
-                    pattern = f"**/*{ext}"
-                    image_files.extend(folder_path.glob(pattern))
-                    # Also search for uppercase extensions
-                    pattern_upper = f"**/*{ext.upper()}"
-                    image_files.extend(folder_path.glob(pattern_upper))
-            else:
-                # Non-recursive search
-                for ext in self.SUPPORTED_FORMATS:
-                    pattern = f"*{ext}"
-                    image_files.extend(folder_path.glob(pattern))
-                    # Also search for uppercase extensions
-                    pattern_upper = f"*{ext.upper()}"
-                    image_files.extend(folder_path.glob(pattern_upper))
-                    
-            # Remove duplicates and sort
-            image_files = sorted(list(set(image_files)))
+            # One directory walk matching extensions case-insensitively,
+            # rather than a glob pass per extension and case
+            image_files = sorted(map(Path, scan_image_files(str(folder_path), recursive)))
             
             logger.info(f"Discovered {len(image_files)} image files in {folder_path}")
             
@@ -8,14 +8,140 @@ import json
 import time
 import asyncio
 import re
+import sys
+from collections.abc import Collection
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Set, Callable
+from typing import Optional, Dict, Any, List, Set, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
+try:
+    import re2  # Optional DFA-based engine (google-re2)
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
+# Flexible categorization patterns used by organize_tags_semantically,
+# listed in priority order: a tag goes to the first category that matches.
+_CATEGORIZATION_RULES = {
+    'People': [
+        r'\b(?:person|people|man|woman|child|individual|professional|executive|team|group)\b',
+        r'\b(?:sitting|standing|walking|smiling|working|presenting|meeting)\b'
+    ],
+    'Content': [
+        r'\b(?:building|object|food|product|tool|equipment|furniture|vehicle)\b',
+        r'\b(?:document|book|screen|display|artwork|plant|animal)\b'
+    ],
+    'Style': [
+        r'\b(?:modern|contemporary|vintage|classic|elegant|minimalist|artistic|colorful)\b',
+        r'\b(?:black-white|monochrome|vibrant|muted|dramatic|soft|bright)\b'
+    ],
+    'Technical': [
+        r'\b(?:portrait|close-up|wide-shot|macro|aerial|overhead|telephoto)\b',
+        r'\b(?:lighting|natural|artificial|studio|professional|high-resolution)\b'
+    ],
+    'Context': [
+        r'\b(?:office|outdoor|indoor|studio|conference|meeting|restaurant|home)\b',
+        r'\b(?:background|environment|setting|workspace|urban|rural)\b'
+    ],
+    'Mood': [
+        r'\b(?:serious|cheerful|confident|relaxed|dynamic|peaceful|energetic)\b',
+        r'\b(?:contemplative|focused|casual|formal|friendly|professional)\b'
+    ]
+}
+
+# Interned so category lookups on the returned dict hit the identity fast path
+_CAT_NAMES = tuple(sys.intern(name) for name in _CATEGORIZATION_RULES)
+_CONTENT = _CAT_NAMES.index('Content')
+_STYLE = _CAT_NAMES.index('Style')
+
+# Order of the groups returned by organize_tags_semantically, which the tag
+# UI and exports display as is; independent of the matching priority above
+_DISPLAY_ORDER = tuple(
+    _CAT_NAMES.index(name)
+    for name in ('Content', 'People', 'Style', 'Technical', 'Context', 'Mood')
+)
+
+@lru_cache(maxsize=64)
+def _build_category_matcher(cat_names: Tuple[str, ...]) -> Callable[[str], Optional[int]]:
+    """
+    Build a matcher over the rules of the given categories only.
+    
+    Cached per category tuple so TagManager instances sharing a
+    configuration reuse the compiled patterns.
+    
+    Args:
+        cat_names: Category names to match, in priority order
+        
+    Returns:
+        Function mapping a tag to the index in _CAT_NAMES of the first
+        matching category, or None when no rule matches
+    """
+    indices = tuple(_CAT_NAMES.index(name) for name in cat_names)
+    rules = [_CATEGORIZATION_RULES[name] for name in cat_names]
+    
+    if not rules:
+        return lambda tag: None
+    
+    # Fast path for single ASCII word tags: \b can only fall at the ends of
+    # such a tag, so a rule matches it iff one alternative covers the whole
+    # tag. One fullmatch attempt replaces trying the rules at every position;
+    # the capturing group that matched gives the winning category.
+    word_re = re.compile(
+        '|'.join(f"({'|'.join(patterns)})" for patterns in rules),
+        re.IGNORECASE | re.ASCII
+    )
+    fullmatch_word = word_re.fullmatch
+    
+    if re2 is not None:
+        # RE2 has no lookaheads, so each category is one entry of a set that
+        # is matched in a single DFA pass; the lowest hit wins.
+        options = re2.Options()
+        options.case_sensitive = False
+        options.max_mem = 8 << 20
+        
+        category_set = re2.Set.SearchSet(options)
+        for patterns in rules:
+            category_set.Add('|'.join(patterns))
+        category_set.Compile()
+        match_set = category_set.Match
+        
+        def match_category(tag: str) -> Optional[int]:
+            if tag.isascii() and tag.isalnum():
+                m = fullmatch_word(tag)
+                return indices[m.lastindex - 1] if m else None
+            hits = match_set(tag)
+            return indices[min(hits)] if hits else None
+        
+        return match_category
+    
+    # All rules fused into a single pattern anchored at the start of the tag.
+    # Each category is a lookahead branch followed by an empty group, tried in
+    # priority order, so m.lastindex - 1 is the position of the winning
+    # category. IGNORECASE avoids lowercasing every tag and ASCII keeps \b
+    # checks on the cheap ASCII word tables (the vocabulary is ASCII).
+    master_re = re.compile(
+        '|'.join(f"(?=.*?(?:{'|'.join(patterns)}))()" for patterns in rules),
+        re.IGNORECASE | re.ASCII | re.DOTALL
+    )
+    match_master = master_re.match
+    
+    def match_category(tag: str) -> Optional[int]:
+        if tag.isascii() and tag.isalnum():
+            m = fullmatch_word(tag)
+        else:
+            m = match_master(tag)
+        return indices[m.lastindex - 1] if m else None
+    
+    return match_category
+
+
+# Same test as len(tag.split()) > 1 without building a list per tag
+_MULTI_WORD_RE = re.compile(r'\S\s+\S')
+
 
 class TagStatus(Enum):
     """Status of tag assignment."""
@@ -59,7 +185,8 @@ class TagManager:
         self.max_tags_per_image: int = 10
         self.require_tags: bool = False
         
-        # AI tag generation settings
+        # AI tag generation settings (stored in the dict get_ai_status copies)
+        self._ai_status: Dict[str, Any] = {}
         self.ai_generation_enabled: bool = False
         self.ai_confidence_threshold: float = 0.7
         self.ai_max_tags_per_category: int = 3
@@ -72,12 +199,73 @@ class TagManager:
         self.semantic_max_tags: int = 10
         self._semantic_extractor = None
         
+        # Semantic categories matched by organize_tags_semantically; the
+        # setter rebuilds the matcher so unused rules are compiled out
+        self.semantic_categories = _CAT_NAMES
+        
         # Initialize default categories
         self._initialize_default_categories()
         
         # Initialize semantic tag extraction
         self.enable_semantic_extraction(self.semantic_extraction_enabled)
         
+    @property
+    def ai_generation_enabled(self) -> bool:
+        """Whether AI-powered tag generation is enabled."""
+        return self._ai_status["ai_enabled"]
+    
+    @ai_generation_enabled.setter
+    def ai_generation_enabled(self, value: bool):
+        self._ai_status["ai_enabled"] = value
+        
+    @property
+    def ai_confidence_threshold(self) -> float:
+        """Minimum AI confidence required to accept generated tags."""
+        return self._ai_status["confidence_threshold"]
+    
+    @ai_confidence_threshold.setter
+    def ai_confidence_threshold(self, value: float):
+        self._ai_status["confidence_threshold"] = value
+        
+    @property
+    def ai_max_tags_per_category(self) -> int:
+        """Maximum number of AI tags kept per category."""
+        return self._ai_status["max_tags_per_category"]
+    
+    @ai_max_tags_per_category.setter
+    def ai_max_tags_per_category(self, value: int):
+        self._ai_status["max_tags_per_category"] = value
+        
+    @property
+    def fallback_to_patterns(self) -> bool:
+        """Whether to fall back to filename patterns when AI fails."""
+        return self._ai_status["fallback_enabled"]
+    
+    @fallback_to_patterns.setter
+    def fallback_to_patterns(self, value: bool):
+        self._ai_status["fallback_enabled"] = value
+        
+    @property
+    def semantic_categories(self) -> Tuple[str, ...]:
+        """Semantic categories used by organize_tags_semantically, in priority order."""
+        return self._semantic_categories
+    
+    @semantic_categories.setter
+    def semantic_categories(self, names):
+        # A bare string would be matched by substring ("Mood" in "Moods")
+        if isinstance(names, (str, bytes)) or not isinstance(names, Collection):
+            raise TypeError(
+                f"semantic_categories must be a collection of category names, not {type(names).__name__}"
+            )
+        # Normalize to the known names in priority order; unknown names are ignored
+        names = set(names)
+        self._semantic_categories = tuple(name for name in _CAT_NAMES if name in names)
+        self._rebuild_patterns()
+    
+    def _rebuild_patterns(self):
+        """Recompile the category matcher for the enabled semantic categories."""
+        self._match_category = _build_category_matcher(self._semantic_categories)
+    
     def _initialize_default_categories(self):
         """Initialize default tag categories for editorial workflows."""
         default_categories = [
@@ -316,7 +504,8 @@ class TagManager:
             },
             'auto_suggest': self.auto_suggest,
             'max_tags_per_image': self.max_tags_per_image,
-            'require_tags': self.require_tags
+            'require_tags': self.require_tags,
+            'semantic_categories': list(self.semantic_categories)
         }
     
     def set_config(self, config: Dict[str, Any]) -> bool:
@@ -354,6 +543,7 @@ class TagManager:
             self.semantic_extraction_enabled = config.get('semantic_extraction_enabled', True)
             self.semantic_confidence_threshold = config.get('semantic_confidence_threshold', 0.4)
             self.semantic_max_tags = config.get('semantic_max_tags', 10)
+            self.semantic_categories = config.get('semantic_categories', _CAT_NAMES)
             
             logger.info("Tag manager configuration updated")
             return True
@@ -722,63 +912,23 @@ class TagManager:
         Returns:
             Dictionary mapping semantic groups to tag lists
         """
-        organization = {
-            'Content': [],      # What's in the image
-            'People': [],       # Human subjects
-            'Style': [],        # Visual and aesthetic qualities
-            'Technical': [],    # Photography and technical aspects
-            'Context': [],      # Setting and environment
-            'Mood': []          # Emotional and atmospheric qualities
-        }
-        
-        # Define flexible categorization patterns
-        categorization_rules = {
-            'People': [
-                r'\b(?:person|people|man|woman|child|individual|professional|executive|team|group)\b',
-                r'\b(?:sitting|standing|walking|smiling|working|presenting|meeting)\b'
-            ],
-            'Content': [
-                r'\b(?:building|object|food|product|tool|equipment|furniture|vehicle)\b',
-                r'\b(?:document|book|screen|display|artwork|plant|animal)\b'
-            ],
-            'Style': [
-                r'\b(?:modern|contemporary|vintage|classic|elegant|minimalist|artistic|colorful)\b',
-                r'\b(?:black-white|monochrome|vibrant|muted|dramatic|soft|bright)\b'
-            ],
-            'Technical': [
-                r'\b(?:portrait|close-up|wide-shot|macro|aerial|overhead|telephoto)\b',
-                r'\b(?:lighting|natural|artificial|studio|professional|high-resolution)\b'
-            ],
-            'Context': [
-                r'\b(?:office|outdoor|indoor|studio|conference|meeting|restaurant|home)\b',
-                r'\b(?:background|environment|setting|workspace|urban|rural)\b'
-            ],
-            'Mood': [
-                r'\b(?:serious|cheerful|confident|relaxed|dynamic|peaceful|energetic)\b',
-                r'\b(?:contemplative|focused|casual|formal|friendly|professional)\b'
-            ]
-        }
+        buckets = [[] for _ in _CAT_NAMES]
+        match_category = self._match_category
+        is_multi_word = _MULTI_WORD_RE.search
         
         # Organize tags based on patterns
         for tag in tags:
-            tag_lower = tag.lower()
-            categorized = False
-            
-            for category, patterns in categorization_rules.items():
-                if any(re.search(pattern, tag_lower) for pattern in patterns):
-                    organization[category].append(tag)
-                    categorized = True
-                    break
-            
+            index = match_category(tag)
+            if index is not None:
+                buckets[index].append(tag)
             # If not categorized by patterns, use simple heuristics
-            if not categorized:
-                if len(tag.split()) > 1:  # Multi-word tags often describe style or context
-                    organization['Style'].append(tag)
-                else:  # Single words often describe content
-                    organization['Content'].append(tag)
+            elif is_multi_word(tag):  # Multi-word tags often describe style or context
+                buckets[_STYLE].append(tag)
+            else:  # Single words often describe content
+                buckets[_CONTENT].append(tag)
         
         # Remove empty categories
-        return {category: tags for category, tags in organization.items() if tags}
+        return {_CAT_NAMES[index]: buckets[index] for index in _DISPLAY_ORDER if buckets[index]}
     
     def get_ai_status(self) -> Dict[str, Any]:
         """
@@ -787,12 +937,7 @@ class TagManager:
         Returns:
             Dictionary with AI status information
         """
-        status = {
-            "ai_enabled": self.ai_generation_enabled,
-            "confidence_threshold": self.ai_confidence_threshold,
-            "max_tags_per_category": self.ai_max_tags_per_category,
-            "fallback_enabled": self.fallback_to_patterns
-        }
+        status = self._ai_status.copy()
         
         if self._ai_tag_generator:
             status.update(self._ai_tag_generator.get_rate_limit_status())
@@ -1,7 +1,26 @@
 """GUI components for FootFix application."""
 
-from .main_window import MainWindow
-from .batch_widget import BatchProcessingWidget
-from .alt_text_widget import AltTextWidget
+from importlib import import_module
 
-__all__ = ['MainWindow', 'BatchProcessingWidget', 'AltTextWidget']
\ No newline at end of file
+__all__ = ['MainWindow', 'BatchProcessingWidget', 'AltTextWidget']
+
+# Widgets are imported on first attribute access so that importing a
+# submodule (e.g. footfix.gui.components) doesn't pull in every window.
+_LAZY_IMPORTS = {
+    'MainWindow': 'main_window',
+    'BatchProcessingWidget': 'batch_widget',
+    'AltTextWidget': 'alt_text_widget',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -3,29 +3,188 @@ Alt text review and editing widget for FootFix.
 Provides an interface for reviewing and editing generated alt text descriptions.
 """
 
+import hashlib
 import logging
+import os
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple, Callable
 from datetime import datetime
 
+import numpy as np
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
-    QTableWidgetItem, QTextEdit, QPushButton, QLabel,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, 
+    QTextEdit, QPushButton, QLabel,
     QHeaderView, QGroupBox, QCheckBox, QMessageBox,
     QProgressBar, QSplitter, QAbstractItemView, QMenu,
-    QFileDialog
+    QFileDialog, QStyledItemDelegate, QStyleOptionButton,
+    QStyle, QApplication
+)
+from PySide6.QtCore import (
+    Qt, Signal, QTimer, QStandardPaths, QAbstractTableModel,
+    QModelIndex, QEvent, QRect, QSize, QObject, QRunnable, QThreadPool
+)
+from PySide6.QtGui import (
+    QPixmap, QImage, QImageReader, QPainter, QTextCharFormat, QColor, QBrush, QAction,
+    QStaticText
 )
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QPixmap, QTextCharFormat, QColor, QAction
 
 from ..core.batch_processor import BatchItem, ProcessingStatus
 from ..core.alt_text_generator import AltTextStatus
 from ..utils.preferences import PreferencesManager
 from ..utils.alt_text_exporter import AltTextExporter, ExportFormat, ExportOptions
 from ..utils.notifications import NotificationManager
+from ..utils.file_manager import reveal_in_file_manager
 
 logger = logging.getLogger(__name__)
 
+THUMBNAIL_SIZE = 80  # Edge length of the square thumbnail slot in pixels
+PREVIEW_LENGTH = 50  # Alt text characters shown in the review table
+
+# Status text, table brush and label stylesheet, built once at import so
+# the table can hand out the same brush for every row
+_STATUS_TABLE: Dict[AltTextStatus, Tuple[str, QBrush, str]] = {
+    AltTextStatus.COMPLETED: ("✓ Generated", QBrush(QColor(0, 128, 0)), "color: green;"),
+    AltTextStatus.GENERATING: ("⟳ Generating...", QBrush(QColor(0, 0, 255)), "color: blue;"),
+    AltTextStatus.ERROR: ("✗ Error", QBrush(QColor(255, 0, 0)), "color: red;"),
+    AltTextStatus.PENDING: ("⏳ Pending", QBrush(QColor(255, 165, 0)), "color: orange;"),
+}
+
+# Compact integer code for each status, used by the table model's arrays
+_STATUS_CODES: Dict[AltTextStatus, int] = {status: code for code, status in enumerate(AltTextStatus)}
+
+
+@lru_cache(maxsize=4096)
+def _preview(alt_text: str) -> str:
+    """Truncate alt text for the table; data() asks again on every repaint."""
+    return alt_text if len(alt_text) <= PREVIEW_LENGTH else alt_text[:PREVIEW_LENGTH] + "…"
+
+
+def _thumbnail_cache_dir() -> Path:
+    """Directory holding pre-scaled thumbnails shared across sessions."""
+    cache_root = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+    return Path(cache_root) / "footfix" / "thumbs"
+
+
+def _get_cached_thumbnail(image_path: Path, size: int = THUMBNAIL_SIZE) -> QImage:
+    """
+    Get a thumbnail for an image, decoding the full image only on a cache miss.
+    Safe to call from worker threads.
+    
+    Args:
+        image_path: Path to the source image
+        size: Longest side of the thumbnail in pixels
+        
+    Returns:
+        Thumbnail image, null if the image could not be decoded
+    """
+    return _load_thumbnail(str(image_path), image_path.stat().st_mtime_ns, size)
+
+
+@lru_cache(maxsize=512)
+def _load_thumbnail(path: str, mtime_ns: int, size: int) -> QImage:
+    """Load a thumbnail from the disk cache, creating the cache entry if needed."""
+    key = f"{path}:{mtime_ns}:{size}".encode()
+    cache_file = _thumbnail_cache_dir() / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.png"
+    
+    if cache_file.exists():
+        image = QImage(str(cache_file))
+        if not image.isNull():
+            return image
+    
+    # Let the decoder scale while reading (DCT scaling for JPEG) instead of
+    # decoding the full-resolution image and shrinking it afterwards
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    image_size = reader.size()
+    if image_size.isValid():
+        reader.setScaledSize(image_size.scaled(size, size, Qt.KeepAspectRatio))
+        
+    image = reader.read()
+    if image.isNull():
+        return image
+    
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        if not image.save(str(cache_file), "PNG"):
+            logger.warning(f"Failed to write thumbnail cache file: {cache_file}")
+    except OSError as e:
+        logger.warning(f"Failed to create thumbnail cache directory: {e}")
+        
+    return image
+
+
+_thumbnail_pool: Optional[QThreadPool] = None
+
+
+def _get_thumbnail_pool() -> QThreadPool:
+    """Get the bounded thread pool used for thumbnail decoding."""
+    global _thumbnail_pool
+    if _thumbnail_pool is None:
+        _thumbnail_pool = QThreadPool()
+        _thumbnail_pool.setMaxThreadCount(min(8, os.cpu_count() or 1))
+    return _thumbnail_pool
+
+
+def _set_style_state(widget: QWidget, state: str):
+    """
+    Switch a widget between stylesheet states selected by its "state" property.
+    Only the widget itself is repolished, and only when the state changes.
+    """
+    if widget.property("state") == state:
+        return
+    widget.setProperty("state", state)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+class ThumbnailWorkerSignals(QObject):
+    """Carries a finished thumbnail back to the thread that queued the worker."""
+    
+    done = Signal(str, QImage)  # image path, thumbnail (null on failure)
+
+
+class ThumbnailWorker(QRunnable):
+    """Decodes a thumbnail on a pool thread and hands the image back to the GUI."""
+    
+    def __init__(self, image_path: Path, size: int = THUMBNAIL_SIZE):
+        super().__init__()
+        self.image_path = image_path
+        self.size = size
+        self.signals = ThumbnailWorkerSignals()
+        
+    def run(self):
+        try:
+            image = _get_cached_thumbnail(self.image_path, self.size)
+        except Exception as e:
+            logger.error(f"Failed to load thumbnail: {e}")
+            image = QImage()
+        self.signals.done.emit(str(self.image_path), image)
+
+
+class ExportWorkerSignals(QObject):
+    """Reports whether an export succeeded, with the message to show."""
+    
+    finished = Signal(bool, str)  # success, message
+
+
+class ExportWorker(QRunnable):
+    """Runs an exporter call on a pool thread so file I/O doesn't block the GUI."""
+    
+    def __init__(self, export_fn: Callable[[], Tuple[bool, str]]):
+        super().__init__()
+        self.export_fn = export_fn
+        self.signals = ExportWorkerSignals()
+        
+    def run(self):
+        try:
+            success, message = self.export_fn()
+        except Exception as e:
+            logger.error(f"Export failed: {e}")
+            success, message = False, f"Export failed: {str(e)}"
+        self.signals.finished.emit(success, message)
+
 
 class AltTextEditWidget(QTextEdit):
     """Custom text edit widget with character count and validation."""
@@ -36,89 +195,494 @@ class AltTextEditWidget(QTextEdit):
         super().__init__(parent)
         self.char_limit = 125  # Recommended alt text character limit
         self.warning_threshold = 100  # Show warning color when approaching limit
+        self._last_emitted = None
+        
+        # Background states are switched via the "state" property
+        self.setStyleSheet(
+            'QTextEdit[state="warning"] { background-color: #fff7ee; }'
+            'QTextEdit[state="error"] { background-color: #ffeeee; }'
+        )
+        self.setProperty("state", "ok")
+        
+        # Coalesce validation signals while the user is typing
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self._do_validate)
         
         self.textChanged.connect(self._on_text_changed)
         self.setMaximumHeight(80)
         self.setPlaceholderText("Enter alt text description...")
         
     def _on_text_changed(self):
-        """Handle text changes and apply validation."""
-        text = self.toPlainText()
-        char_count = len(text)
+        """Handle text changes: restyle if needed and schedule validation."""
+        # characterCount() includes the final paragraph separator
+        self._apply_style(self.document().characterCount() - 1)
+        self._debounce.start()
         
-        # Apply text formatting based on character count
+    def _apply_style(self, char_count: int):
+        """Apply text formatting based on character count, only when it changes."""
         if char_count > self.char_limit:
-            self.setStyleSheet("QTextEdit { background-color: #ffeeee; }")
-            is_valid = False
+            state = "error"
         elif char_count > self.warning_threshold:
-            self.setStyleSheet("QTextEdit { background-color: #fff7ee; }")
-            is_valid = True
+            state = "warning"
         else:
-            self.setStyleSheet("")
-            is_valid = True
+            state = "ok"
             
+        _set_style_state(self, state)
+        
+    def _do_validate(self):
+        """Validate the current text and emit the result if it changed."""
+        text = self.toPlainText()
+        is_valid = len(text) <= self.char_limit
+        
+        if (text, is_valid) == self._last_emitted:
+            return
+        self._last_emitted = (text, is_valid)
+        
         self.text_changed_with_validation.emit(text, is_valid)
         
+    def flush_validation(self):
+        """Run any pending validation immediately."""
+        if self._debounce.isActive():
+            self._debounce.stop()
+            self._do_validate()
+            
+    def focusOutEvent(self, event):
+        """Deliver pending edits before focus moves elsewhere."""
+        self.flush_validation()
+        super().focusOutEvent(event)
+        
     def set_text_with_validation(self, text: str):
         """Set text and trigger validation."""
         self.setPlainText(text)
+        self.flush_validation()
         
 
-class AltTextActionsWidget(QWidget):
-    """Simple actions widget for table cell use."""
+class AltTextTableModel(QAbstractTableModel):
+    """Table model exposing batch items to the alt text review table."""
     
-    regenerate_requested = Signal(str)  # filename
-    edit_requested = Signal(str)  # filename
+    HEADERS = ["Select", "Filename", "Status", "Alt Text", "Actions"]
+    SELECT_COLUMN, FILENAME_COLUMN, STATUS_COLUMN, ALT_TEXT_COLUMN, ACTIONS_COLUMN = range(5)
     
-    def __init__(self, batch_item: BatchItem, parent=None):
+    # Roles that can change when an item's status or alt text changes
+    ROW_ROLES = [Qt.DisplayRole, Qt.EditRole, Qt.ForegroundRole, Qt.CheckStateRole]
+    
+    alt_text_edited = Signal(str, str)  # filename, new_alt_text
+    check_state_changed = Signal()
+    
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.batch_item = batch_item
-        self.setup_ui()
-        self.update_buttons()
+        self._items: List[BatchItem] = []
+        self._checked_rows: Set[int] = set()
+        
+        # Per-column arrays precomputed in set_items
+        self._names: List[str] = []
+        self._status_codes = np.zeros(0, dtype=np.int8)
+        self._processed = np.zeros(0, dtype=bool)
+        self._alt_texts: List[Optional[str]] = []
+        
+    def set_items(self, items: List[BatchItem]):
+        """Show items, updating only the rows that differ from the last call.
+        
+        Rows are matched by item identity: the unchanged head and tail of the
+        list keep their rows and checked state, the rows between them are
+        removed and inserted, and kept rows whose status or alt text changed
+        since they were last shown are reported through dataChanged.
+        """
+        old_items = self._items
+        limit = min(len(old_items), len(items))
+        head = 0
+        while head < limit and old_items[head] is items[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and old_items[-1 - tail] is items[-1 - tail]:
+            tail += 1
+            
+        old_end = len(old_items) - tail
+        new_end = len(items) - tail
+        checked_count = len(self._checked_rows)
+        
+        if old_end > head:
+            removed = old_end - head
+            self.beginRemoveRows(QModelIndex(), head, old_end - 1)
+            del self._items[head:old_end]
+            del self._names[head:old_end]
+            self._checked_rows = {
+                row if row < head else row - removed
+                for row in self._checked_rows if row < head or row >= old_end
+            }
+            self.endRemoveRows()
+            
+        if new_end > head:
+            inserted = new_end - head
+            self.beginInsertRows(QModelIndex(), head, new_end - 1)
+            self._items[head:head] = items[head:new_end]
+            self._names[head:head] = [item.source_path.name for item in items[head:new_end]]
+            self._checked_rows = {
+                row if row < head else row + inserted for row in self._checked_rows
+            }
+            self.endInsertRows()
+            
+        # Compare kept rows against what they showed last time
+        status_codes = np.fromiter(
+            (_STATUS_CODES[item.alt_text_status] for item in items),
+            dtype=np.int8, count=len(items)
+        )
+        processed = np.fromiter(
+            (item.status == ProcessingStatus.COMPLETED for item in items),
+            dtype=bool, count=len(items)
+        )
+        alt_texts = [item.alt_text for item in items]
+        
+        kept_old = np.r_[0:head, old_end:old_end + tail]
+        kept_new = np.r_[0:head, new_end:new_end + tail]
+        changed = (
+            (self._status_codes[kept_old] != status_codes[kept_new])
+            | (self._processed[kept_old] != processed[kept_new])
+            | np.fromiter(
+                (self._alt_texts[old] != alt_texts[new]
+                 for old, new in zip(kept_old.tolist(), kept_new.tolist())),
+                dtype=bool, count=len(kept_new)
+            )
+        )
         
-    def setup_ui(self):
-        """Set up the simple actions UI."""
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(5, 2, 5, 2)
-        layout.setSpacing(5)
+        self._status_codes = status_codes
+        self._processed = processed
+        self._alt_texts = alt_texts
+        
+        # One dataChanged per run of consecutive changed rows
+        changed_rows = kept_new[changed]
+        last_column = len(self.HEADERS) - 1
+        for run in np.split(changed_rows, np.flatnonzero(np.diff(changed_rows) != 1) + 1):
+            if run.size:
+                self.dataChanged.emit(
+                    self.index(int(run[0]), 0), self.index(int(run[-1]), last_column),
+                    self.ROW_ROLES
+                )
+                
+        if len(self._checked_rows) != checked_count:
+            self.check_state_changed.emit()
+            
+    def refresh_rows(self, rows: List[int]):
+        """Re-read the given rows from their items after they changed in place."""
+        last_column = len(self.HEADERS) - 1
+        for row in rows:
+            item = self._items[row]
+            self._status_codes[row] = _STATUS_CODES[item.alt_text_status]
+            self._processed[row] = item.status == ProcessingStatus.COMPLETED
+            self._alt_texts[row] = item.alt_text
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, last_column), self.ROW_ROLES
+            )
+            
+    def item_at(self, row: int) -> BatchItem:
+        """Get the batch item shown in a row."""
+        return self._items[row]
+        
+    @property
+    def names(self) -> List[str]:
+        """Filenames of the displayed items, by row."""
+        return self._names
+        
+    def status_counts(self) -> Dict[AltTextStatus, int]:
+        """Number of rows in each alt text status as of the last set_items."""
+        counts = np.bincount(self._status_codes, minlength=len(_STATUS_CODES))
+        return dict(zip(_STATUS_CODES, counts.tolist()))
+        
+    def processed_rows(self) -> np.ndarray:
+        """Indices of rows whose image has been processed."""
+        return np.flatnonzero(self._processed)
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+        
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+        
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+            
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        
+        # Only processed items can be checked or edited
+        if self._items[index.row()].status == ProcessingStatus.COMPLETED:
+            if index.column() == self.SELECT_COLUMN:
+                flags |= Qt.ItemIsUserCheckable
+            elif index.column() == self.ALT_TEXT_COLUMN:
+                flags |= Qt.ItemIsEditable
+                
+        return flags
         
-        # Regenerate button
-        self.regenerate_btn = QPushButton("Regenerate")
-        self.regenerate_btn.setFixedSize(80, 24)
-        self.regenerate_btn.setToolTip("Generate new alt text for this image")
-        self.regenerate_btn.clicked.connect(self._on_regenerate_clicked)
-        layout.addWidget(self.regenerate_btn)
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        item = self._items[index.row()]
+        
+        # Only show items that have been processed
+        if item.status != ProcessingStatus.COMPLETED:
+            return None
+            
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == self.FILENAME_COLUMN:
+                return self._names[index.row()]
+            if column == self.STATUS_COLUMN:
+                return self._status_entry(item)[0]
+            if column == self.ALT_TEXT_COLUMN:
+                return _preview(item.alt_text or "")
+        elif role == Qt.EditRole and column == self.ALT_TEXT_COLUMN:
+            return item.alt_text or ""
+        elif role == Qt.ForegroundRole and column == self.STATUS_COLUMN:
+            return self._status_entry(item)[1]
+        elif role == Qt.CheckStateRole and column == self.SELECT_COLUMN:
+            return Qt.Checked if index.row() in self._checked_rows else Qt.Unchecked
+            
+        return None
+        
+    @staticmethod
+    def _status_entry(item: BatchItem) -> Tuple[str, QBrush, str]:
+        """Get the status table entry for an item, showing unknown states as pending."""
+        return _STATUS_TABLE.get(item.alt_text_status, _STATUS_TABLE[AltTextStatus.PENDING])
+        
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        if not index.isValid() or not (self.flags(index) & (Qt.ItemIsUserCheckable | Qt.ItemIsEditable)):
+            return False
+            
+        row = index.row()
+        
+        if role == Qt.CheckStateRole and index.column() == self.SELECT_COLUMN:
+            if Qt.CheckState(value) == Qt.Checked:
+                self._checked_rows.add(row)
+            else:
+                self._checked_rows.discard(row)
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            self.check_state_changed.emit()
+            return True
+            
+        if role == Qt.EditRole and index.column() == self.ALT_TEXT_COLUMN:
+            item = self._items[row]
+            item.alt_text = value
+            self._alt_texts[row] = value
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+            self.alt_text_edited.emit(self._names[row], value)
+            return True
+            
+        return False
         
-        # Edit button  
-        self.edit_btn = QPushButton("Edit")
-        self.edit_btn.setFixedSize(50, 24)
-        self.edit_btn.setToolTip("Edit alt text in detail panel")
-        self.edit_btn.clicked.connect(self._on_edit_clicked)
-        layout.addWidget(self.edit_btn)
+    def set_all_checked(self, checked: bool):
+        """Check or uncheck every processed item at once."""
+        if not self._items:
+            return
+            
+        if checked:
+            self._checked_rows = set(self.processed_rows().tolist())
+        else:
+            self._checked_rows = set()
+        self.dataChanged.emit(
+            self.index(0, self.SELECT_COLUMN),
+            self.index(len(self._items) - 1, self.SELECT_COLUMN),
+            [Qt.CheckStateRole]
+        )
+        self.check_state_changed.emit()
+        
+    def checked_count(self) -> int:
+        """Get the number of checked items."""
+        return len(self._checked_rows)
         
-        layout.addStretch()
+    def checked_filenames(self) -> List[str]:
+        """Get filenames of all checked items in display order."""
+        return [self._names[row] for row in sorted(self._checked_rows)]
         
-    def update_buttons(self):
-        """Update button states based on item status."""
-        can_regenerate = self.batch_item.alt_text_status in [
+    def row_for_filename(self, filename: str) -> int:
+        """Get the first row showing a file, or -1 if it is not displayed."""
+        try:
+            return self._names.index(filename)
+        except ValueError:
+            return -1
+
+
+class AltTextItemDelegate(QStyledItemDelegate):
+    """
+    Delegate for the alt text review table.
+    Paints the per-row action buttons instead of embedding widgets in every
+    row, and opens an alt text editor only when a cell is edited.
+    """
+    
+    regenerate_requested = Signal(str)  # filename
+    edit_requested = Signal(str)  # filename
+    
+    ROW_HEIGHT = 30
+    
+    def sizeHint(self, option, index):
+        return QSize(super().sizeHint(option, index).width(), self.ROW_HEIGHT)
+        
+    def _button_rects(self, rect: QRect):
+        """Get the regenerate and edit button rectangles inside a cell."""
+        top = rect.top() + (rect.height() - 24) // 2
+        regenerate_rect = QRect(rect.left() + 5, top, 80, 24)
+        edit_rect = QRect(regenerate_rect.right() + 6, top, 50, 24)
+        return regenerate_rect, edit_rect
+        
+    def _button_states(self, item: BatchItem):
+        """Get whether the regenerate and edit buttons are enabled."""
+        can_regenerate = item.alt_text_status in [
             AltTextStatus.COMPLETED, AltTextStatus.ERROR
         ]
-        self.regenerate_btn.setEnabled(can_regenerate)
-        
         # Edit button is always enabled for completed processing
-        self.edit_btn.setEnabled(
-            self.batch_item.status == ProcessingStatus.COMPLETED
-        )
+        can_edit = item.status == ProcessingStatus.COMPLETED
+        return can_regenerate, can_edit
         
-    def _on_regenerate_clicked(self):
-        """Handle regenerate button click."""
-        self.regenerate_requested.emit(self.batch_item.source_path.name)
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        
+        if index.column() != AltTextTableModel.ACTIONS_COLUMN:
+            return
+            
+        item = index.model().item_at(index.row())
+        if item.status != ProcessingStatus.COMPLETED:
+            return
+            
+        style = option.widget.style() if option.widget else QApplication.style()
+        rects = self._button_rects(option.rect)
+        
+        for rect, text, enabled in zip(rects, ("Regenerate", "Edit"), self._button_states(item)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = text
+            button.state = QStyle.State_Raised
+            if enabled:
+                button.state |= QStyle.State_Enabled
+            style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+            
+    def editorEvent(self, event, model, option, index):
+        if (index.column() == AltTextTableModel.ACTIONS_COLUMN
+                and event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton):
+            item = model.item_at(index.row())
+            if item.status == ProcessingStatus.COMPLETED:
+                pos = event.position().toPoint()
+                regenerate_rect, edit_rect = self._button_rects(option.rect)
+                can_regenerate, can_edit = self._button_states(item)
+                
+                if can_regenerate and regenerate_rect.contains(pos):
+                    self.regenerate_requested.emit(item.source_path.name)
+                    return True
+                if can_edit and edit_rect.contains(pos):
+                    self.edit_requested.emit(item.source_path.name)
+                    return True
+                    
+        return super().editorEvent(event, model, option, index)
         
-    def _on_edit_clicked(self):
-        """Handle edit button click."""
-        self.edit_requested.emit(self.batch_item.source_path.name)
+    def createEditor(self, parent, option, index):
+        if index.column() == AltTextTableModel.ALT_TEXT_COLUMN:
+            return AltTextEditWidget(parent)
+        return super().createEditor(parent, option, index)
+        
+    def setEditorData(self, editor, index):
+        if isinstance(editor, AltTextEditWidget):
+            editor.set_text_with_validation(index.data(Qt.EditRole))
+        else:
+            super().setEditorData(editor, index)
+            
+    def setModelData(self, editor, model, index):
+        if isinstance(editor, AltTextEditWidget):
+            model.setData(index, editor.toPlainText(), Qt.EditRole)
+        else:
+            super().setModelData(editor, model, index)
 
 
+class StatusStripWidget(QWidget):
+    """
+    Overview strip with one pixel per batch item colored by alt text status.
+    The image is stretched to the widget size when painted, so a status
+    change costs one setPixel instead of restyling a table row.
+    """
+    
+    EMPTY_COLOR = QColor("#dddddd").rgb()  # Items that have not been processed
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._image = QImage()
+        self.setFixedHeight(12)
+        self.setToolTip("Alt text status of each image in the batch")
+        
+    def set_items(self, items: List[BatchItem]):
+        """Rebuild the strip for a new list of items."""
+        self._image = QImage(max(len(items), 1), 1, QImage.Format_RGB32)
+        self._image.fill(self.EMPTY_COLOR)
+        for index, item in enumerate(items):
+            self.set_item_status(index, item)
+        self.update()
+        
+    def set_item_status(self, index: int, item: BatchItem):
+        """Recolor the pixel of one item; repaints are coalesced by Qt."""
+        if item.status == ProcessingStatus.COMPLETED:
+            color = AltTextTableModel._status_entry(item)[1].color().rgb()
+        else:
+            color = self.EMPTY_COLOR
+        self._image.setPixel(index, 0, color)
+        self.update()
+        
+    def paintEvent(self, event):
+        if self._image.isNull():
+            return
+        painter = QPainter(self)
+        painter.drawImage(self.rect(), self._image)
+        
+
+class GuidelinesView(QWidget):
+    """
+    Read-only wrapped text painted from a QStaticText, which keeps its glyph
+    layout cached between paints instead of relaying out like a QLabel.
+    """
+    
+    PADDING = 5
+    TEXT_COLOR = QColor("#666")
+    
+    def __init__(self, text: str, parent=None):
+        super().__init__(parent)
+        self._static_text = QStaticText(text.replace("\n", "<br>"))
+        self._static_text.setTextFormat(Qt.RichText)
+        
+        size_policy = self.sizePolicy()
+        size_policy.setHeightForWidth(True)
+        self.setSizePolicy(size_policy)
+        
+    def _text_height(self, width: int) -> int:
+        """Height of the text wrapped to the given widget width."""
+        static_text = QStaticText(self._static_text)
+        static_text.setTextWidth(max(width - 2 * self.PADDING, 1))
+        return int(static_text.size().height()) + 2 * self.PADDING
+        
+    def hasHeightForWidth(self) -> bool:
+        return True
+        
+    def heightForWidth(self, width: int) -> int:
+        return self._text_height(width)
+        
+    def sizeHint(self) -> QSize:
+        width = max(self.width(), 400)
+        return QSize(width, self._text_height(width))
+        
+    def resizeEvent(self, event):
+        self._static_text.setTextWidth(max(self.width() - 2 * self.PADDING, 1))
+        super().resizeEvent(event)
+        
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setPen(self.TEXT_COLOR)
+        painter.drawStaticText(self.PADDING, self.PADDING, self._static_text)
+        
+
 class AltTextItemWidget(QWidget):
     """Widget for displaying and editing a single alt text item."""
     
@@ -136,9 +700,16 @@ class AltTextItemWidget(QWidget):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         
+        # Character count colors are switched via the label's "state" property
+        self.setStyleSheet("""
+            QLabel#charCountLabel { color: #666; font-size: 11px; }
+            QLabel#charCountLabel[state="warning"] { color: orange; }
+            QLabel#charCountLabel[state="error"] { color: red; }
+        """)
+        
         # Thumbnail
         self.thumbnail_label = QLabel()
-        self.thumbnail_label.setFixedSize(80, 80)
+        self.thumbnail_label.setFixedSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE)
         self.thumbnail_label.setScaledContents(True)
         self.thumbnail_label.setStyleSheet("""
             QLabel {
@@ -174,7 +745,8 @@ class AltTextItemWidget(QWidget):
         actions_layout = QHBoxLayout()
         
         self.char_count_label = QLabel("0/125 characters")
-        self.char_count_label.setStyleSheet("color: #666; font-size: 11px;")
+        self.char_count_label.setObjectName("charCountLabel")
+        self.char_count_label.setProperty("state", "ok")
         actions_layout.addWidget(self.char_count_label)
         
         actions_layout.addStretch()
@@ -192,21 +764,19 @@ class AltTextItemWidget(QWidget):
         self._load_thumbnail()
         
     def _load_thumbnail(self):
-        """Load and display image thumbnail."""
-        try:
-            # Use output path if available, otherwise source path
-            image_path = self.batch_item.output_path or self.batch_item.source_path
-            if image_path.exists():
-                pixmap = QPixmap(str(image_path))
-                if not pixmap.isNull():
-                    scaled = pixmap.scaled(
-                        80, 80,
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation
-                    )
-                    self.thumbnail_label.setPixmap(scaled)
-        except Exception as e:
-            logger.error(f"Failed to load thumbnail: {e}")
+        """Start loading the image thumbnail in the background."""
+        # Use output path if available, otherwise source path
+        image_path = self.batch_item.output_path or self.batch_item.source_path
+        if image_path.exists():
+            # The empty framed label serves as the placeholder until it arrives
+            worker = ThumbnailWorker(image_path)
+            worker.signals.done.connect(self._on_thumbnail_loaded)
+            _get_thumbnail_pool().start(worker)
+            
+    def _on_thumbnail_loaded(self, image_path: str, image: QImage):
+        """Display a thumbnail decoded by a ThumbnailWorker."""
+        if not image.isNull():
+            self.thumbnail_label.setPixmap(QPixmap.fromImage(image))
             
     def update_display(self):
         """Update the display based on current batch item state."""
@@ -215,21 +785,11 @@ class AltTextItemWidget(QWidget):
             self.alt_text_edit.set_text_with_validation(self.batch_item.alt_text)
             
         # Update status
-        status_text = ""
-        status_style = ""
-        
-        if self.batch_item.alt_text_status == AltTextStatus.COMPLETED:
-            status_text = "✓ Generated"
-            status_style = "color: green;"
-        elif self.batch_item.alt_text_status == AltTextStatus.GENERATING:
-            status_text = "⟳ Generating..."
-            status_style = "color: blue;"
-        elif self.batch_item.alt_text_status == AltTextStatus.ERROR:
-            status_text = f"✗ Error: {self.batch_item.alt_text_error or 'Unknown'}"
-            status_style = "color: red;"
-        elif self.batch_item.alt_text_status == AltTextStatus.PENDING:
-            status_text = "⏳ Pending"
-            status_style = "color: orange;"
+        status_text, _, status_style = _STATUS_TABLE.get(
+            self.batch_item.alt_text_status, ("", None, "")
+        )
+        if self.batch_item.alt_text_status == AltTextStatus.ERROR:
+            status_text = f"{status_text}: {self.batch_item.alt_text_error or 'Unknown'}"
             
         self.status_label.setText(status_text)
         self.status_label.setStyleSheet(status_style)
@@ -245,11 +805,11 @@ class AltTextItemWidget(QWidget):
         self.char_count_label.setText(f"{char_count}/125 characters")
         
         if char_count > 125:
-            self.char_count_label.setStyleSheet("color: red; font-size: 11px;")
+            _set_style_state(self.char_count_label, "error")
         elif char_count > 100:
-            self.char_count_label.setStyleSheet("color: orange; font-size: 11px;")
+            _set_style_state(self.char_count_label, "warning")
         else:
-            self.char_count_label.setStyleSheet("color: #666; font-size: 11px;")
+            _set_style_state(self.char_count_label, "ok")
             
         # Update batch item
         self.batch_item.alt_text = text
@@ -268,14 +828,45 @@ class AltTextWidget(QWidget):
     regenerate_requested = Signal(list)  # List of filenames to regenerate
     alt_text_updated = Signal(dict)  # Dict of filename: alt_text pairs
     
+    GUIDELINES_TEXT = (
+        "• Keep descriptions concise (under 125 characters recommended)\n"
+        "• Describe the content and context, not just objects\n"
+        "• Include relevant details like emotions, actions, or settings\n"
+        "• Avoid phrases like 'image of' or 'picture of'\n"
+        "• Consider the editorial context when writing descriptions"
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.batch_items: List[BatchItem] = []
-        self.item_widgets: Dict[str, AltTextItemWidget] = {}
+        self.item_widgets: Dict[str, AltTextItemWidget] = {}  # Created on demand
+        self._items_by_name: Dict[str, BatchItem] = {}
         self.prefs_manager = PreferencesManager.get_instance()
         self.exporter = AltTextExporter()
         self.notification_manager = NotificationManager()
         
+        # Per-item edits are coalesced and emitted once per event loop turn
+        self._pending_updates: Dict[str, str] = {}
+        self._flush_scheduled = False
+        
+        self._export_finished_handler: Optional[Callable[[bool, str], None]] = None
+        
+        # Progress redraws are throttled to about 30 per second; the latest
+        # update within an interval is applied when it ends
+        self._progress_pending: Optional[Tuple[int, int, str]] = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+        # Item regenerate clicks within a short window are confirmed together;
+        # a dict keeps them ordered without duplicates
+        self._pending_regenerate: Dict[str, None] = {}
+        self._regenerate_timer = QTimer(self)
+        self._regenerate_timer.setSingleShot(True)
+        self._regenerate_timer.setInterval(200)
+        self._regenerate_timer.timeout.connect(self._confirm_pending_regenerate)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -329,35 +920,38 @@ class AltTextWidget(QWidget):
         
         layout.addLayout(header_layout)
         
-        # Guidelines
-        guidelines_group = QGroupBox("Alt Text Best Practices")
-        guidelines_layout = QVBoxLayout()
-        
-        guidelines_text = (
-            "• Keep descriptions concise (under 125 characters recommended)\n"
-            "• Describe the content and context, not just objects\n"
-            "• Include relevant details like emotions, actions, or settings\n"
-            "• Avoid phrases like 'image of' or 'picture of'\n"
-            "• Consider the editorial context when writing descriptions"
-        )
-        
-        guidelines_label = QLabel(guidelines_text)
-        guidelines_label.setWordWrap(True)
-        guidelines_label.setStyleSheet("color: #666; padding: 5px;")
-        guidelines_layout.addWidget(guidelines_label)
+        # Guidelines are created once there are items to review
+        self.guidelines_group = None
         
-        guidelines_group.setLayout(guidelines_layout)
-        layout.addWidget(guidelines_group)
+        # Status overview strip, one pixel per item
+        self.status_strip = StatusStripWidget()
+        self.status_strip.setVisible(False)
+        layout.addWidget(self.status_strip)
         
         # Splitter for items and details
         splitter = QSplitter(Qt.Vertical)
         
-        # Items table
-        self.items_table = QTableWidget()
-        self.items_table.setColumnCount(5)
-        self.items_table.setHorizontalHeaderLabels([
-            "Select", "Filename", "Status", "Alt Text", "Actions"
-        ])
+        # Items table, painted by a delegate rather than per-row widgets
+        self.table_model = AltTextTableModel(self)
+        self.table_model.alt_text_edited.connect(self._on_item_alt_text_updated)
+        self.table_model.check_state_changed.connect(self._update_selected_button_state)
+        
+        self.items_table = QTableView()
+        self.items_table.setModel(self.table_model)
+        
+        self.item_delegate = AltTextItemDelegate(self.items_table)
+        self.item_delegate.regenerate_requested.connect(self._on_item_regenerate_requested)
+        self.item_delegate.edit_requested.connect(self._on_item_edit_requested)
+        self.items_table.setItemDelegate(self.item_delegate)
+        
+        # Uniform fixed rows let the view place rows without measuring them,
+        # so only the visible rows are ever asked for data
+        vertical_header = self.items_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(AltTextItemDelegate.ROW_HEIGHT)
+        self.items_table.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed
+        )
         
         # Configure column sizing for better readability
         header = self.items_table.horizontalHeader()
@@ -371,7 +965,7 @@ class AltTextWidget(QWidget):
         self.items_table.setColumnWidth(0, 60)   # Select checkbox
         self.items_table.setColumnWidth(4, 140)  # Actions buttons
         self.items_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.items_table.itemSelectionChanged.connect(self._on_selection_changed)
+        self.items_table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         
         splitter.addWidget(self.items_table)
         
@@ -406,10 +1000,26 @@ class AltTextWidget(QWidget):
         progress_group.setLayout(progress_layout)
         layout.addWidget(progress_group)
         
+    def _show_guidelines(self, visible: bool):
+        """Show or hide the guidelines, creating them on first use."""
+        if self.guidelines_group is None:
+            if not visible:
+                return
+            self.guidelines_group = QGroupBox("Alt Text Best Practices")
+            guidelines_layout = QVBoxLayout()
+            guidelines_layout.addWidget(GuidelinesView(self.GUIDELINES_TEXT))
+            self.guidelines_group.setLayout(guidelines_layout)
+            
+            # Below the header row
+            self.layout().insertWidget(1, self.guidelines_group)
+            
+        self.guidelines_group.setVisible(visible)
+        
     def set_batch_items(self, items: List[BatchItem]):
         """Set the batch items to display."""
         self.batch_items = items
         self.item_widgets.clear()
+        self._show_guidelines(bool(items))
         self.refresh_display()
         
     def refresh_display(self):
@@ -417,23 +1027,48 @@ class AltTextWidget(QWidget):
         # Hide any current details
         self._hide_item_details()
         
-        # Clear table
-        self.items_table.setRowCount(0)
+        # Populate table; this also precomputes the per-row arrays
+        self.table_model.set_items(self.batch_items)
+        self._update_selected_button_state()
+        self._update_status_summary()
+        
+        self.status_strip.set_items(self.batch_items)
+        self.status_strip.setVisible(bool(self.batch_items))
         
-        # Count statistics
+        # Detail widgets are built when an item is first shown; only
+        # processed items get one
+        self.item_widgets.clear()
+        names = self.table_model.names
+        self._items_by_name = {
+            names[row]: self.batch_items[row]
+            for row in self.table_model.processed_rows().tolist()
+        }
+        
+    def update_items(self, rows: List[int]):
+        """Show changes to items already on display, given by their row.
+        
+        Used while a batch is running so the review table fills in as items
+        complete, instead of being repopulated once at the end.
+        """
+        self.table_model.refresh_rows(rows)
+        self._update_status_summary()
+        
+        names = self.table_model.names
+        for row in rows:
+            item = self.batch_items[row]
+            self.status_strip.set_item_status(row, item)
+            # Drop stale detail widgets; they are rebuilt on next display
+            self.item_widgets.pop(names[row], None)
+            if item.status == ProcessingStatus.COMPLETED:
+                self._items_by_name[names[row]] = item
+                
+    def _update_status_summary(self):
+        """Update the status line and buttons from the model's counts."""
         total_items = len(self.batch_items)
-        completed_items = sum(
-            1 for item in self.batch_items 
-            if item.alt_text_status == AltTextStatus.COMPLETED
-        )
-        pending_items = sum(
-            1 for item in self.batch_items
-            if item.alt_text_status == AltTextStatus.PENDING
-        )
-        error_items = sum(
-            1 for item in self.batch_items
-            if item.alt_text_status == AltTextStatus.ERROR
-        )
+        status_counts = self.table_model.status_counts()
+        completed_items = status_counts[AltTextStatus.COMPLETED]
+        pending_items = status_counts[AltTextStatus.PENDING]
+        error_items = status_counts[AltTextStatus.ERROR]
         
         # Update status
         status_parts = [f"{total_items} items"]
@@ -446,87 +1081,28 @@ class AltTextWidget(QWidget):
             
         self.status_label.setText(" | ".join(status_parts))
         
-        # Populate table
-        self.items_table.setRowCount(total_items)
-        
-        for row, item in enumerate(self.batch_items):
-            # Only show items that have been processed
-            if item.status != ProcessingStatus.COMPLETED:
-                continue
-                
-            # Checkbox
-            checkbox = QCheckBox()
-            checkbox.setProperty("filename", item.source_path.name)
-            self.items_table.setCellWidget(row, 0, checkbox)
-            
-            # Filename
-            self.items_table.setItem(row, 1, QTableWidgetItem(item.source_path.name))
-            
-            # Status
-            status_item = QTableWidgetItem()
-            if item.alt_text_status == AltTextStatus.COMPLETED:
-                status_item.setText("✓ Generated")
-                status_item.setForeground(QColor("green"))
-            elif item.alt_text_status == AltTextStatus.GENERATING:
-                status_item.setText("⟳ Generating...")
-                status_item.setForeground(QColor("blue"))
-            elif item.alt_text_status == AltTextStatus.ERROR:
-                status_item.setText("✗ Error")
-                status_item.setForeground(QColor("red"))
-            else:
-                status_item.setText("⏳ Pending")
-                status_item.setForeground(QColor("orange"))
-                
-            self.items_table.setItem(row, 2, status_item)
-            
-            # Alt text preview
-            alt_text_preview = item.alt_text or ""
-            if len(alt_text_preview) > 50:
-                alt_text_preview = alt_text_preview[:50] + "..."
-            self.items_table.setItem(row, 3, QTableWidgetItem(alt_text_preview))
-            
-            # Create simple actions widget for table cell
-            actions_widget = AltTextActionsWidget(item)
-            actions_widget.regenerate_requested.connect(self._on_item_regenerate_requested)
-            actions_widget.edit_requested.connect(self._on_item_edit_requested)
-            self.items_table.setCellWidget(row, 4, actions_widget)
-            
-            # Create detailed item widget for details panel
-            item_widget = AltTextItemWidget(item)
-            item_widget.alt_text_updated.connect(self._on_item_alt_text_updated)
-            item_widget.regenerate_requested.connect(self._on_item_regenerate_requested)
-            self.item_widgets[item.source_path.name] = item_widget
-            
         # Enable/disable buttons
         self.approve_all_btn.setEnabled(total_items > 0)
         self.export_btn.setEnabled(total_items > 0)
         
     def _on_select_all_toggled(self, checked: bool):
         """Handle select all checkbox toggle."""
-        for row in range(self.items_table.rowCount()):
-            checkbox = self.items_table.cellWidget(row, 0)
-            if checkbox and isinstance(checkbox, QCheckBox):
-                checkbox.setChecked(checked)
-                
-        self._on_selection_changed()
+        self.table_model.set_all_checked(checked)
         
-    def _on_selection_changed(self):
-        """Handle table selection changes."""
-        selected_count = 0
+    def _update_selected_button_state(self):
+        """Update the regenerate button from the number of checked items."""
+        selected_count = self.table_model.checked_count()
         
-        for row in range(self.items_table.rowCount()):
-            checkbox = self.items_table.cellWidget(row, 0)
-            if checkbox and isinstance(checkbox, QCheckBox) and checkbox.isChecked():
-                selected_count += 1
-                
         self.regenerate_selected_btn.setEnabled(selected_count > 0)
         self.regenerate_selected_btn.setText(
             f"Regenerate Selected ({selected_count})" if selected_count > 0 
             else "Regenerate Selected"
         )
         
+    def _on_selection_changed(self):
+        """Handle table selection changes."""
         # Update details panel with selected row
-        current_row = self.items_table.currentRow()
+        current_row = self.items_table.currentIndex().row()
         if current_row >= 0 and current_row < len(self.batch_items):
             item = self.batch_items[current_row]
             self._show_item_details(item.source_path.name)
@@ -538,9 +1114,9 @@ class AltTextWidget(QWidget):
         # Collect all alt text updates
         updates = {}
         
-        for item in self.batch_items:
+        for name, item in zip(self.table_model.names, self.batch_items):
             if item.alt_text:
-                updates[item.source_path.name] = item.alt_text
+                updates[name] = item.alt_text
                 
         if updates:
             self.alt_text_updated.emit(updates)
@@ -552,15 +1128,8 @@ class AltTextWidget(QWidget):
             
     def _on_regenerate_selected_clicked(self):
         """Handle regenerate selected button click."""
-        selected_files = []
-        
-        for row in range(self.items_table.rowCount()):
-            checkbox = self.items_table.cellWidget(row, 0)
-            if checkbox and isinstance(checkbox, QCheckBox) and checkbox.isChecked():
-                filename = checkbox.property("filename")
-                if filename:
-                    selected_files.append(filename)
-                    
+        selected_files = self.table_model.checked_filenames()
+        
         if selected_files:
             reply = QMessageBox.question(
                 self,
@@ -574,40 +1143,69 @@ class AltTextWidget(QWidget):
                 
     def _on_item_alt_text_updated(self, filename: str, alt_text: str):
         """Handle individual item alt text update."""
-        updates = {filename: alt_text}
-        self.alt_text_updated.emit(updates)
+        self._pending_updates[filename] = alt_text
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_updates)
+            
+    def _flush_updates(self):
+        """Emit all alt text edits collected since the last flush."""
+        updates = self._pending_updates
+        self._pending_updates = {}
+        self._flush_scheduled = False
+        
+        if updates:
+            self.alt_text_updated.emit(updates)
         
     def _on_item_regenerate_requested(self, filename: str):
         """Handle individual item regenerate request."""
+        # Requests made in quick succession share one confirmation
+        self._pending_regenerate[filename] = None
+        self._regenerate_timer.start()
+        
+    def _confirm_pending_regenerate(self):
+        """Ask once about every item regenerate requested since the last prompt."""
+        filenames = list(self._pending_regenerate)
+        self._pending_regenerate = {}
+        if not filenames:
+            return
+            
+        target = filenames[0] if len(filenames) == 1 else f"{len(filenames)} images"
         reply = QMessageBox.question(
             self,
             "Regenerate Alt Text",
-            f"Regenerate alt text for {filename}?",
+            f"Regenerate alt text for {target}?",
             QMessageBox.Yes | QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
-            self.regenerate_requested.emit([filename])
+            self.regenerate_requested.emit(filenames)
             
     def _on_item_edit_requested(self, filename: str):
         """Handle edit request from actions widget."""
         # Find the item in the table and select it to show details
-        for row in range(self.items_table.rowCount()):
-            item_name = self.items_table.item(row, 1)
-            if item_name and item_name.text() == filename:
-                self.items_table.selectRow(row)
-                self._show_item_details(filename)
-                break
-                
+        row = self.table_model.row_for_filename(filename)
+        if row >= 0:
+            self.items_table.selectRow(row)
+            self._show_item_details(filename)
+            
+    def _get_item_widget(self, filename: str) -> Optional[AltTextItemWidget]:
+        """Get the detail widget for an item, creating it on first use."""
+        item_widget = self.item_widgets.get(filename)
+        if item_widget is None and filename in self._items_by_name:
+            item_widget = AltTextItemWidget(self._items_by_name[filename])
+            item_widget.alt_text_updated.connect(self._on_item_alt_text_updated)
+            item_widget.regenerate_requested.connect(self._on_item_regenerate_requested)
+            self.item_widgets[filename] = item_widget
+        return item_widget
+        
     def _show_item_details(self, filename: str):
         """Show detailed editing interface for an item."""
-        if filename in self.item_widgets:
+        detail_widget = self._get_item_widget(filename)
+        if detail_widget is not None:
             # Remove current detail widget if any
             self._hide_item_details()
             
-            # Get the detailed widget
-            detail_widget = self.item_widgets[filename]
-            
             # Add to details layout
             self.details_layout.addWidget(detail_widget)
             self.current_detail_widget = detail_widget
@@ -627,6 +1225,19 @@ class AltTextWidget(QWidget):
             
     def update_progress(self, current: int, total: int, message: str = ""):
         """Update progress display."""
+        self._progress_pending = (current, total, message)
+        if not self._progress_timer.isActive():
+            self._flush_progress()
+            
+    def _flush_progress(self):
+        """Show the latest progress update and hold off the next redraw."""
+        if self._progress_pending is None:
+            return
+            
+        current, total, message = self._progress_pending
+        self._progress_pending = None
+        self._progress_timer.start()
+        
         if total > 0:
             self.progress_bar.setVisible(True)
             self.progress_bar.setMaximum(total)
@@ -712,16 +1323,36 @@ class AltTextWidget(QWidget):
             QMessageBox.critical(self, "Invalid Path", msg)
             return
             
-        # Perform export
+        # Perform export off the GUI thread
         if format == ExportFormat.CSV:
-            success, message = self.exporter.export_csv(
-                self.batch_items, output_path, options, selected_items
-            )
+            export_fn = self.exporter.export_csv
         else:  # JSON
-            success, message = self.exporter.export_json(
-                self.batch_items, output_path, options, selected_items
-            )
+            export_fn = self.exporter.export_json
             
+        self._start_export(
+            partial(export_fn, list(self.batch_items), output_path, options, selected_items),
+            partial(self._on_export_finished, output_path)
+        )
+        
+    def _start_export(self, export_fn: Callable[[], Tuple[bool, str]], on_finished: Callable[[bool, str], None]):
+        """Run an export function on the thread pool and report back on the GUI thread."""
+        # Only one export runs at a time since the export button is disabled
+        self._export_finished_handler = on_finished
+        worker = ExportWorker(export_fn)
+        worker.signals.finished.connect(self._on_export_worker_finished)
+        self.export_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+        
+    def _on_export_worker_finished(self, success: bool, message: str):
+        """Dispatch an export result to the handler given to _start_export."""
+        handler, self._export_finished_handler = self._export_finished_handler, None
+        if handler:
+            handler(success, message)
+        
+    def _on_export_finished(self, output_path: Path, success: bool, message: str):
+        """Handle completion of a CSV or JSON export."""
+        self.export_btn.setEnabled(bool(self.batch_items))
+        
         # Show result
         if success:
             QMessageBox.information(self, "Export Complete", message)
@@ -741,8 +1372,7 @@ class AltTextWidget(QWidget):
             )
             
             if reply == QMessageBox.Yes:
-                import subprocess
-                subprocess.run(["open", "-R", str(output_path)])
+                reveal_in_file_manager(output_path)
         else:
             QMessageBox.critical(self, "Export Failed", message)
             
@@ -781,11 +1411,16 @@ class AltTextWidget(QWidget):
             
         output_path = Path(output_path)
         
-        # Perform export
-        success, message = self.exporter.export_for_cms(
-            self.batch_items, output_path, "wordpress"
+        # Perform export off the GUI thread
+        self._start_export(
+            partial(self.exporter.export_for_cms, list(self.batch_items), output_path, "wordpress"),
+            partial(self._on_export_cms_finished, output_path)
         )
         
+    def _on_export_cms_finished(self, output_path: Path, success: bool, message: str):
+        """Handle completion of a CMS export."""
+        self.export_btn.setEnabled(bool(self.batch_items))
+        
         # Show result
         if success:
             QMessageBox.information(
@@ -796,20 +1431,10 @@ class AltTextWidget(QWidget):
             )
             
             # Open folder
-            import subprocess
-            subprocess.run(["open", "-R", str(output_path)])
+            reveal_in_file_manager(output_path)
         else:
             QMessageBox.critical(self, "Export Failed", message)
             
     def _get_selected_filenames(self) -> List[str]:
         """Get list of selected filenames from the table."""
-        selected_files = []
-        
-        for row in range(self.items_table.rowCount()):
-            checkbox = self.items_table.cellWidget(row, 0)
-            if checkbox and isinstance(checkbox, QCheckBox) and checkbox.isChecked():
-                filename = checkbox.property("filename")
-                if filename:
-                    selected_files.append(filename)
-                    
-        return selected_files
\ No newline at end of file
+        return self.table_model.checked_filenames()
\ No newline at end of file
@@ -4,75 +4,186 @@ Provides queue management and batch processing controls.
 """
 
 import logging
+import os
+import threading
+from functools import partial
 from pathlib import Path
-from typing import Optional, List
+from queue import Queue
+from typing import Optional, List, Dict, Set
 from datetime import timedelta
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QTableWidget, QTableWidgetItem, QHeaderView,
+    QTableView, QHeaderView, QAbstractItemView,
     QProgressBar, QLabel, QFileDialog, QMessageBox,
-    QTabWidget, QCheckBox
+    QTabWidget, QCheckBox, QApplication,
+    QStyledItemDelegate, QStyleOptionButton, QStyle
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import (
+    Qt, QThread, Signal, QTimer, QAbstractTableModel, QModelIndex,
+    QEvent, QRect, QThreadPool
+)
+from PySide6.QtGui import QIcon, QBrush
 
 from ..core.batch_processor import BatchProcessor, BatchItem, BatchProgress, ProcessingStatus
 from ..core.alt_text_generator import AltTextStatus
 from ..core.tag_manager import TagStatus
 from ..utils.notifications import NotificationManager
 from ..utils.preferences import PreferencesManager
-from ..utils.alt_text_exporter import AltTextExporter, ExportFormat, ExportOptions
-from .alt_text_widget import AltTextWidget
+from ..utils.alt_text_exporter import AltTextExporter, ExportFormat
+from ..utils.file_manager import reveal_in_file_manager
+from .alt_text_widget import AltTextWidget, ExportWorker
 
 logger = logging.getLogger(__name__)
 
+# Foreground color of the status cell; other statuses use the default
+_STATUS_COLORS = {
+    'completed': QBrush(Qt.green),
+    'failed': QBrush(Qt.red),
+    'processing': QBrush(Qt.blue),
+}
+
+# Preference keys that decide whether alt text can be enabled; resetting a
+# category reports the bare category name
+_ALT_TEXT_AVAILABILITY_KEYS = frozenset({'alt_text', 'alt_text.api_key', 'alt_text.enabled'})
+
+# Stylesheets for the large control buttons
+_PREVIEW_BTN_QSS = """
+    QPushButton {
+        font-size: 16px;
+    }
+    QPushButton:enabled {
+        background-color: #28a745;
+        color: white;
+    }
+"""
+
+_PROCESS_BTN_QSS = """
+    QPushButton {
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton:enabled {
+        background-color: #007AFF;
+        color: white;
+    }
+"""
+
+# Default export location, resolved once rather than per export
+_DOWNLOADS_DIR = Path.home() / "Downloads"
+
+
+def _prefetch_file(path: Path):
+    """Ask the OS to start reading a file into the page cache before it is loaded."""
+    try:
+        with open(path, 'rb') as f:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError as e:
+        logger.debug(f"Could not prefetch {path}: {e}")
+
+
+def _has_alt_text(item: BatchItem) -> bool:
+    """Whether an item has generated alt text that can be exported."""
+    return item.alt_text_status == AltTextStatus.COMPLETED and bool(item.alt_text)
+
 
 class BatchProcessingThread(QThread):
-    """Thread for batch processing images without blocking the UI."""
+    """
+    Long-lived thread for batch processing images without blocking the UI.
     
-    # Signals
-    progress_updated = Signal(object)  # BatchProgress
-    item_completed = Signal(object)    # BatchItem
+    Batches are queued with submit() and run one at a time, so the thread and
+    its signal connections are set up once rather than per batch.
+    """
+    
+    # Signals; progress is collected with take_latest_progress instead
+    item_completed = Signal(int, str, str)  # row, status, error message
+    time_tick = Signal(float, float)   # elapsed, remaining seconds
     batch_completed = Signal(dict)     # Results dict
-    status_message = Signal(str)
     alt_text_progress = Signal(int, int, str)  # current, total, message
     
-    def __init__(self, batch_processor: BatchProcessor, preset_name: str, output_folder: Path, generate_alt_text: bool = False, enable_tagging: bool = False, enable_ai_tagging: bool = False, filename_template: Optional[str] = None):
-        super().__init__()
+    def __init__(self, batch_processor: BatchProcessor, parent=None):
+        super().__init__(parent)
         self.batch_processor = batch_processor
-        self.preset_name = preset_name
-        self.output_folder = output_folder
-        self.generate_alt_text = generate_alt_text
-        self.enable_tagging = enable_tagging
-        self.enable_ai_tagging = enable_ai_tagging
-        self.filename_template = filename_template
-        self._is_cancelled = False
-        
+        self._jobs: Queue = Queue()  # Job argument tuples; None stops the thread
+        self._cancelled = threading.Event()
+        
+        # Latest progress reported by the processor, collected by the widget's
+        # progress timer rather than queued per callback
+        self._progress_lock = threading.Lock()
+        self._latest_progress: Optional[BatchProgress] = None
+        self._last_emitted_second = -1
+        self._rows_by_path: Dict[Path, int] = {}
+        
+        # The next file a worker will load is read ahead while the current
+        # ones are processed. The kernel does the reading, so this is only
+        # done where posix_fadvise is available (not on macOS)
+        self._prefetch = hasattr(os, 'posix_fadvise')
+        self._prefetched_index = -1
+        
+        # Registered once; the processor calls them on this thread
+        self.batch_processor.register_progress_callback(self._on_progress)
+        self.batch_processor.register_item_complete_callback(self._on_item_complete)
+        
+    def submit(self, preset_name: str, output_folder: Path, generate_alt_text: bool = False, enable_tagging: bool = False, enable_ai_tagging: bool = False, filename_template: Optional[str] = None):
+        """Queue a batch to run once the current one, if any, has finished."""
+        self._cancelled.clear()
+        self._jobs.put((preset_name, output_folder, generate_alt_text, enable_tagging, enable_ai_tagging, filename_template))
+        
+    def stop(self):
+        """Cancel any running batch and end the thread once it has finished."""
+        if self.isRunning():
+            self.cancel()
+            self._jobs.put(None)
+            self.wait()
+            
     def run(self):
-        """Run the batch processing."""
+        """Run queued batches until stopped."""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            self._run_batch(*job)
+            
+    def _run_batch(self, preset_name: str, output_folder: Path, generate_alt_text: bool, enable_tagging: bool, enable_ai_tagging: bool, filename_template: Optional[str]):
+        """Run one batch and report its results."""
+        self._last_emitted_second = -1
+        self._prefetched_index = -1
+        
+        # The processor resets its own cancel flag when a batch starts, so a
+        # cancel that arrived while this batch was still queued is handled here
+        if self._cancelled.is_set():
+            self.batch_completed.emit({
+                "success": True,
+                "total_processed": 0,
+                "successful": 0,
+                "failed": 0,
+                "cancelled": True
+            })
+            return
+            
         try:
-            # Register callbacks
-            self.batch_processor.register_progress_callback(self._on_progress)
-            self.batch_processor.register_item_complete_callback(self._on_item_complete)
+            # Completed items are reported by row; the queue is fixed while processing
+            self._rows_by_path = {
+                item.source_path: row for row, item in enumerate(self.batch_processor.queue)
+            }
             
             # Start processing
-            self.status_message.emit(f"Starting batch processing with {self.preset_name} preset...")
+            logger.info(f"Starting batch processing with {preset_name} preset...")
             
             # Use appropriate processing method based on features enabled
-            if self.generate_alt_text or self.enable_tagging or self.enable_ai_tagging:
+            if generate_alt_text or enable_tagging or enable_ai_tagging:
                 # One or more features enabled - use unified features method
                 results = self.batch_processor.process_batch_with_features(
-                    self.preset_name, 
-                    self.output_folder,
-                    generate_alt_text=self.generate_alt_text,
-                    enable_tagging=self.enable_tagging,
-                    enable_ai_tagging=self.enable_ai_tagging,
-                    filename_template=self.filename_template
+                    preset_name, 
+                    output_folder,
+                    generate_alt_text=generate_alt_text,
+                    enable_tagging=enable_tagging,
+                    enable_ai_tagging=enable_ai_tagging,
+                    filename_template=filename_template
                 )
             else:
                 # No features enabled - standard processing
-                results = self.batch_processor.process_batch(self.preset_name, self.output_folder, self.filename_template)
+                results = self.batch_processor.process_batch(preset_name, output_folder, filename_template)
             
             # Emit completion
             self.batch_completed.emit(results)
@@ -89,18 +200,209 @@ class BatchProcessingThread(QThread):
             
     def _on_progress(self, progress: BatchProgress):
         """Handle progress updates."""
-        self.progress_updated.emit(progress)
+        with self._progress_lock:
+            self._latest_progress = progress
+            
+        # Progress is reported as each item is collected, while the workers
+        # have the items after it; read ahead the one they take next
+        index = progress.current_item_index
+        if self._prefetch and index != self._prefetched_index and not self._cancelled.is_set():
+            self._prefetched_index = index
+            queue = self.batch_processor.queue
+            next_index = index + self.batch_processor.max_workers
+            if 0 <= index and next_index < len(queue):
+                _prefetch_file(queue[next_index].source_path)
+                
+        # Tick at most once per whole second of elapsed time
+        elapsed_second = int(progress.elapsed_time)
+        if elapsed_second != self._last_emitted_second:
+            self._last_emitted_second = elapsed_second
+            self.time_tick.emit(progress.elapsed_time, progress.estimated_time_remaining)
+            
+    def take_latest_progress(self) -> Optional[BatchProgress]:
+        """Get the progress reported since the last call, or None if there was none."""
+        with self._progress_lock:
+            progress, self._latest_progress = self._latest_progress, None
+        return progress
         
     def _on_item_complete(self, item: BatchItem):
         """Handle item completion."""
-        self.item_completed.emit(item)
+        self.item_completed.emit(
+            self._rows_by_path.get(item.source_path, -1),
+            item.status.value,
+            item.error_message or ""
+        )
         
     def cancel(self):
-        """Cancel the batch processing."""
-        self._is_cancelled = True
+        """Cancel the running batch."""
+        self._cancelled.set()
         self.batch_processor.cancel_processing()
 
 
+class BatchIngestThread(QThread):
+    """Thread for validating and queueing selected images or a folder without blocking the UI."""
+    
+    ingest_completed = Signal(int)  # Number of images added
+    
+    def __init__(self, batch_processor: BatchProcessor, paths: List[Path], folder: Optional[Path] = None):
+        super().__init__()
+        self.batch_processor = batch_processor
+        self.paths = paths
+        self.folder = folder  # Scanned for images instead of using paths
+        
+    def run(self):
+        """Add the paths, or the folder's images, to the batch processor's queue."""
+        if self.folder is not None:
+            self.ingest_completed.emit(self.batch_processor.add_folder(self.folder))
+        else:
+            self.ingest_completed.emit(self.batch_processor.add_images_bulk(self.paths))
+
+
+class QueueTableModel(QAbstractTableModel):
+    """Table model exposing the batch queue to the queue table."""
+    
+    HEADERS = ["Filename", "Size", "Status", "Error", "Actions"]
+    FILENAME_COLUMN, SIZE_COLUMN, STATUS_COLUMN, ERROR_COLUMN, ACTIONS_COLUMN = range(5)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: List[BatchItem] = []
+        self._processing = False
+        
+    def set_items(self, items: List[BatchItem]):
+        """Show items, inserting and removing only the rows that differ.
+        
+        Rows are matched by item identity: the unchanged head and tail of the
+        list keep their rows, and the rows between them are replaced.
+        """
+        old_items = self._items
+        limit = min(len(old_items), len(items))
+        head = 0
+        while head < limit and old_items[head] is items[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and old_items[-1 - tail] is items[-1 - tail]:
+            tail += 1
+            
+        old_end = len(old_items) - tail
+        new_end = len(items) - tail
+        
+        if old_end > head:
+            self.beginRemoveRows(QModelIndex(), head, old_end - 1)
+            del self._items[head:old_end]
+            self.endRemoveRows()
+            
+        if new_end > head:
+            self.beginInsertRows(QModelIndex(), head, new_end - 1)
+            self._items[head:head] = items[head:new_end]
+            self.endInsertRows()
+            
+        # Kept items may have changed status; only visible rows are repainted
+        if self._items:
+            self.dataChanged.emit(
+                self.index(0, self.STATUS_COLUMN),
+                self.index(len(self._items) - 1, self.ACTIONS_COLUMN)
+            )
+            
+    def set_processing(self, processing: bool):
+        """Set whether a batch is running, which hides the Remove buttons."""
+        if processing != self._processing:
+            self._processing = processing
+            if self._items:
+                self.dataChanged.emit(
+                    self.index(0, self.ACTIONS_COLUMN),
+                    self.index(len(self._items) - 1, self.ACTIONS_COLUMN)
+                )
+                
+    def refresh_rows(self, rows: List[int]):
+        """Repaint rows whose items changed in place."""
+        for row in rows:
+            self.dataChanged.emit(
+                self.index(row, self.STATUS_COLUMN), self.index(row, self.ACTIONS_COLUMN)
+            )
+            
+    def item_at(self, row: int) -> BatchItem:
+        """Get the batch item shown in a row."""
+        return self._items[row]
+        
+    def is_removable(self, row: int) -> bool:
+        """Only pending items can be removed, and not while a batch runs."""
+        return not self._processing and self._items[row].status == ProcessingStatus.PENDING
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+        
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        item = self._items[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == self.FILENAME_COLUMN:
+                return item.filename
+            if column == self.SIZE_COLUMN:
+                return item.size_text
+            if column == self.STATUS_COLUMN:
+                return item.status.value
+            if column == self.ERROR_COLUMN:
+                return item.error_message or ""
+        elif role == Qt.ForegroundRole and column == self.STATUS_COLUMN:
+            return _STATUS_COLORS.get(item.status.value)
+            
+        return None
+        
+
+class QueueItemDelegate(QStyledItemDelegate):
+    """
+    Delegate for the queue table.
+    Paints the Remove button of pending rows instead of embedding a widget
+    in every row.
+    """
+    
+    remove_requested = Signal(int)  # row
+    
+    ROW_HEIGHT = 22
+    
+    def _button_rect(self, rect: QRect) -> QRect:
+        """Get the Remove button rectangle inside a cell."""
+        return QRect(rect.left() + 5, rect.top() + 2, 70, rect.height() - 4)
+        
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        
+        if (index.column() != QueueTableModel.ACTIONS_COLUMN
+                or not index.model().is_removable(index.row())):
+            return
+            
+        style = option.widget.style() if option.widget else QApplication.style()
+        button = QStyleOptionButton()
+        button.rect = self._button_rect(option.rect)
+        button.text = "Remove"
+        button.state = QStyle.State_Raised | QStyle.State_Enabled
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+        
+    def editorEvent(self, event, model, option, index):
+        if (index.column() == QueueTableModel.ACTIONS_COLUMN
+                and event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and model.is_removable(index.row())
+                and self._button_rect(option.rect).contains(event.position().toPoint())):
+            self.remove_requested.emit(index.row())
+            return True
+            
+        return super().editorEvent(event, model, option, index)
+
+
 class BatchProcessingWidget(QWidget):
     """Widget for managing batch image processing."""
     
@@ -113,19 +415,80 @@ class BatchProcessingWidget(QWidget):
         super().__init__(parent)
         self.batch_processor = BatchProcessor()
         self.processing_thread: Optional[BatchProcessingThread] = None
+        self.ingest_thread: Optional[BatchIngestThread] = None
         self.is_processing = False
         
+        # Queue length as of the last refresh, and the single selected row
+        self._queue_count = 0
+        self._selected_row: Optional[int] = None
+        
+        # Queue items by filename, rebuilt whenever the queue changes
+        self._items_by_name: Dict[str, BatchItem] = {}
+        
+        # Queued items with exportable alt text; recounted after each batch
+        # and adjusted as items are removed or edited
+        self._alt_text_count = 0
+        
+        # Rows with exportable alt text while a batch runs, kept up to date
+        # from completions so the count stays right mid-batch
+        self._alt_text_rows: Set[int] = set()
+        
+        # Whether the running batch generates alt text, in which case the
+        # Alt Text tab is updated as each item completes
+        self._streaming_alt_text = False
+        
+        # Destination of the quick export running on the thread pool
+        self._quick_export_path: Optional[Path] = None
+        
+        # Completions arriving within a short window are repainted together;
+        # the model reads each row's latest status from its item
+        self._pending_completions: Set[int] = set()
+        self._completion_timer = QTimer(self)
+        self._completion_timer.setSingleShot(True)
+        self._completion_timer.setInterval(50)
+        self._completion_timer.timeout.connect(self._flush_completions)
+        
+        # The processing thread keeps only its latest progress; show it at
+        # most ten times a second while a batch runs
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._poll_progress)
+        
         # Initialize notification manager and preferences
         self.notification_manager = NotificationManager()
         self.prefs_manager = PreferencesManager.get_instance()
         
         # Apply memory optimization settings from preferences
-        memory_limit = self.prefs_manager.get('advanced.memory_limit_mb', 2048)
-        self.batch_processor.set_memory_limit(memory_limit)
+        self._load_processing_preferences()
         self.batch_processor.set_memory_optimization(True)
         
+        # Keep the cached preferences current
+        self.prefs_manager.preferences_changed.connect(self.on_preferences_changed)
+        self.prefs_manager.preferences_reloaded.connect(self.on_preferences_reloaded)
+        
         self.setup_ui()
         
+    def _load_processing_preferences(self):
+        """Read the preferences used during and after processing."""
+        self._notify_on_complete = self.prefs_manager.get('processing.completion_notification', True)
+        self._notify_sound = self.prefs_manager.get('processing.completion_sound', True)
+        
+        self._memory_limit = self.prefs_manager.get('advanced.memory_limit_mb', 2048)
+        self.batch_processor.set_memory_limit(self._memory_limit)
+        self.batch_processor.set_max_workers(self.prefs_manager.get('processing.max_concurrent_batch', 3))
+        
+    def on_preferences_changed(self, key: str):
+        """Re-read cached preferences when their category changes."""
+        if key.split('.', 1)[0] in ('processing', 'advanced'):
+            self._load_processing_preferences()
+        elif key in _ALT_TEXT_AVAILABILITY_KEYS:
+            self.refresh_alt_text_availability()
+            
+    def on_preferences_reloaded(self):
+        """Re-read all cached preferences after they were reloaded."""
+        self._load_processing_preferences()
+        self.refresh_alt_text_availability()
+        
     def setup_ui(self):
         """Set up the user interface."""
         layout = QVBoxLayout(self)
@@ -169,13 +532,26 @@ class BatchProcessingWidget(QWidget):
         processing_layout.addLayout(toolbar_layout)
         
         # Image queue table
-        self.queue_table = QTableWidget()
-        self.queue_table.setColumnCount(5)
-        self.queue_table.setHorizontalHeaderLabels(["Filename", "Size", "Status", "Error", "Actions"])
+        # Cells are read from the queue items as they are painted, so only
+        # the visible rows cost anything
+        self.queue_model = QueueTableModel(self)
+        self.queue_delegate = QueueItemDelegate(self)
+        self.queue_delegate.remove_requested.connect(self.remove_item)
+        self.queue_table = QTableView()
+        self.queue_table.setModel(self.queue_model)
+        self.queue_table.setItemDelegate(self.queue_delegate)
+        
+        # Every row has the Remove button's height, so rows are not measured
+        vertical_header = self.queue_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setMinimumSectionSize(QueueItemDelegate.ROW_HEIGHT)
+        vertical_header.setDefaultSectionSize(QueueItemDelegate.ROW_HEIGHT)
+        
         self.queue_table.horizontalHeader().setStretchLastSection(True)
         self.queue_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.queue_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.queue_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.queue_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.queue_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.queue_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         processing_layout.addWidget(self.queue_table)
         
         # Progress section
@@ -215,31 +591,14 @@ class BatchProcessingWidget(QWidget):
         self.preview_btn.clicked.connect(self.preview_selected)
         self.preview_btn.setEnabled(False)
         self.preview_btn.setMinimumHeight(40)
-        self.preview_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 16px;
-            }
-            QPushButton:enabled {
-                background-color: #28a745;
-                color: white;
-            }
-        """)
+        self.preview_btn.setStyleSheet(_PREVIEW_BTN_QSS)
         control_layout.addWidget(self.preview_btn)
         
         self.process_btn = QPushButton("Start Processing")
         self.process_btn.clicked.connect(self.start_processing)
         self.process_btn.setEnabled(False)
         self.process_btn.setMinimumHeight(40)
-        self.process_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:enabled {
-                background-color: #007AFF;
-                color: white;
-            }
-        """)
+        self.process_btn.setStyleSheet(_PROCESS_BTN_QSS)
         control_layout.addWidget(self.process_btn)
         
         self.cancel_btn = QPushButton("Cancel")
@@ -250,10 +609,6 @@ class BatchProcessingWidget(QWidget):
         
         processing_layout.addLayout(control_layout)
         
-        # Timer for UI updates during processing
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_time_display)
-        
         # Alt Text Tab
         self.alt_text_widget = AltTextWidget()
         self.alt_text_widget.alt_text_updated.connect(self.on_alt_text_updated)
@@ -318,14 +673,38 @@ class BatchProcessingWidget(QWidget):
         )
         
         if files:
-            added_count = 0
-            for file_path in files:
-                if self.batch_processor.add_image(Path(file_path)):
-                    added_count += 1
-                    
-            self.refresh_queue_display()
-            if added_count > 0:
-                logger.info(f"Added {added_count} images to queue")
+            self._start_ingest([Path(file_path) for file_path in files])
+            
+    def _start_ingest(self, paths: List[Path], folder: Optional[Path] = None):
+        """Validate and queue images, or a folder's images, on a background thread."""
+        self._set_queue_controls_enabled(False)
+        self.overall_progress_bar.setRange(0, 0)  # Indeterminate while adding
+        
+        self.ingest_thread = BatchIngestThread(self.batch_processor, paths, folder)
+        self.ingest_thread.ingest_completed.connect(self.on_ingest_completed)
+        self.ingest_thread.start()
+        
+    def on_ingest_completed(self, added_count: int):
+        """Handle the end of a background ingest."""
+        self.overall_progress_bar.setRange(0, 100)
+        self._set_queue_controls_enabled(True)
+        
+        self.refresh_queue_display()
+        if added_count > 0:
+            logger.info(f"Added {added_count} images to queue")
+        elif self.ingest_thread.folder is not None:
+            QMessageBox.warning(
+                self,
+                "No Images Found",
+                "No compatible images found in the selected folder."
+            )
+            
+    def _set_queue_controls_enabled(self, enabled: bool):
+        """Enable or disable the buttons that change the queue."""
+        self.add_images_btn.setEnabled(enabled)
+        self.add_folder_btn.setEnabled(enabled)
+        self.clear_queue_btn.setEnabled(enabled)
+        self.process_btn.setEnabled(enabled and self._queue_count > 0)
                 
     def add_folder(self):
         """Open dialog to select a folder containing images."""
@@ -336,17 +715,9 @@ class BatchProcessingWidget(QWidget):
         )
         
         if folder:
-            added_count = self.batch_processor.add_folder(Path(folder))
-            self.refresh_queue_display()
-            if added_count > 0:
-                logger.info(f"Added {added_count} images from folder")
-            else:
-                QMessageBox.warning(
-                    self,
-                    "No Images Found",
-                    "No compatible images found in the selected folder."
-                )
-                
+            # Scanning the folder opens every image, so it runs on the ingest thread
+            self._start_ingest([], folder=Path(folder))
+            
     def clear_queue(self):
         """Clear all images from the queue."""
         if self.is_processing:
@@ -357,16 +728,17 @@ class BatchProcessingWidget(QWidget):
             )
             return
             
-        if self.batch_processor.queue:
+        if self._queue_count:
             reply = QMessageBox.question(
                 self,
                 "Clear Queue",
-                f"Remove all {len(self.batch_processor.queue)} images from queue?",
+                f"Remove all {self._queue_count} images from queue?",
                 QMessageBox.Yes | QMessageBox.No
             )
             
             if reply == QMessageBox.Yes:
                 self.batch_processor.clear_queue()
+                self._alt_text_count = 0
                 self.refresh_queue_display()
                 logger.info("Queue cleared")
                 
@@ -380,71 +752,47 @@ class BatchProcessingWidget(QWidget):
             )
             return
             
+        queue = self.batch_processor.queue
+        removed_alt_text = 0 <= index < len(queue) and _has_alt_text(queue[index])
         if self.batch_processor.remove_image(index):
+            self._alt_text_count -= removed_alt_text
             self.refresh_queue_display()
             
     def refresh_queue_display(self):
-        """Update the queue table display."""
-        queue_info = self.batch_processor.get_queue_info()
-        
-        self.queue_table.setRowCount(len(queue_info))
-        
-        for row, item_info in enumerate(queue_info):
-            # Filename
-            self.queue_table.setItem(row, 0, QTableWidgetItem(item_info['filename']))
-            
-            # Size
-            size_mb = item_info['size'] / (1024 * 1024)
-            self.queue_table.setItem(row, 1, QTableWidgetItem(f"{size_mb:.1f} MB"))
-            
-            # Status
-            status_item = QTableWidgetItem(item_info['status'])
-            if item_info['status'] == 'completed':
-                status_item.setForeground(Qt.green)
-            elif item_info['status'] == 'failed':
-                status_item.setForeground(Qt.red)
-            elif item_info['status'] == 'processing':
-                status_item.setForeground(Qt.blue)
-            self.queue_table.setItem(row, 2, status_item)
-            
-            # Error
-            error_text = item_info['error'] or ""
-            self.queue_table.setItem(row, 3, QTableWidgetItem(error_text))
-            
-            # Remove button
-            if not self.is_processing and item_info['status'] == 'pending':
-                remove_btn = QPushButton("Remove")
-                remove_btn.clicked.connect(lambda checked, idx=row: self.remove_item(idx))
-                self.queue_table.setCellWidget(row, 4, remove_btn)
-            else:
-                self.queue_table.setCellWidget(row, 4, None)
-                
+        """Rebuild the queue table from the batch processor's queue."""
+        # Items are read directly rather than through get_queue_info, which
+        # builds a dict per item on every refresh
+        queue = self.batch_processor.queue
+        queue_count = len(queue)
+        
+        self.queue_model.set_processing(self.is_processing)
+        self.queue_model.set_items(queue)
+        
+        # Alt text updates name their items by filename; the first queued item
+        # with a name wins, as with a scan of the queue
+        self._items_by_name = {item.filename: item for item in reversed(queue)}
+        
         # Update queue count
-        queue_count = len(queue_info)
+        self._queue_count = queue_count
         self.queue_label.setText(f"{queue_count} image{'s' if queue_count != 1 else ''} in queue")
         
         # Enable/disable process button
         self.process_btn.setEnabled(queue_count > 0 and not self.is_processing)
         
-        # Update preview button based on selection
-        selected_rows = self.queue_table.selectionModel().selectedRows()
-        self.preview_btn.setEnabled(len(selected_rows) == 1 and not self.is_processing)
+        # Removed rows shift the selection without always reporting it
+        self.on_selection_changed()
         
         # Emit signal
         self.queue_changed.emit(queue_count)
         
         
         # Show/hide export button based on alt text availability
-        has_alt_text = any(
-            item.alt_text_status == AltTextStatus.COMPLETED and item.alt_text
-            for item in self.batch_processor.queue
-        )
-        self.quick_export_btn.setVisible(has_alt_text)
+        self.quick_export_btn.setVisible(self._alt_text_count > 0)
         
         
     def start_processing(self):
         """Start batch processing with current settings."""
-        if not self.batch_processor.queue:
+        if not self._queue_count:
             return
             
         # Get preset and output folder from parent window
@@ -471,36 +819,59 @@ class BatchProcessingWidget(QWidget):
         self.add_images_btn.setEnabled(False)
         self.add_folder_btn.setEnabled(False)
         self.clear_queue_btn.setEnabled(False)
+        self.refresh_queue_display()
         
         # Reset progress
         self.overall_progress_bar.setValue(0)
         self.current_item_label.setVisible(True)
         
-        # Start timer
-        self.update_timer.start(100)  # Update every 100ms
-        
-        # Create and start processing thread
-        self.processing_thread = BatchProcessingThread(
-            self.batch_processor,
+        # The processing thread is started with the first batch and reused
+        if self.processing_thread is None:
+            self.processing_thread = BatchProcessingThread(self.batch_processor, self)
+            self.processing_thread.item_completed.connect(self.on_item_completed)
+            self.processing_thread.time_tick.connect(self.update_time_display)
+            self.processing_thread.batch_completed.connect(self.on_batch_completed)
+            # The idle thread has to be ended before Qt tears it down
+            QApplication.instance().aboutToQuit.connect(self.shutdown)
+            self.processing_thread.start()
+            
+        self._alt_text_rows = {
+            row for row, item in enumerate(self.batch_processor.queue) if _has_alt_text(item)
+        }
+        
+        # Show the queue in the Alt Text tab now; completed items are then
+        # filled in row by row instead of repopulating it when the batch ends
+        self._streaming_alt_text = self.enable_alt_text_cb.isChecked()
+        if self._streaming_alt_text:
+            self.alt_text_widget.set_batch_items(self.batch_processor.queue)
+            
+        self.processing_thread.submit(
             preset_name,
             output_folder,
-            generate_alt_text=self.enable_alt_text_cb.isChecked()
+            generate_alt_text=self._streaming_alt_text
         )
-        
-        self.processing_thread.progress_updated.connect(self.on_progress_updated)
-        self.processing_thread.item_completed.connect(self.on_item_completed)
-        self.processing_thread.batch_completed.connect(self.on_batch_completed)
-        self.processing_thread.status_message.connect(lambda msg: logger.info(msg))
-        
-        self.processing_thread.start()
+        self._progress_timer.start()
         
     def cancel_processing(self):
         """Cancel the current batch processing."""
-        if self.processing_thread and self.processing_thread.isRunning():
+        if self.processing_thread and self.is_processing:
             self.processing_thread.cancel()
             self.cancel_btn.setEnabled(False)
             self.cancel_btn.setText("Cancelling...")
             
+    def shutdown(self):
+        """Stop the worker threads and wait for them before the widget goes away."""
+        self._progress_timer.stop()
+        if self.processing_thread is not None:
+            self.processing_thread.stop()
+        if self.ingest_thread is not None:
+            self.ingest_thread.wait()
+            
+    def closeEvent(self, event):
+        """Stop the worker threads when the widget is closed."""
+        self.shutdown()
+        super().closeEvent(event)
+        
     def on_progress_updated(self, progress: BatchProgress):
         """Handle progress updates from processing thread."""
         # Update progress bar
@@ -524,18 +895,51 @@ class BatchProcessingWidget(QWidget):
         if progress.current_item_name:
             self.current_item_label.setText(f"Current: {progress.current_item_name}")
             
-    def on_item_completed(self, item: BatchItem):
+    def on_item_completed(self, row: int, status: str, error: str):
         """Handle item completion updates."""
-        self.refresh_queue_display()
+        self._pending_completions.add(row)
+        if not self._completion_timer.isActive():
+            self._completion_timer.start()
+            
+    def _flush_completions(self):
+        """Repaint the rows completed since the last flush."""
+        self._completion_timer.stop()
+        
+        completions = self._pending_completions
+        if not completions:
+            return
+        self._pending_completions = set()
         
+        if not all(0 <= row < self._queue_count for row in completions):
+            self.refresh_queue_display()
+            if self._streaming_alt_text:
+                self.alt_text_widget.set_batch_items(self.batch_processor.queue)
+            return
+            
+        rows = sorted(completions)
+        self.queue_model.refresh_rows(rows)
+        if self._streaming_alt_text:
+            self.alt_text_widget.update_items(rows)
+            
+        queue = self.batch_processor.queue
+        for row in rows:
+            if _has_alt_text(queue[row]):
+                self._alt_text_rows.add(row)
+            else:
+                self._alt_text_rows.discard(row)
+        self._alt_text_count = len(self._alt_text_rows)
+        self.quick_export_btn.setVisible(self._alt_text_count > 0)
+            
     def on_batch_completed(self, results: dict):
         """Handle batch processing completion."""
+        self._flush_completions()
+        self._progress_timer.stop()
+        self._poll_progress()
         self.is_processing = False
-        self.update_timer.stop()
         
         # Update UI
         self.process_btn.setText("Start Processing")
-        self.process_btn.setEnabled(len(self.batch_processor.queue) > 0)
+        self.process_btn.setEnabled(self._queue_count > 0)
         self.cancel_btn.setEnabled(False)
         self.cancel_btn.setText("Cancel")
         self.add_images_btn.setEnabled(True)
@@ -543,17 +947,27 @@ class BatchProcessingWidget(QWidget):
         self.clear_queue_btn.setEnabled(True)
         self.current_item_label.setVisible(False)
         
-        # Update alt text widget with processed items
-        if self.enable_alt_text_cb.isChecked():
-            self.alt_text_widget.set_batch_items(self.batch_processor.queue)
-            
-        # Show results
+        # Skipped items aren't reported individually, and pending items can
+        # be removed again
+        self._alt_text_count = sum(map(_has_alt_text, self.batch_processor.queue))
+        self._alt_text_rows = set()
+        self.refresh_queue_display()
+        
+        # Re-read every row once at the end; items whose alt text failed or
+        # that were skipped never sent a completion
+        if self._streaming_alt_text:
+            self.alt_text_widget.update_items(list(range(len(self.batch_processor.queue))))
+        self._streaming_alt_text = False
+        
+        # A cancelled batch gets a short summary and no notification
         if results.get('cancelled'):
-            message = f"Processing cancelled.\n\n"
-        else:
-            message = f"Batch processing completed.\n\n"
+            self._show_cancel_dialog(results)
+            self.processing_completed.emit(results)
+            return
             
-        message += (
+        # Show results
+        message = (
+            f"Batch processing completed.\n\n"
             f"Total processed: {results.get('total_processed', 0)}\n"
             f"Successful: {results.get('successful', 0)}\n"
             f"Failed: {results.get('failed', 0)}\n"
@@ -567,19 +981,16 @@ class BatchProcessingWidget(QWidget):
                 message += f"\nAlt text failed: {results.get('alt_text_failed', 0)}"
         
         # Show system notification if enabled
-        if self.prefs_manager.get('processing.completion_notification', True):
+        if self._notify_on_complete:
             # Update notification manager settings
-            self.notification_manager.set_sound_enabled(
-                self.prefs_manager.get('processing.completion_sound', True)
-            )
+            self.notification_manager.set_sound_enabled(self._notify_sound)
             
             # Show notification
-            if not results.get('cancelled'):
-                self.notification_manager.show_batch_completion(
-                    successful=results.get('successful', 0),
-                    failed=results.get('failed', 0),
-                    elapsed_time=results.get('elapsed_time', 0)
-                )
+            self.notification_manager.show_batch_completion(
+                successful=results.get('successful', 0),
+                failed=results.get('failed', 0),
+                elapsed_time=results.get('elapsed_time', 0)
+            )
         
         if results.get('success'):
             QMessageBox.information(self, "Processing Complete", message)
@@ -589,22 +1000,42 @@ class BatchProcessingWidget(QWidget):
         # Emit completion signal
         self.processing_completed.emit(results)
         
-    def update_time_display(self):
+    def _show_cancel_dialog(self, results: dict):
+        """Summarize a cancelled batch."""
+        message = (
+            f"Processing cancelled.\n\n"
+            f"Total processed: {results.get('total_processed', 0)}\n"
+            f"Successful: {results.get('successful', 0)}\n"
+            f"Failed: {results.get('failed', 0)}\n"
+            f"Time elapsed: {self._format_time(results.get('elapsed_time', 0))}"
+        )
+        
+        if results.get('success'):
+            QMessageBox.information(self, "Processing Cancelled", message)
+        else:
+            QMessageBox.warning(self, "Processing Cancelled with Errors", message)
+            
+    def update_time_display(self, elapsed: float, remaining: float):
         """Update time display during processing."""
-        if not self.is_processing or not hasattr(self.batch_processor, 'progress'):
+        if not self.is_processing:
             return
             
-        progress = self.batch_processor.progress
-        
         # Update elapsed time
-        self.elapsed_label.setText(f"Elapsed: {self._format_time(progress.elapsed_time)}")
+        self.elapsed_label.setText(f"Elapsed: {self._format_time(elapsed)}")
         
         # Update remaining time
-        if progress.estimated_time_remaining > 0:
-            self.remaining_label.setText(f"Remaining: {self._format_time(progress.estimated_time_remaining)}")
+        if remaining > 0:
+            self.remaining_label.setText(f"Remaining: {self._format_time(remaining)}")
         else:
             self.remaining_label.setText("Remaining: Calculating...")
             
+    def _poll_progress(self):
+        """Show the latest progress reported by the processing thread, if any."""
+        if self.processing_thread is not None:
+            progress = self.processing_thread.take_latest_progress()
+            if progress is not None:
+                self.on_progress_updated(progress)
+                
     def _format_time(self, seconds: float) -> str:
         """Format time in seconds to human-readable string."""
         if seconds < 60:
@@ -615,29 +1046,24 @@ class BatchProcessingWidget(QWidget):
             
     def add_images_to_queue(self, file_paths: List[Path]):
         """Add multiple images to the queue."""
-        added_count = 0
-        for path in file_paths:
-            if self.batch_processor.add_image(path):
-                added_count += 1
-                
+        added_count = self.batch_processor.add_images_bulk(file_paths)
         self.refresh_queue_display()
         return added_count
         
     def on_selection_changed(self):
         """Handle table selection changes."""
-        # Enable/disable preview button based on selection
+        # Remember the selected row when exactly one is selected
         selected_rows = self.queue_table.selectionModel().selectedRows()
-        self.preview_btn.setEnabled(len(selected_rows) == 1 and not self.is_processing)
+        self._selected_row = selected_rows[0].row() if len(selected_rows) == 1 else None
+        
+        # Enable/disable preview button based on selection
+        self.preview_btn.setEnabled(self._selected_row is not None and not self.is_processing)
         
     def preview_selected(self):
         """Preview the selected image with current preset."""
-        selected_rows = self.queue_table.selectionModel().selectedRows()
-        if not selected_rows:
-            return
-            
         # Get the selected item
-        row = selected_rows[0].row()
-        if row >= len(self.batch_processor.queue):
+        row = self._selected_row
+        if row is None or row >= self._queue_count:
             return
             
         batch_item = self.batch_processor.queue[row]
@@ -694,11 +1120,12 @@ class BatchProcessingWidget(QWidget):
         """Handle alt text updates from the widget."""
         # Update batch items with new alt text
         for filename, alt_text in updates.items():
-            for item in self.batch_processor.queue:
-                if item.source_path.name == filename:
-                    item.alt_text = alt_text
-                    break
-                    
+            item = self._items_by_name.get(filename)
+            if item is not None:
+                had_alt_text = _has_alt_text(item)
+                item.alt_text = alt_text
+                self._alt_text_count += _has_alt_text(item) - had_alt_text
+                
         logger.info(f"Updated alt text for {len(updates)} items")
         
     def on_regenerate_requested(self, filenames: list):
@@ -714,12 +1141,12 @@ class BatchProcessingWidget(QWidget):
         # Mark items for regeneration
         items_to_regenerate = []
         for filename in filenames:
-            for item in self.batch_processor.queue:
-                if item.source_path.name == filename:
-                    item.alt_text_status = AltTextStatus.PENDING
-                    items_to_regenerate.append(item)
-                    break
-                    
+            item = self._items_by_name.get(filename)
+            if item is not None:
+                self._alt_text_count -= _has_alt_text(item)
+                item.alt_text_status = AltTextStatus.PENDING
+                items_to_regenerate.append(item)
+                
         if items_to_regenerate:
             # Start regeneration in a separate thread
             # This would need to be implemented similar to batch processing
@@ -727,13 +1154,8 @@ class BatchProcessingWidget(QWidget):
             
     def quick_export_alt_text(self):
         """Quick export alt text results to CSV."""
-        # Check if we have any completed alt text items
-        completed_items = [
-            item for item in self.batch_processor.queue
-            if item.alt_text_status == AltTextStatus.COMPLETED and item.alt_text
-        ]
-        
-        if not completed_items:
+        # The running count of exportable items saves scanning the queue here
+        if not self._alt_text_count:
             QMessageBox.information(
                 self,
                 "No Data to Export",
@@ -749,7 +1171,7 @@ class BatchProcessingWidget(QWidget):
         output_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export Alt Text Results",
-            str(Path.home() / "Downloads" / default_filename),
+            str(_DOWNLOADS_DIR / default_filename),
             "CSV Files (*.csv)"
         )
         
@@ -758,12 +1180,25 @@ class BatchProcessingWidget(QWidget):
             
         output_path = Path(output_path)
         
-        # Export all completed items
-        success, message = exporter.export_csv(
-            self.batch_processor.queue,
-            output_path,
-            ExportOptions.COMPLETED_ONLY
-        )
+        # Export all completed items off the GUI thread. The items are picked
+        # here from a copy of the queue, since an ingest thread may extend the
+        # queue meanwhile; copying a list is a single step under the GIL.
+        items = [
+            item for item in list(self.batch_processor.queue)
+            if item.status == ProcessingStatus.COMPLETED and _has_alt_text(item)
+        ]
+        worker = ExportWorker(partial(exporter.export_csv_streaming, items, output_path))
+        # A bound slot, so the result is delivered on the GUI thread; only one
+        # export runs at a time since the button is disabled meanwhile
+        worker.signals.finished.connect(self._on_quick_export_finished)
+        self._quick_export_path = output_path
+        self.quick_export_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+        
+    def _on_quick_export_finished(self, success: bool, message: str):
+        """Report the result of a quick export."""
+        output_path = self._quick_export_path
+        self.quick_export_btn.setEnabled(True)
         
         if success:
             QMessageBox.information(
@@ -772,9 +1207,8 @@ class BatchProcessingWidget(QWidget):
                 f"Alt text results exported to:\n{output_path.name}"
             )
             
-            # Open in finder
-            import subprocess
-            subprocess.run(["open", "-R", str(output_path)])
+            # Open in finder without waiting for it
+            reveal_in_file_manager(output_path)
         else:
             QMessageBox.critical(
                 self,
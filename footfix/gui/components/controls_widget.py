@@ -5,16 +5,69 @@ Extracted from UnifiedProcessingWidget to handle preset selection and output set
 
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QFileDialog, QGroupBox, QComboBox, QLineEdit
 )
 from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QStandardItemModel, QStandardItem
 
 logger = logging.getLogger(__name__)
 
+# Default output folder, resolved once rather than per widget
+_DOWNLOADS_DIR = Path.home() / "Downloads"
+
+# Preset combo entries: display name, preset name and tooltip
+_PRESETS: Tuple[Tuple[str, str, str], ...] = (
+    ("Editorial Web (Max 2560×1440, 0.5-1MB)", "editorial_web", 
+     "Optimized for web articles and galleries.\n"
+     "Maximum dimensions: 2560×1440 pixels\n"
+     "Target file size: 0.5-1MB\n"
+     "Perfect for editorial content and blog posts."),
+
+    ("Email (Max 600px width, <100KB)", "email",
+     "Small file size for email attachments.\n"
+     "Maximum width: 600 pixels\n"
+     "Target file size: <100KB\n"
+     "Ensures images load quickly in email clients."),
+
+    ("Instagram Story (1080×1920)", "instagram_story",
+     "Instagram Stories format.\n"
+     "Exact dimensions: 1080×1920 pixels (9:16)\n"
+     "Images will be cropped to fit if needed.\n"
+     "Optimized for mobile viewing."),
+
+    ("Instagram Feed Portrait (1080×1350)", "instagram_feed_portrait",
+     "Instagram Feed portrait format.\n"
+     "Exact dimensions: 1080×1350 pixels (4:5)\n"
+     "Images will be cropped to fit if needed.\n"
+     "Ideal for Instagram posts."),
+)
+
+# Stylesheet for the action buttons, selected by object name
+_CONTROLS_QSS = """
+    QPushButton#previewButton {
+        font-size: 16px;
+    }
+    QPushButton#previewButton:enabled {
+        background-color: #28a745;
+        color: white;
+    }
+    QPushButton#processButton {
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton#processButton:enabled {
+        background-color: #007AFF;
+        color: white;
+    }
+"""
+
+# Combo index of each preset name
+_PRESET_INDEX: Dict[str, int] = {name: i for i, (_, name, _) in enumerate(_PRESETS)}
+
 
 class ProcessingControlsWidget(QWidget):
     """
@@ -34,7 +87,7 @@ class ProcessingControlsWidget(QWidget):
     def __init__(self, parent=None):
         """Initialize the processing controls widget."""
         super().__init__(parent)
-        self.output_folder = Path.home() / "Downloads"
+        self.output_folder = _DOWNLOADS_DIR
         self.is_processing = False
         self.queue_size = 0
         
@@ -95,41 +148,24 @@ class ProcessingControlsWidget(QWidget):
         
     def setup_preset_combo(self):
         """Set up the preset combo box with options and tooltips."""
-        presets = [
-            ("Editorial Web (Max 2560×1440, 0.5-1MB)", "editorial_web", 
-             "Optimized for web articles and galleries.\n"
-             "Maximum dimensions: 2560×1440 pixels\n"
-             "Target file size: 0.5-1MB\n"
-             "Perfect for editorial content and blog posts."),
-            
-            ("Email (Max 600px width, <100KB)", "email",
-             "Small file size for email attachments.\n"
-             "Maximum width: 600 pixels\n"
-             "Target file size: <100KB\n"
-             "Ensures images load quickly in email clients."),
-            
-            ("Instagram Story (1080×1920)", "instagram_story",
-             "Instagram Stories format.\n"
-             "Exact dimensions: 1080×1920 pixels (9:16)\n"
-             "Images will be cropped to fit if needed.\n"
-             "Optimized for mobile viewing."),
-            
-            ("Instagram Feed Portrait (1080×1350)", "instagram_feed_portrait",
-             "Instagram Feed portrait format.\n"
-             "Exact dimensions: 1080×1350 pixels (4:5)\n"
-             "Images will be cropped to fit if needed.\n"
-             "Ideal for Instagram posts.")
-        ]
-        
-        for i, (display_name, preset_name, tooltip) in enumerate(presets):
-            self.preset_combo.addItem(display_name, preset_name)
-            self.preset_combo.setItemData(i, tooltip, Qt.ToolTipRole)
+        # Fill a model first and install it once, rather than notifying the
+        # combo for every entry and tooltip
+        model = QStandardItemModel(self.preset_combo)
+        for display_name, preset_name, tooltip in _PRESETS:
+            item = QStandardItem(display_name)
+            item.setData(preset_name, Qt.UserRole)
+            item.setToolTip(tooltip)
+            model.appendRow(item)
+        self.preset_combo.setModel(model)
         
         # Connect preset change signal
-        self.preset_combo.currentTextChanged.connect(lambda: self.preset_changed.emit(
-            self.preset_combo.currentData()
-        ))
+        self.preset_combo.currentIndexChanged.connect(self._on_preset_index_changed)
         
+    def _on_preset_index_changed(self, index: int):
+        """Emit the preset name of the newly selected combo entry."""
+        if index >= 0:
+            self.preset_changed.emit(self.preset_combo.itemData(index))
+            
     def setup_action_buttons(self, main_layout):
         """Set up the action buttons section."""
         button_layout = QHBoxLayout()
@@ -139,15 +175,7 @@ class ProcessingControlsWidget(QWidget):
         self.preview_button.clicked.connect(self.preview_requested.emit)
         self.preview_button.setEnabled(False)
         self.preview_button.setMinimumHeight(40)
-        self.preview_button.setStyleSheet("""
-            QPushButton {
-                font-size: 16px;
-            }
-            QPushButton:enabled {
-                background-color: #28a745;
-                color: white;
-            }
-        """)
+        self.preview_button.setObjectName("previewButton")
         button_layout.addWidget(self.preview_button)
         
         # Main process button - text adapts to queue size
@@ -155,16 +183,7 @@ class ProcessingControlsWidget(QWidget):
         self.process_button.clicked.connect(self.process_requested.emit)
         self.process_button.setEnabled(False)
         self.process_button.setMinimumHeight(40)
-        self.process_button.setStyleSheet("""
-            QPushButton {
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:enabled {
-                background-color: #007AFF;
-                color: white;
-            }
-        """)
+        self.process_button.setObjectName("processButton")
         button_layout.addWidget(self.process_button)
         
         # Cancel button
@@ -176,16 +195,18 @@ class ProcessingControlsWidget(QWidget):
         
         main_layout.addLayout(button_layout)
         
+        # One stylesheet for both buttons, parsed once per widget
+        self.setStyleSheet(_CONTROLS_QSS)
+        
     def get_selected_preset(self) -> str:
         """Get the currently selected preset name."""
         return self.preset_combo.currentData()
         
     def set_selected_preset(self, preset_name: str):
         """Set the selected preset by name."""
-        for i in range(self.preset_combo.count()):
-            if self.preset_combo.itemData(i) == preset_name:
-                self.preset_combo.setCurrentIndex(i)
-                break
+        index = _PRESET_INDEX.get(preset_name)
+        if index is not None:
+            self.preset_combo.setCurrentIndex(index)
                 
     def get_output_folder(self) -> Path:
         """Get the current output folder."""
@@ -4,8 +4,7 @@ Extracted from UnifiedProcessingWidget to handle progress tracking and time esti
 """
 
 import logging
-from datetime import timedelta
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, 
@@ -33,6 +32,14 @@ class ProgressDisplayWidget(QWidget):
         self.is_processing = False
         self.start_time = 0.0
         
+        # Latest progress not yet shown; rendered by the update timer so a
+        # burst of progress reports costs one repaint per tick
+        self._pending_progress: Optional[BatchProgress] = None
+        
+        # Values last written by _render_progress, by field, so unchanged
+        # fields aren't written again; cleared whenever other code sets them
+        self._shown: Dict[str, Any] = {}
+        
         # Timer for UI updates during processing
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_time_display)
@@ -89,6 +96,7 @@ class ProgressDisplayWidget(QWidget):
         self.update_timer.start(100)  # Update every 100ms
         
         # Reset labels
+        self._shown.clear()
         self.overall_progress_label.setText("Starting processing...")
         self.current_item_label.setText("")
         self.elapsed_label.setText("Elapsed: 00:00")
@@ -103,6 +111,7 @@ class ProgressDisplayWidget(QWidget):
         self.progress_group.setVisible(False)
         self.current_item_label.setVisible(False)
         self.update_timer.stop()
+        self._pending_progress = None
         
         self.progress_visibility_changed.emit(False)
         logger.info("Progress display hidden")
@@ -111,58 +120,88 @@ class ProgressDisplayWidget(QWidget):
         """
         Update the progress display with current batch progress.
         
+        The progress is shown on the next update timer tick; reports arriving
+        in between replace it.
+        
         Args:
             progress: BatchProgress object with current processing state
         """
-        if not self.is_processing:
-            return
+        if self.is_processing:
+            self._pending_progress = progress
             
+    def _render_pending_progress(self):
+        """Show the progress reported since the last tick, if any."""
+        progress, self._pending_progress = self._pending_progress, None
+        if progress is not None:
+            self._render_progress(progress)
+            
+    def _render_progress(self, progress: BatchProgress):
+        """Write a progress report to the labels and progress bar."""
         # Update progress bar
         if progress.total_items > 0:
             completed_count = progress.completed_items + progress.failed_items
-            percentage = (completed_count / progress.total_items) * 100
-            self.overall_progress_bar.setValue(int(percentage))
+            percentage = int((completed_count / progress.total_items) * 100)
+            if self._changed('percentage', percentage):
+                self.overall_progress_bar.setValue(percentage)
             
             # Update progress bar text to show actual numbers
-            self.overall_progress_bar.setFormat(f"{completed_count}/{progress.total_items} (%p%)")
+            bar_format = f"{completed_count}/{progress.total_items} (%p%)"
+            if self._changed('format', bar_format):
+                self.overall_progress_bar.setFormat(bar_format)
         
         # Update overall progress label
-        status_parts = []
         if progress.is_cancelled:
-            status_parts.append("Cancelling...")
+            overall_text = "Cancelling..."
         else:
-            status_parts.append(f"Processing {progress.current_item_index + 1} of {progress.total_items}")
-            
-        if progress.completed_items > 0:
-            status_parts.append(f"{progress.completed_items} completed")
+            overall_text = f"Processing {progress.current_item_index + 1} of {progress.total_items}"
             
-        if progress.failed_items > 0:
-            status_parts.append(f"{progress.failed_items} failed")
+        completed, failed = progress.completed_items, progress.failed_items
+        if completed > 0 and failed > 0:
+            overall_text = f"{overall_text} - {completed} completed - {failed} failed"
+        elif completed > 0:
+            overall_text = f"{overall_text} - {completed} completed"
+        elif failed > 0:
+            overall_text = f"{overall_text} - {failed} failed"
             
-        self.overall_progress_label.setText(" - ".join(status_parts))
+        self._set_text('overall', self.overall_progress_label, overall_text)
         
         # Update current item label
         if progress.current_item_name and not progress.is_cancelled:
-            self.current_item_label.setText(f"Current: {progress.current_item_name}")
+            current_text = f"Current: {progress.current_item_name}"
         elif progress.is_cancelled:
-            self.current_item_label.setText("Cancelling processing...")
+            current_text = "Cancelling processing..."
         else:
-            self.current_item_label.setText("")
+            current_text = ""
+        self._set_text('current', self.current_item_label, current_text)
             
         # Update time displays
         if progress.elapsed_time > 0:
-            self.elapsed_label.setText(f"Elapsed: {self._format_time(progress.elapsed_time)}")
+            self._set_text(
+                'elapsed', self.elapsed_label,
+                f"Elapsed: {self._format_time(progress.elapsed_time)}"
+            )
             
         if progress.estimated_time_remaining > 0:
-            self.remaining_label.setText(f"Remaining: {self._format_time(progress.estimated_time_remaining)}")
+            remaining_text = f"Remaining: {self._format_time(progress.estimated_time_remaining)}"
         else:
-            self.remaining_label.setText("Remaining: Calculating...")
+            remaining_text = "Remaining: Calculating..."
+        self._set_text('remaining', self.remaining_label, remaining_text)
+        
+    def _changed(self, field: str, value: Any) -> bool:
+        """Record a field's new value, returning whether it differs from the shown one."""
+        if self._shown.get(field) == value:
+            return False
+        self._shown[field] = value
+        return True
+        
+    def _set_text(self, field: str, label: QLabel, text: str):
+        """Set a label's text unless it already shows it."""
+        if self._changed(field, text):
+            label.setText(text)
             
     def update_time_display(self):
         """Update time display during processing (called by timer)."""
-        # This method can be used for real-time time updates if needed
-        # Currently the main updates come from update_progress()
-        pass
+        self._render_pending_progress()
         
     def set_completion_state(self, success: bool, cancelled: bool = False):
         """
@@ -173,6 +212,8 @@ class ProgressDisplayWidget(QWidget):
             cancelled: Whether processing was cancelled
         """
         self.update_timer.stop()
+        self._render_pending_progress()
+        self._shown.clear()
         
         if cancelled:
             self.overall_progress_label.setText("Processing cancelled")
@@ -195,6 +236,8 @@ class ProgressDisplayWidget(QWidget):
             error_message: Error message to display
         """
         self.update_timer.stop()
+        self._pending_progress = None
+        self._shown.clear()
         self.overall_progress_label.setText("Processing failed")
         self.current_item_label.setText(f"Error: {error_message}")
         
@@ -204,6 +247,8 @@ class ProgressDisplayWidget(QWidget):
         """Reset the progress display to initial state."""
         self.update_timer.stop()
         self.is_processing = False
+        self._pending_progress = None
+        self._shown.clear()
         
         self.overall_progress_bar.setValue(0)
         self.overall_progress_bar.setFormat("%p%")  # Reset to default format
@@ -239,20 +284,16 @@ class ProgressDisplayWidget(QWidget):
         Returns:
             Formatted time string (e.g., "1:30", "0:05", "1:23:45")
         """
-        if seconds < 60:
-            return f"{int(seconds)}s"
-        else:
-            td = timedelta(seconds=int(seconds))
-            # Format as H:MM:SS or M:SS
-            total_seconds = int(td.total_seconds())
-            hours = total_seconds // 3600
-            minutes = (total_seconds % 3600) // 60
-            secs = total_seconds % 60
+        total_seconds = int(seconds)
+        if total_seconds < 60:
+            return f"{total_seconds}s"
             
-            if hours > 0:
-                return f"{hours}:{minutes:02d}:{secs:02d}"
-            else:
-                return f"{minutes}:{secs:02d}"
+        # Format as H:MM:SS or M:SS
+        hours, remainder = divmod(total_seconds, 3600)
+        minutes, secs = divmod(remainder, 60)
+        if hours > 0:
+            return f"{hours}:{minutes:02d}:{secs:02d}"
+        return f"{minutes}:{secs:02d}"
                 
     def set_enabled(self, enabled: bool):
         """Enable or disable the progress display."""
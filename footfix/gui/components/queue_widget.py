@@ -9,17 +9,286 @@ from typing import List, Dict, Any, Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-    QTableWidget, QTableWidgetItem, QHeaderView,
-    QLabel, QFileDialog, QMessageBox, QGroupBox
+    QTableView, QHeaderView, QAbstractItemView,
+    QLabel, QFileDialog, QMessageBox, QGroupBox,
+    QApplication, QStyledItemDelegate, QStyleOptionButton, QStyle
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QDragEnterEvent, QDropEvent
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractTableModel, QModelIndex, QEvent, QRect,
+    QObject, QRunnable, QThreadPool, QSize
+)
+from PySide6.QtGui import QDragEnterEvent, QDropEvent, QColor, QImage, QPixmap
 
-from ...core.batch_processor import BatchItem, ProcessingStatus
+from ...core.batch_processor import BatchItem, ProcessingStatus, scan_image_files
 from ...core.processor import ImageProcessor
+from ..alt_text_widget import ThumbnailWorker, _get_thumbnail_pool
 
 logger = logging.getLogger(__name__)
 
+# Drop zone stylesheets; parsed by Qt whenever they are set, so drag
+# feedback only swaps them when the state actually changes
+_DROPZONE_IDLE_QSS = """
+    QLabel {
+        border: 2px dashed #aaa;
+        border-radius: 10px;
+        padding: 20px;
+        background-color: #f8f8f8;
+        color: #666;
+        font-size: 14px;
+    }
+"""
+
+_DROPZONE_ACTIVE_QSS = """
+    QLabel {
+        border: 2px solid #007AFF;
+        border-radius: 10px;
+        padding: 20px;
+        background-color: #e6f2ff;
+        color: #007AFF;
+        font-size: 14px;
+    }
+"""
+
+# Foreground color of the status cell; other statuses use the default
+_STATUS_COLORS = {
+    'completed': QColor(Qt.green),
+    'failed': QColor(Qt.red),
+    'processing': QColor(Qt.blue),
+}
+
+# Longest side of the filename column thumbnails; fits the fixed row height
+_THUMBNAIL_SIZE = 20
+
+
+class QueueItemsModel(QAbstractTableModel):
+    """Table model exposing queue item dictionaries to the queue table."""
+    
+    HEADERS = ["Filename", "Size", "Status", "Error", "Actions"]
+    FILENAME_COLUMN, SIZE_COLUMN, STATUS_COLUMN, ERROR_COLUMN, ACTIONS_COLUMN = range(5)
+    
+    # Whether a row's item can be removed from the queue
+    REMOVABLE_ROLE = Qt.UserRole + 1
+    
+    # Item fields shown in the table; other fields, such as the queue index,
+    # change without the row needing a repaint
+    DISPLAY_FIELDS = ('filename', 'size_text', 'status', 'error')
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items: List[Dict[str, Any]] = []
+        self._processing = False
+        
+        # Thumbnails are only decoded when a row is painted, so only rows
+        # scrolled into view pay for them
+        self._thumbnails: Dict[str, QPixmap] = {}
+        self._thumbnail_requests: Dict[str, ThumbnailWorker] = {}
+        self._rows_by_path: Optional[Dict[str, int]] = None
+        
+    def set_items(self, items: List[Dict[str, Any]]):
+        """Show queue items, updating only the rows that differ from the last call.
+        
+        Rows are matched by item path: the unchanged head and tail of the list
+        keep their rows, the rows between them are removed and inserted, and
+        kept rows whose displayed values changed are reported through dataChanged.
+        """
+        old_items = self._items
+        limit = min(len(old_items), len(items))
+        head = 0
+        while head < limit and old_items[head]['path'] == items[head]['path']:
+            head += 1
+        tail = 0
+        while tail < limit - head and old_items[-1 - tail]['path'] == items[-1 - tail]['path']:
+            tail += 1
+            
+        old_end = len(old_items) - tail
+        new_end = len(items) - tail
+        
+        # Kept rows, as (old row, new row), whose displayed values changed
+        changed_rows = [
+            new_row for old_row, new_row in
+            list(zip(range(head), range(head)))
+            + list(zip(range(old_end, len(old_items)), range(new_end, len(items))))
+            if any(old_items[old_row][field] != items[new_row][field] for field in self.DISPLAY_FIELDS)
+        ]
+        
+        if old_end > head:
+            self.beginRemoveRows(QModelIndex(), head, old_end - 1)
+            self._items = old_items[:head] + old_items[old_end:]
+            self.endRemoveRows()
+            
+        if new_end > head:
+            self.beginInsertRows(QModelIndex(), head, new_end - 1)
+            self._items = self._items[:head] + items[head:new_end] + self._items[head:]
+            self.endInsertRows()
+            
+        self._items = items
+        self._rows_by_path = None
+        if old_end > head and self._thumbnails:
+            # Forget thumbnails of images that left the queue
+            paths = {item['path'] for item in items}
+            self._thumbnails = {path: thumb for path, thumb in self._thumbnails.items() if path in paths}
+            
+        last_column = len(self.HEADERS) - 1
+        for row in changed_rows:
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, last_column),
+                [Qt.DisplayRole, Qt.ForegroundRole, self.REMOVABLE_ROLE]
+            )
+        
+    def set_processing(self, processing: bool):
+        """Set whether processing is active, which makes no item removable."""
+        if processing != self._processing:
+            self._processing = processing
+            if self._items:
+                self.dataChanged.emit(
+                    self.index(0, self.ACTIONS_COLUMN),
+                    self.index(len(self._items) - 1, self.ACTIONS_COLUMN),
+                    [self.REMOVABLE_ROLE]
+                )
+                
+    def drop_queued_thumbnails(self):
+        """Forget thumbnail requests not yet started, e.g. for rows scrolled out of view."""
+        # The pool is shared with the Alt Text tab, so only this model's
+        # requests are taken back
+        pool = _get_thumbnail_pool()
+        for worker in self._thumbnail_requests.values():
+            pool.tryTake(worker)
+        self._thumbnail_requests.clear()
+        
+    def _request_thumbnail(self, path: str):
+        """Queue decoding of a thumbnail unless it is already queued."""
+        if path in self._thumbnail_requests:
+            return
+        worker = ThumbnailWorker(Path(path), _THUMBNAIL_SIZE)
+        # Kept alive by the request map so a queued worker can be taken back
+        worker.setAutoDelete(False)
+        worker.signals.done.connect(self._on_thumbnail_loaded)
+        self._thumbnail_requests[path] = worker
+        _get_thumbnail_pool().start(worker)
+        
+    def _on_thumbnail_loaded(self, path: str, image: QImage):
+        """Store a decoded thumbnail and repaint its row."""
+        self._thumbnail_requests.pop(path, None)
+        if self._rows_by_path is None:
+            self._rows_by_path = {item['path']: row for row, item in enumerate(self._items)}
+        row = self._rows_by_path.get(path)
+        if row is None:
+            # Removed from the queue while decoding
+            return
+            
+        # A null pixmap marks images that could not be read, so they are not retried
+        self._thumbnails[path] = QPixmap.fromImage(image)
+        index = self.index(row, self.FILENAME_COLUMN)
+        self.dataChanged.emit(index, index, [Qt.DecorationRole])
+        
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+        
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        item_info = self._items[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == self.FILENAME_COLUMN:
+                return item_info['filename']
+            if column == self.SIZE_COLUMN:
+                # Formatted once by the batch item
+                return item_info['size_text']
+            if column == self.STATUS_COLUMN:
+                return item_info['status']
+            if column == self.ERROR_COLUMN:
+                return item_info['error'] or ""
+        elif role == Qt.DecorationRole and column == self.FILENAME_COLUMN:
+            thumbnail = self._thumbnails.get(item_info['path'])
+            if thumbnail is None:
+                self._request_thumbnail(item_info['path'])
+            elif not thumbnail.isNull():
+                return thumbnail
+        elif role == Qt.ForegroundRole and column == self.STATUS_COLUMN:
+            return _STATUS_COLORS.get(item_info['status'])
+        elif role == self.REMOVABLE_ROLE:
+            # Only pending items can be removed, and not while processing
+            return not self._processing and item_info['status'] == 'pending'
+            
+        return None
+        
+
+class RemoveButtonDelegate(QStyledItemDelegate):
+    """
+    Delegate for the queue table's actions column.
+    Paints a Remove button for removable rows instead of embedding a
+    widget in each of them.
+    """
+    
+    remove_clicked = Signal(int)  # row
+    
+    ROW_HEIGHT = 22
+    
+    def _button_rect(self, rect: QRect) -> QRect:
+        """Get the Remove button rectangle inside a cell."""
+        return QRect(rect.left() + 5, rect.top() + 2, 70, rect.height() - 4)
+        
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        
+        if not index.data(QueueItemsModel.REMOVABLE_ROLE):
+            return
+            
+        style = option.widget.style() if option.widget else QApplication.style()
+        button = QStyleOptionButton()
+        button.rect = self._button_rect(option.rect)
+        button.text = "Remove"
+        button.state = QStyle.State_Raised | QStyle.State_Enabled
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+        
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and index.data(QueueItemsModel.REMOVABLE_ROLE)
+                and self._button_rect(option.rect).contains(event.position().toPoint())):
+            self.remove_clicked.emit(index.row())
+            return True
+            
+        return super().editorEvent(event, model, option, index)
+        
+
+class DropScanWorkerSignals(QObject):
+    """Delivers the image paths found in a drop to the queue widget."""
+    
+    finished = Signal(list)  # Image paths found
+    
+
+class DropScanWorker(QRunnable):
+    """Collects the images in dropped files and folders on a pool thread."""
+    
+    def __init__(self, dropped_paths: List[str]):
+        super().__init__()
+        self.dropped_paths = dropped_paths
+        self.signals = DropScanWorkerSignals()
+        
+    def run(self):
+        image_paths = []
+        for dropped in self.dropped_paths:
+            path = Path(dropped)
+            if path.is_file():
+                if path.suffix.lower() in ImageProcessor.SUPPORTED_FORMATS:
+                    image_paths.append(path)
+            elif path.is_dir():
+                # Add all images from directory
+                image_paths.extend(map(Path, scan_image_files(dropped, recursive=True)))
+        self.signals.finished.emit(image_paths)
+        
 
 class QueueManagementWidget(QWidget):
     """
@@ -40,6 +309,7 @@ class QueueManagementWidget(QWidget):
         super().__init__(parent)
         self.queue_items: List[Dict[str, Any]] = []
         self.is_processing = False
+        self._drop_zone_active = False
         
         self.setup_ui()
         
@@ -97,26 +367,31 @@ class QueueManagementWidget(QWidget):
         self.drop_zone = QLabel("Drag images here or use buttons above to add images")
         self.drop_zone.setAlignment(Qt.AlignCenter)
         self.drop_zone.setMinimumHeight(150)
-        self.drop_zone.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #aaa;
-                border-radius: 10px;
-                padding: 20px;
-                background-color: #f8f8f8;
-                color: #666;
-                font-size: 14px;
-            }
-        """)
+        self.drop_zone.setStyleSheet(_DROPZONE_IDLE_QSS)
         container_layout.addWidget(self.drop_zone)
         
-        # Queue table for when we have images
-        self.queue_table = QTableWidget()
-        self.queue_table.setColumnCount(5)
-        self.queue_table.setHorizontalHeaderLabels(["Filename", "Size", "Status", "Error", "Actions"])
+        # Queue table for when we have images; cells are read from the
+        # queue items as they are painted
+        self.queue_model = QueueItemsModel(self)
+        self.queue_table = QTableView()
+        self.queue_table.setModel(self.queue_model)
+        self.remove_delegate = RemoveButtonDelegate(self)
+        self.remove_delegate.remove_clicked.connect(self.remove_item_requested.emit)
+        self.queue_table.setItemDelegateForColumn(QueueItemsModel.ACTIONS_COLUMN, self.remove_delegate)
+        
+        # Fixed row height: the view never sizes rows from their contents
+        vertical_header = self.queue_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setMinimumSectionSize(RemoveButtonDelegate.ROW_HEIGHT)
+        vertical_header.setDefaultSectionSize(RemoveButtonDelegate.ROW_HEIGHT)
+        self.queue_table.setIconSize(QSize(_THUMBNAIL_SIZE, _THUMBNAIL_SIZE))
+        self.queue_table.verticalScrollBar().valueChanged.connect(self._on_queue_scrolled)
+        
         self.queue_table.horizontalHeader().setStretchLastSection(True)
         self.queue_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.queue_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.queue_table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.queue_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.queue_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.queue_table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         self.queue_table.setVisible(False)  # Hidden initially
         container_layout.addWidget(self.queue_table)
         
@@ -130,6 +405,17 @@ class QueueManagementWidget(QWidget):
             queue_items: List of queue item dictionaries from batch processor
         """
         self.queue_items = queue_items
+        
+        # Bulk adds change the label, many rows and possibly which of the drop
+        # zone and table is shown; hold painting so they repaint once
+        self.setUpdatesEnabled(False)
+        try:
+            self._apply_queue_display(queue_items)
+        finally:
+            self.setUpdatesEnabled(True)
+            
+    def _apply_queue_display(self, queue_items: List[Dict[str, Any]]):
+        """Update the count label, table and drop zone for the queue items."""
         queue_size = len(queue_items)
         
         # Update queue count label
@@ -140,6 +426,10 @@ class QueueManagementWidget(QWidget):
         else:
             self.queue_count_label.setText(f"{queue_size} images")
         
+        # Update table content; kept current while hidden so later updates
+        # are diffed against what the queue really held
+        self.update_queue_table(queue_items)
+        
         # Smart UI adaptation based on queue size
         if queue_size == 0:
             # Show drop zone, hide table
@@ -150,42 +440,15 @@ class QueueManagementWidget(QWidget):
             self.drop_zone.setVisible(False)
             self.queue_table.setVisible(True)
             
-            # Update table content
-            self.update_queue_table(queue_items)
-            
     def update_queue_table(self, queue_items: List[Dict[str, Any]]):
         """Update the queue table with current queue information."""
-        self.queue_table.setRowCount(len(queue_items))
+        self.queue_model.set_items(queue_items)
         
-        for row, item_info in enumerate(queue_items):
-            # Filename
-            self.queue_table.setItem(row, 0, QTableWidgetItem(item_info['filename']))
-            
-            # Size
-            size_mb = item_info['size'] / (1024 * 1024)
-            self.queue_table.setItem(row, 1, QTableWidgetItem(f"{size_mb:.1f} MB"))
-            
-            # Status
-            status_item = QTableWidgetItem(item_info['status'])
-            if item_info['status'] == 'completed':
-                status_item.setForeground(Qt.green)
-            elif item_info['status'] == 'failed':
-                status_item.setForeground(Qt.red)
-            elif item_info['status'] == 'processing':
-                status_item.setForeground(Qt.blue)
-            self.queue_table.setItem(row, 2, status_item)
-            
-            # Error
-            error_text = item_info['error'] or ""
-            self.queue_table.setItem(row, 3, QTableWidgetItem(error_text))
-            
-            # Remove button (only for pending items when not processing)
-            if not self.is_processing and item_info['status'] == 'pending':
-                remove_btn = QPushButton("Remove")
-                remove_btn.clicked.connect(lambda checked, idx=row: self.remove_item_requested.emit(idx))
-                self.queue_table.setCellWidget(row, 4, remove_btn)
-            else:
-                self.queue_table.setCellWidget(row, 4, None)
+    def _on_queue_scrolled(self):
+        """Decode thumbnails for the rows now in view ahead of those scrolled past."""
+        self.queue_model.drop_queued_thumbnails()
+        # Rows still in view are not repainted by the scroll, so ask again for theirs
+        self.queue_table.viewport().update()
                 
     def set_processing_state(self, is_processing: bool):
         """
@@ -199,9 +462,8 @@ class QueueManagementWidget(QWidget):
         self.add_folder_btn.setEnabled(not is_processing)
         self.clear_queue_btn.setEnabled(not is_processing)
         
-        # Update remove buttons if we have items
-        if self.queue_items:
-            self.update_queue_table(self.queue_items)
+        # Remove buttons are only painted while not processing
+        self.queue_model.set_processing(is_processing)
             
     def get_selected_indices(self) -> List[int]:
         """Get the indices of selected rows."""
@@ -214,59 +476,45 @@ class QueueManagementWidget(QWidget):
         self.selection_changed.emit(selected_indices)
         
     # Drag and Drop Support
+    def _set_drop_zone_active(self, active: bool):
+        """Show or clear the drag highlight on the drop zone."""
+        if active == self._drop_zone_active:
+            return
+        self._drop_zone_active = active
+        self.drop_zone.setStyleSheet(_DROPZONE_ACTIVE_QSS if active else _DROPZONE_IDLE_QSS)
+        
     def dragEnterEvent(self, event: QDragEnterEvent):
         """Handle drag enter events."""
         if event.mimeData().hasUrls():
-            # Check if any URL is a valid image or directory
+            supported_formats = ImageProcessor.SUPPORTED_FORMATS
+            # Check if any URL is a valid image or directory; the extension is
+            # checked on the string so only non-image URLs touch the filesystem
             for url in event.mimeData().urls():
-                path = Path(url.toLocalFile())
-                if path.is_dir() or path.suffix.lower() in ImageProcessor.SUPPORTED_FORMATS:
+                local_path = url.toLocalFile()
+                _, dot, ext = local_path.rpartition('.')
+                if (dot and '.' + ext.lower() in supported_formats) or Path(local_path).is_dir():
                     event.acceptProposedAction()
                     # Visual feedback
-                    self.drop_zone.setStyleSheet("""
-                        QLabel {
-                            border: 2px solid #007AFF;
-                            border-radius: 10px;
-                            padding: 20px;
-                            background-color: #e6f2ff;
-                            color: #007AFF;
-                            font-size: 14px;
-                        }
-                    """)
+                    self._set_drop_zone_active(True)
                     return
                     
     def dropEvent(self, event: QDropEvent):
         """Handle drop events."""
         # Reset visual feedback
-        self.drop_zone.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #aaa;
-                border-radius: 10px;
-                padding: 20px;
-                background-color: #f8f8f8;
-                color: #666;
-                font-size: 14px;
-            }
-        """)
+        self._set_drop_zone_active(False)
         
         urls = event.mimeData().urls()
         if not urls:
             return
             
-        # Collect all valid image paths
-        image_paths = []
+        # Dropped folders can be large, so they are walked off the GUI thread;
+        # a bound slot receives the result back on the GUI thread
+        worker = DropScanWorker([url.toLocalFile() for url in urls])
+        worker.signals.finished.connect(self._on_drop_scan_finished)
+        QThreadPool.globalInstance().start(worker)
         
-        for url in urls:
-            path = Path(url.toLocalFile())
-            
-            if path.is_file() and path.suffix.lower() in ImageProcessor.SUPPORTED_FORMATS:
-                image_paths.append(path)
-            elif path.is_dir():
-                # Add all images from directory
-                for img_path in path.rglob('*'):
-                    if img_path.is_file() and img_path.suffix.lower() in ImageProcessor.SUPPORTED_FORMATS:
-                        image_paths.append(img_path)
-                        
+    def _on_drop_scan_finished(self, image_paths: List[Path]):
+        """Report the images found in dropped files and folders."""
         if not image_paths:
             QMessageBox.warning(
                 self,
@@ -281,16 +529,7 @@ class QueueManagementWidget(QWidget):
     def dragLeaveEvent(self, event):
         """Handle drag leave events."""
         # Reset visual feedback
-        self.drop_zone.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #aaa;
-                border-radius: 10px;
-                padding: 20px;
-                background-color: #f8f8f8;
-                color: #666;
-                font-size: 14px;
-            }
-        """)
+        self._set_drop_zone_active(False)
         
     def set_enabled(self, enabled: bool):
         """Enable or disable the queue management controls."""
@@ -5,15 +5,16 @@ Provides the primary user interface for image processing.
 
 import sys
 import logging
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QLabel, QFileDialog,
-    QMessageBox, QGroupBox, QTextEdit, QDialog, QApplication,
+    QMessageBox, QGroupBox, QPlainTextEdit, QDialog, QApplication,
     QTabWidget
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QMetaObject
 from PySide6.QtGui import QFont
 
 from ..core.processor import ImageProcessor
@@ -114,9 +115,10 @@ class MainWindow(QMainWindow):
         log_group = QGroupBox("Status")
         log_layout = QVBoxLayout()
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(100)
+        self.log_text.setMaximumBlockCount(1000)
         log_layout.addWidget(self.log_text)
         
         log_group.setLayout(log_layout)
@@ -144,15 +146,33 @@ class MainWindow(QMainWindow):
         
     def setup_logging(self):
         """Set up logging to display in the GUI."""
-        # Create a custom handler that writes to our text widget
+        # Create a custom handler that writes to our text widget; records are
+        # queued and appended together once per timer tick, on the GUI thread
         class GuiLogHandler(logging.Handler):
             def __init__(self, text_widget):
                 super().__init__()
                 self.text_widget = text_widget
+                self._pending = deque()
+                self._flush_scheduled = False
+                self._flush_timer = QTimer(text_widget)
+                self._flush_timer.setSingleShot(True)
+                self._flush_timer.setInterval(50)
+                self._flush_timer.timeout.connect(self._flush)
                 
             def emit(self, record):
-                msg = self.format(record)
-                self.text_widget.append(msg)
+                # Called with the handler lock held, from any thread
+                self._pending.append(self.format(record))
+                if not self._flush_scheduled:
+                    self._flush_scheduled = True
+                    QMetaObject.invokeMethod(self._flush_timer, "start", Qt.QueuedConnection)
+                    
+            def _flush(self):
+                with self.lock:
+                    messages = list(self._pending)
+                    self._pending.clear()
+                    self._flush_scheduled = False
+                if messages:
+                    self.text_widget.appendPlainText("\n".join(messages))
                 
         gui_handler = GuiLogHandler(self.log_text)
         gui_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
@@ -23,6 +23,7 @@ from ..core.alt_text_generator import AltTextStatus
 from ..core.tag_manager import TagStatus
 from ..utils.preferences import PreferencesManager
 from ..utils.notifications import NotificationManager
+from ..utils.file_manager import reveal_in_file_manager
 
 logger = logging.getLogger(__name__)
 
@@ -635,9 +636,8 @@ class MetadataExportWidget(QWidget):
                 f"Exported {len(items)} items"
             )
             
-            # Open in finder
-            import subprocess
-            subprocess.run(["open", "-R", str(output_path)])
+            # Open in finder without waiting for it
+            reveal_in_file_manager(Path(output_path))
             
         except Exception as e:
             QMessageBox.critical(
@@ -33,6 +33,7 @@ from ..utils.alt_text_exporter import AltTextExporter, ExportFormat, ExportOptio
 from ..utils.api_validator import ApiKeyValidator
 from ..utils.tag_csv_exporter import TagCsvExporter, TagExportOptions
 from ..utils.widget_configurator import WidgetConfigurator
+from ..utils.file_manager import reveal_in_file_manager
 from .alt_text_widget import AltTextWidget
 from .tag_widget import TagWidget
 from .components.queue_widget import QueueManagementWidget
@@ -257,6 +258,9 @@ class UnifiedProcessingWidget(QWidget):
         
     def on_preferences_changed(self, key: str):
         """Handle preferences changes using the configurator."""
+        if key == 'processing.max_concurrent_batch':
+            self.batch_processor.set_max_workers(self.prefs_manager.get(key, 3))
+            
         updated_config = self.widget_configurator.handle_preference_change(key, self)
         
         # Update local configuration
@@ -759,9 +763,8 @@ class UnifiedProcessingWidget(QWidget):
                 f"Alt text results exported to:\n{output_path.name}"
             )
             
-            # Open in finder
-            import subprocess
-            subprocess.run(["open", "-R", str(output_path)])
+            # Open in finder without waiting for it
+            reveal_in_file_manager(output_path)
         else:
             QMessageBox.critical(
                 self,
@@ -904,9 +907,8 @@ class UnifiedProcessingWidget(QWidget):
                 f"Tag data exported to:\n{output_path.name}\n\n{message}"
             )
             
-            # Open in finder
-            import subprocess
-            subprocess.run(["open", "-R", str(output_path)])
+            # Open in finder without waiting for it
+            reveal_in_file_manager(output_path)
         else:
             QMessageBox.critical(
                 self,
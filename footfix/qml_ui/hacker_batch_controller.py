@@ -16,6 +16,7 @@ from PySide6.QtCore import QObject, QUrl, Signal, Slot, Property, QTimer
 # Import the core batch processor
 from ..core.batch_processor import BatchProcessor, BatchItem, BatchProgress, ProcessingStatus
 from ..utils.logging_config import setup_logging
+from ..utils.preferences import PreferencesManager
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,9 @@ class HackerBatchController(QObject):
     
     def __init__(self):
         super().__init__()
-        self.batch_processor = BatchProcessor()
+        self.batch_processor = BatchProcessor(
+            max_workers=PreferencesManager.get_instance().get('processing.max_concurrent_batch', 3)
+        )
         self.current_preset = "editorial_web"
         self.output_folder = Path.home() / "Downloads"
         self.is_processing = False
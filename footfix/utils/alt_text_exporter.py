@@ -8,7 +8,7 @@ import json
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
 from enum import Enum
 from PIL import Image
 
@@ -17,6 +17,10 @@ from ..core.alt_text_generator import AltTextStatus
 
 logger = logging.getLogger(__name__)
 
+# Export files are written through a 1 MiB buffer so that large batches are
+# flushed in a few big writes rather than one per few rows
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 class ExportFormat(Enum):
     """Supported export formats."""
@@ -37,6 +41,21 @@ class AltTextExporter:
     Supports CSV and JSON with comprehensive metadata.
     """
     
+    # CSV columns
+    CSV_FIELDNAMES = [
+        'filename',
+        'alt_text',
+        'status',
+        'width',
+        'height',
+        'original_size',
+        'processed_size',
+        'processed_filename',
+        'file_format',
+        'processing_time',
+        'api_cost'
+    ]
+    
     def __init__(self):
         """Initialize the exporter."""
         self.default_export_dir = Path.home() / "Downloads"
@@ -124,32 +143,45 @@ class AltTextExporter:
             if not items_to_export:
                 return False, "No items to export based on selected criteria"
                 
-            # CSV columns
-            fieldnames = [
-                'filename',
-                'alt_text',
-                'status',
-                'width',
-                'height',
-                'original_size',
-                'processed_size',
-                'processed_filename',
-                'file_format',
-                'processing_time',
-                'api_cost'
-            ]
+        except Exception as e:
+            logger.error(f"Failed to export CSV: {e}")
+            return False, f"Export failed: {str(e)}"
             
-            # Write CSV
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        return self.export_csv_streaming(items_to_export, output_path)
+        
+    def export_csv_streaming(
+        self,
+        batch_items: Iterable[BatchItem],
+        output_path: Path
+    ) -> tuple[bool, str]:
+        """
+        Export alt text data to CSV, writing each item's row as it is read.
+        
+        No filtering is applied, so callers can pass a generator over the
+        queue and no list of items or rows is built.
+        
+        Args:
+            batch_items: Batch items to export, in order
+            output_path: Path for the output CSV file
+            
+        Returns:
+            Tuple of (success, message)
+        """
+        try:
+            exported = 0
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=self.CSV_FIELDNAMES)
                 writer.writeheader()
-                
-                for item in items_to_export:
-                    metadata = self._gather_metadata(item)
-                    writer.writerow(metadata)
+                for item in batch_items:
+                    writer.writerow(self._gather_metadata(item))
+                    exported += 1
                     
-            logger.info(f"Exported {len(items_to_export)} items to CSV: {output_path}")
-            return True, f"Successfully exported {len(items_to_export)} items to {output_path.name}"
+            if not exported:
+                output_path.unlink()
+                return False, "No items to export based on selected criteria"
+                
+            logger.info(f"Exported {exported} items to CSV: {output_path}")
+            return True, f"Successfully exported {exported} items to {output_path.name}"
             
         except Exception as e:
             logger.error(f"Failed to export CSV: {e}")
@@ -211,7 +243,7 @@ class AltTextExporter:
             }
             
             # Write JSON
-            with open(output_path, 'w', encoding='utf-8') as jsonfile:
+            with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as jsonfile:
                 if pretty_print:
                     json.dump(export_data, jsonfile, indent=2, ensure_ascii=False)
                 else:
@@ -242,6 +274,7 @@ class AltTextExporter:
             Filtered list of batch items
         """
         filtered_items = []
+        selected_names = set(selected_items or ())
         
         for item in batch_items:
             # Skip if not processed
@@ -252,7 +285,7 @@ class AltTextExporter:
             if options == ExportOptions.ALL:
                 filtered_items.append(item)
             elif options == ExportOptions.SELECTED:
-                if selected_items and item.source_path.name in selected_items:
+                if item.source_path.name in selected_names:
                     filtered_items.append(item)
             elif options == ExportOptions.COMPLETED_ONLY:
                 if item.alt_text_status == AltTextStatus.COMPLETED and item.alt_text:
@@ -289,21 +322,21 @@ class AltTextExporter:
                 
             if cms_type.lower() == "wordpress":
                 # WordPress-optimized CSV format
-                with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+                with open(output_path, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as csvfile:
                     writer = csv.writer(csvfile)
                     writer.writerow(['filename', 'title', 'alt_text', 'caption', 'description'])
-                    
-                    for item in items_to_export:
-                        # Use filename without extension as title
-                        title = item.source_path.stem.replace('_', ' ').title()
-                        writer.writerow([
+                    writer.writerows(
+                        [
                             item.source_path.name,
-                            title,
+                            # Use filename without extension as title
+                            item.source_path.stem.replace('_', ' ').title(),
                             item.alt_text or "",
                             "",  # Empty caption
                             item.alt_text or ""  # Use alt text as description too
-                        ])
-                        
+                        ]
+                        for item in items_to_export
+                    )
+                    
             else:
                 # Generic JSON format for other CMS
                 export_data = {
@@ -321,7 +354,7 @@ class AltTextExporter:
                         }
                     })
                     
-                with open(output_path, 'w', encoding='utf-8') as jsonfile:
+                with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as jsonfile:
                     json.dump(export_data, jsonfile, indent=2)
                     
             logger.info(f"Exported {len(items_to_export)} items for {cms_type} CMS")
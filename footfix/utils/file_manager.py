@@ -0,0 +1,18 @@
+"""
+File manager integration for FootFix.
+Reveals exported files in Finder, or in the platform's file manager elsewhere.
+"""
+
+import sys
+from pathlib import Path
+
+from PySide6.QtCore import QProcess, QUrl
+from PySide6.QtGui import QDesktopServices
+
+
+def reveal_in_file_manager(path: Path):
+    """Show a file in Finder, or open its folder elsewhere, without blocking."""
+    if sys.platform == "darwin":
+        QProcess.startDetached("open", ["-R", str(path)])
+    else:
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(path.parent)))
@@ -38,6 +38,7 @@ class WidgetConfigurator:
         memory_limit = self.prefs_manager.get('advanced.memory_limit_mb', 2048)
         batch_processor.set_memory_limit(memory_limit)
         batch_processor.set_memory_optimization(True)
+        batch_processor.set_max_workers(self.prefs_manager.get('processing.max_concurrent_batch', 3))
         
         # Configure tag manager if provided
         if tag_manager:
@@ -6,6 +6,7 @@ Main entry point for the application.
 
 import sys
 import logging
+import multiprocessing
 from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
@@ -51,4 +52,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Batch processing starts worker processes; lets a frozen app bundle run them
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
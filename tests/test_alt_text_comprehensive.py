@@ -16,7 +16,7 @@ import tempfile
 import shutil
 import aiohttp
 
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtCore import Qt
 
 from footfix.core.alt_text_generator import (
@@ -261,7 +261,7 @@ class TestAltTextWidget:
         widget.set_batch_items(batch_items)
         
         assert len(widget.batch_items) == 3
-        assert widget.items_table.rowCount() == 3
+        assert widget.items_table.model().rowCount() == 3
         
     def test_alt_text_editing(self, app):
         """Test alt text edit widget functionality."""
@@ -278,6 +278,39 @@ class TestAltTextWidget:
         edit_widget.setPlainText(long_text)
         assert "background-color" in edit_widget.styleSheet()
         
+    def test_alt_text_validation_debounced(self, app):
+        """Test validation signals are coalesced while typing."""
+        edit_widget = AltTextEditWidget()
+        emitted = []
+        edit_widget.text_changed_with_validation.connect(
+            lambda text, is_valid: emitted.append((text, is_valid))
+        )
+        
+        edit_widget.setPlainText("First draft")
+        edit_widget.setPlainText("a" * 130)
+        assert emitted == []
+        
+        edit_widget.flush_validation()
+        assert emitted == [("a" * 130, False)]
+        
+        # Unchanged text is not emitted again
+        edit_widget.set_text_with_validation("a" * 130)
+        assert len(emitted) == 1
+        
+    def test_alt_text_updates_coalesced(self, app):
+        """Test per-item edits are emitted together in one update."""
+        widget = AltTextWidget()
+        emitted = []
+        widget.alt_text_updated.connect(emitted.append)
+        
+        widget._on_item_alt_text_updated("a.jpg", "First")
+        widget._on_item_alt_text_updated("b.jpg", "Second")
+        widget._on_item_alt_text_updated("a.jpg", "First, edited")
+        assert emitted == []
+        
+        app.processEvents()
+        assert emitted == [{"a.jpg": "First, edited", "b.jpg": "Second"}]
+        
     def test_selection_functionality(self, app, batch_items):
         """Test item selection in the widget."""
         widget = AltTextWidget()
@@ -287,6 +320,39 @@ class TestAltTextWidget:
         widget.select_all_cb.setChecked(True)
         assert widget.regenerate_selected_btn.isEnabled()
         
+    def test_item_regenerate_requests_confirmed_together(self, app):
+        """Test quick per-item regenerate clicks share one confirmation."""
+        widget = AltTextWidget()
+        emitted = []
+        widget.regenerate_requested.connect(emitted.append)
+
+        with patch('footfix.gui.alt_text_widget.QMessageBox.question',
+                   return_value=QMessageBox.Yes) as mock_question:
+            widget._on_item_regenerate_requested("a.jpg")
+            widget._on_item_regenerate_requested("b.jpg")
+            widget._on_item_regenerate_requested("a.jpg")
+            widget._regenerate_timer.timeout.emit()
+
+        assert mock_question.call_count == 1
+        assert emitted == [["a.jpg", "b.jpg"]]
+
+    def test_refresh_updates_changed_rows_only(self, app, batch_items):
+        """Test refreshing keeps unchanged rows and reports only the changed ones."""
+        widget = AltTextWidget()
+        widget.set_batch_items(batch_items)
+        model = widget.items_table.model()
+        model.setData(model.index(0, model.SELECT_COLUMN), Qt.Checked, Qt.CheckStateRole)
+
+        changed = []
+        model.dataChanged.connect(lambda top, bottom, roles: changed.append((top.row(), bottom.row())))
+        model.modelReset.connect(lambda: changed.append("reset"))
+
+        batch_items[2].alt_text_status = AltTextStatus.ERROR
+        widget.refresh_display()
+
+        assert changed == [(2, 2)]
+        assert model.checked_count() == 1
+
     def test_export_button_states(self, app, batch_items):
         """Test export button enabling/disabling."""
         widget = AltTextWidget()
@@ -298,6 +364,45 @@ class TestAltTextWidget:
         widget.set_batch_items(batch_items)
         assert widget.export_btn.isEnabled()
         
+    def test_thumbnail_disk_cache(self, app, sample_image, temp_dir):
+        """Test thumbnails are scaled once and then served from the caches."""
+        from footfix.gui import alt_text_widget
+        
+        cache_dir = temp_dir / "thumbs"
+        alt_text_widget._load_thumbnail.cache_clear()
+        with patch.object(alt_text_widget, "_thumbnail_cache_dir", return_value=cache_dir):
+            thumbnail = alt_text_widget._get_cached_thumbnail(sample_image)
+            
+            assert thumbnail.width() == 80
+            assert thumbnail.height() == 60
+            assert len(list(cache_dir.glob("*.png"))) == 1
+            
+            # Second lookup is served from memory
+            assert alt_text_widget._get_cached_thumbnail(sample_image) is thumbnail
+            
+            # Other sizes, such as the queue icons, get their own entries
+            icon = alt_text_widget._get_cached_thumbnail(sample_image, 20)
+            assert (icon.width(), icon.height()) == (20, 15)
+            assert len(list(cache_dir.glob("*.png"))) == 2
+            
+            # A fresh process reads the pre-scaled file from disk
+            alt_text_widget._load_thumbnail.cache_clear()
+            cached = alt_text_widget._get_cached_thumbnail(sample_image)
+            assert (cached.width(), cached.height()) == (80, 60)
+        alt_text_widget._load_thumbnail.cache_clear()
+        
+    def test_thumbnail_loaded_in_background(self, app, batch_items, temp_dir):
+        """Test the detail widget receives its thumbnail from the worker pool."""
+        from footfix.gui import alt_text_widget
+        
+        with patch.object(alt_text_widget, "_thumbnail_cache_dir", return_value=temp_dir / "thumbs"):
+            item_widget = alt_text_widget.AltTextItemWidget(batch_items[0])
+            alt_text_widget._get_thumbnail_pool().waitForDone()
+            app.processEvents()
+            
+        assert not item_widget.thumbnail_label.pixmap().isNull()
+        alt_text_widget._load_thumbnail.cache_clear()
+        
     def test_progress_updates(self, app):
         """Test progress display updates."""
         widget = AltTextWidget()
@@ -308,6 +413,19 @@ class TestAltTextWidget:
         assert widget.progress_bar.maximum() == 10
         assert "50%" in widget.progress_label.text()
 
+    def test_progress_updates_throttled(self, app):
+        """Test rapid progress updates are collapsed into the latest one."""
+        widget = AltTextWidget()
+
+        widget.update_progress(1, 10, "Processing")
+        widget.update_progress(2, 10, "Processing")
+        widget.update_progress(3, 10, "Processing")
+        assert widget.progress_bar.value() == 1
+
+        widget._progress_timer.timeout.emit()
+        assert widget.progress_bar.value() == 3
+        assert "30%" in widget.progress_label.text()
+
 
 class TestAltTextExporter:
     """Unit tests for AltTextExporter class."""
@@ -357,7 +475,30 @@ class TestAltTextExporter:
             rows = list(reader)
             assert len(rows) == 3
             assert rows[0]['alt_text'] == "Test alt text for image 0"
-            
+    
+    def test_csv_streaming_export(self, temp_dir, batch_items):
+        """Test CSV export from a generator of items."""
+        exporter = AltTextExporter()
+        output_path = temp_dir / "streamed_export.csv"
+        
+        success, message = exporter.export_csv_streaming(
+            (item for item in batch_items[1:]), output_path
+        )
+        
+        assert success is True
+        with open(output_path, 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+            assert [row['filename'] for row in rows] == [
+                item.source_path.name for item in batch_items[1:]
+            ]
+        
+        # Nothing to write leaves no file behind
+        empty_path = temp_dir / "empty_export.csv"
+        success, message = exporter.export_csv_streaming(iter(()), empty_path)
+        
+        assert success is False
+        assert not empty_path.exists()
+    
     def test_json_export(self, temp_dir, batch_items):
         """Test JSON export functionality."""
         exporter = AltTextExporter()
@@ -0,0 +1,192 @@
+"""
+Tests for the BatchProcessor class.
+Verifies batch processing across worker processes, cancellation and progress.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from PIL import Image
+
+from footfix.core import batch_processor
+from footfix.core.batch_processor import BatchProcessor, ProcessingStatus
+from footfix.core.queue_manager import QueueManager
+from footfix.utils.widget_configurator import WidgetConfigurator
+
+
+class TestBatchProcessor:
+    """Test cases for BatchProcessor."""
+    
+    @pytest.fixture
+    def image_paths(self, tmp_path):
+        """Create a folder of small test images."""
+        paths = []
+        for i in range(8):
+            path = tmp_path / f"image_{i}.jpg"
+            Image.new('RGB', (320, 240), color=(i * 30, 100, 50)).save(path, 'JPEG')
+            paths.append(path)
+        return paths
+        
+    @pytest.fixture
+    def output_folder(self, tmp_path):
+        """Create an output folder."""
+        folder = tmp_path / "output"
+        folder.mkdir()
+        return folder
+        
+    def _make_processor(self, image_paths, max_workers):
+        """Create a batch processor with the test images queued."""
+        processor = BatchProcessor(max_workers=max_workers)
+        for path in image_paths:
+            assert processor.add_image(path)
+        return processor
+        
+    def test_add_images_bulk_checks_file_headers(self, image_paths, tmp_path):
+        """Test that files named like images but with other content are not queued."""
+        mislabeled = tmp_path / "notes.jpg"
+        mislabeled.write_text("not an image")
+        processor = BatchProcessor()
+        
+        added = processor.add_images_bulk([image_paths[0], mislabeled, image_paths[1]])
+        
+        assert added == 2
+        assert [item.source_path for item in processor.queue] == image_paths[:2]
+        
+    def test_add_image_checks_file_header(self, image_paths, tmp_path):
+        """Test that a single add applies the same header check."""
+        mislabeled = tmp_path / "notes.png"
+        mislabeled.write_text("not an image")
+        processor = BatchProcessor()
+        
+        assert processor.add_image(image_paths[0]) is True
+        assert processor.add_image(mislabeled) is False
+        assert processor.queue[0].file_size == image_paths[0].stat().st_size
+        
+    def test_queue_manager_validation_checks_file_header(self, image_paths, tmp_path):
+        """Test that queue validation reports mislabeled files as invalid."""
+        mislabeled = tmp_path / "notes.tif"
+        mislabeled.write_text("not an image")
+        manager = QueueManager(BatchProcessor())
+        
+        assert manager._validate_file(image_paths[0])['valid'] is True
+        result = manager._validate_file(mislabeled)
+        assert result['valid'] is False
+        assert result['error'] == "Not a valid image file"
+        
+    def test_default_is_single_worker(self):
+        """Test that processing is sequential unless more workers are requested."""
+        assert BatchProcessor().max_workers == 1
+        
+    def test_configured_worker_count(self):
+        """Test that the widgets' configuration applies the concurrent batch preference."""
+        prefs = Mock()
+        prefs.get.side_effect = lambda key, default=None: 4 if key == 'processing.max_concurrent_batch' else default
+        processor = BatchProcessor()
+        
+        WidgetConfigurator(prefs).configure_batch_processor(processor)
+        
+        assert processor.max_workers == 4
+        processor.set_max_workers(0)
+        assert processor.max_workers == 1
+        
+    def test_process_batch_single_worker(self, image_paths, output_folder):
+        """Test that a single worker processes images inline and stops on cancel."""
+        processor = self._make_processor(image_paths[:3], max_workers=1)
+        processor.register_item_complete_callback(
+            lambda item: processor.cancel_processing() if item.source_path == image_paths[1] else None
+        )
+        
+        results = processor.process_batch('email', output_folder)
+        
+        assert results['successful'] == 2
+        assert results['cancelled'] is True
+        assert processor.queue[2].status == ProcessingStatus.SKIPPED
+        assert not processor.queue[2].output_path.exists()
+        
+    def test_process_batch_worker_pool(self, image_paths, output_folder):
+        """Test processing a batch in worker processes."""
+        processor = self._make_processor(image_paths[:4], max_workers=2)
+        completed = []
+        processor.register_item_complete_callback(lambda item: completed.append(item.source_path))
+        
+        results = processor.process_batch('email', output_folder)
+        
+        assert results['successful'] == 4
+        assert results['failed'] == 0
+        assert all(item.status == ProcessingStatus.COMPLETED for item in processor.queue)
+        assert all(item.output_path.exists() for item in processor.queue)
+        
+        # Items are reported in queue order
+        assert completed == image_paths[:4]
+        
+    def test_worker_failure_marks_item_failed(self, image_paths, output_folder):
+        """Test that an image that cannot be loaded fails without stopping the batch."""
+        processor = self._make_processor(image_paths[:3], max_workers=2)
+        image_paths[1].write_bytes(b"\xff\xd8\xff not really a jpeg")
+        
+        results = processor.process_batch('email', output_folder)
+        
+        assert results['successful'] == 2
+        assert results['failed'] == 1
+        assert processor.queue[1].status == ProcessingStatus.FAILED
+        assert processor.queue[1].error_message
+        
+    def test_cancel_skips_unsubmitted_items(self, image_paths, output_folder):
+        """Test that cancelling skips every image not yet handed to a worker."""
+        processor = self._make_processor(image_paths, max_workers=2)
+        processor.register_item_complete_callback(lambda item: processor.cancel_processing())
+        
+        results = processor.process_batch('email', output_folder)
+        
+        assert results['cancelled'] is True
+        assert processor.queue[0].status == ProcessingStatus.COMPLETED
+        
+        # Two images per worker are submitted ahead of the one collected
+        window = 4
+        assert all(item.status == ProcessingStatus.SKIPPED for item in processor.queue[window:])
+        assert all(
+            item.status in (ProcessingStatus.COMPLETED, ProcessingStatus.SKIPPED)
+            for item in processor.queue
+        )
+        assert results['skipped'] >= len(image_paths) - window
+        assert not any(item.output_path.exists() for item in processor.queue[window:])
+        
+    def test_estimated_time_shared_between_workers(self, image_paths, output_folder):
+        """Test that the remaining time estimate divides the work between the workers."""
+        processor = self._make_processor(image_paths[:4], max_workers=2)
+        estimates = []
+        processor.register_item_complete_callback(
+            lambda item: estimates.append((
+                processor.progress.current_item_index,
+                processor.progress.average_processing_time,
+                processor.progress.estimated_time_remaining
+            ))
+        )
+        
+        processor.process_batch('email', output_folder)
+        
+        assert len(estimates) == 4
+        for index, average, remaining in estimates:
+            assert remaining == pytest.approx((4 - index - 1) * average / 2)
+        assert estimates[-1][2] == 0
+        
+    def test_memory_limit_serializes_workers(self, image_paths, output_folder):
+        """Test that a batch still completes when worker memory is over the limit."""
+        processor = self._make_processor(image_paths[:4], max_workers=2)
+        processor.set_memory_limit(1)
+        
+        assert processor._check_memory_usage() is True
+        
+        results = processor.process_batch('email', output_folder)
+        
+        assert results['successful'] == 4
+        
+    def test_memory_check_follows_current_usage(self, monkeypatch):
+        """Test that workers are no longer serialized once memory use has gone down."""
+        processor = BatchProcessor()
+        processor.set_memory_limit(1000)
+        usage = iter([900.0, 100.0])
+        monkeypatch.setattr(batch_processor, '_memory_usage_mb', lambda: next(usage))
+        
+        assert processor._check_memory_usage() is True
+        assert processor._check_memory_usage() is False
@@ -0,0 +1,71 @@
+"""
+Tests for the batch processing widget.
+Verifies how the Alt Text tab is updated when a batch finishes.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from footfix.core.alt_text_generator import AltTextStatus
+from footfix.core.batch_processor import BatchItem, BatchProcessor, BatchProgress, ProcessingStatus
+from footfix.gui.batch_widget import BatchProcessingThread, BatchProcessingWidget
+
+
+@pytest.fixture
+def app():
+    """Create Qt application for GUI tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+class TestBatchProcessingWidget:
+    """Test cases for BatchProcessingWidget."""
+    
+    @pytest.fixture
+    def widget(self, app):
+        """Create a widget streaming alt text for three queued images."""
+        widget = BatchProcessingWidget()
+        widget.batch_processor.queue = [
+            BatchItem(source_path=Path(f"/images/image_{i}.jpg")) for i in range(3)
+        ]
+        widget.refresh_queue_display()
+        widget._streaming_alt_text = True
+        widget.alt_text_widget.set_batch_items(widget.batch_processor.queue)
+        yield widget
+        widget.shutdown()
+        
+    def test_batch_completion_refreshes_unreported_alt_text(self, widget):
+        """Test that rows whose alt text failed without a completion are shown at the end."""
+        for item in widget.batch_processor.queue:
+            item.status = ProcessingStatus.COMPLETED
+        widget.batch_processor.queue[1].alt_text_status = AltTextStatus.ERROR
+        
+        with patch.object(widget, '_show_cancel_dialog'):
+            widget.on_batch_completed({'cancelled': True})
+            
+        counts = widget.alt_text_widget.table_model.status_counts()
+        assert counts[AltTextStatus.ERROR] == 1
+        assert counts[AltTextStatus.PENDING] == 2
+        assert widget._streaming_alt_text is False
+
+
+class TestBatchProcessingThread:
+    """Test cases for BatchProcessingThread."""
+    
+    def test_progress_prefetches_next_worker_file(self, app):
+        """Test that each collected item reads ahead the file the workers take next."""
+        processor = BatchProcessor(max_workers=2)
+        processor.queue = [BatchItem(source_path=Path(f"/images/image_{i}.jpg")) for i in range(4)]
+        thread = BatchProcessingThread(processor)
+        thread._prefetch = True
+        
+        with patch('footfix.gui.batch_widget._prefetch_file') as prefetch:
+            for index in (0, 0, 1, 2):
+                thread._on_progress(BatchProgress(total_items=4, current_item_index=index))
+                
+        assert [call.args[0].name for call in prefetch.call_args_list] == ["image_2.jpg", "image_3.jpg"]
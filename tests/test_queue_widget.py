@@ -0,0 +1,139 @@
+"""
+Tests for the queue management widget's table model.
+Verifies that queue updates only touch the rows that changed.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from footfix.gui import alt_text_widget
+from footfix.gui.components.queue_widget import QueueItemsModel
+
+
+@pytest.fixture
+def app():
+    """Create Qt application for GUI tests."""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def make_items(names, status='pending'):
+    """Build queue item dicts as BatchProcessor.get_queue_info returns them."""
+    return [{
+        'index': i,
+        'filename': name,
+        'path': f"/images/{name}",
+        'size': 1024,
+        'size_text': "0.0 MB",
+        'status': status,
+        'error': None,
+    } for i, name in enumerate(names)]
+
+
+class TestQueueItemsModel:
+    """Test cases for QueueItemsModel.set_items."""
+    
+    @pytest.fixture
+    def model(self, app):
+        """Create a model showing five pending items."""
+        model = QueueItemsModel()
+        model.set_items(make_items(["a.jpg", "b.jpg", "c.jpg", "d.jpg", "e.jpg"]))
+        return model
+        
+    @pytest.fixture
+    def events(self, model):
+        """Record the row and data change signals the model emits."""
+        events = []
+        model.rowsInserted.connect(lambda parent, first, last: events.append(('inserted', first, last)))
+        model.rowsRemoved.connect(lambda parent, first, last: events.append(('removed', first, last)))
+        model.dataChanged.connect(lambda top, bottom, roles: events.append(('changed', top.row(), bottom.row())))
+        return events
+        
+    def filenames(self, model):
+        """Get the filenames shown in the table, in row order."""
+        return [model.index(row, QueueItemsModel.FILENAME_COLUMN).data() for row in range(model.rowCount())]
+        
+    def test_append_inserts_at_tail(self, model, events):
+        """Test that appended items are inserted without touching existing rows."""
+        model.set_items(make_items(["a.jpg", "b.jpg", "c.jpg", "d.jpg", "e.jpg", "f.jpg", "g.jpg"]))
+        
+        assert events == [('inserted', 5, 6)]
+        assert self.filenames(model)[-2:] == ["f.jpg", "g.jpg"]
+        
+    def test_insert_at_head(self, model, events):
+        """Test that items added before the kept rows are inserted at the head."""
+        model.set_items(make_items(["z.jpg", "a.jpg", "b.jpg", "c.jpg", "d.jpg", "e.jpg"]))
+        
+        assert events == [('inserted', 0, 0)]
+        assert self.filenames(model)[0] == "z.jpg"
+        
+    def test_remove_middle_row_ignores_reindexing(self, model, events):
+        """Test that removing a row does not report the renumbered rows after it as changed."""
+        model.set_items(make_items(["a.jpg", "b.jpg", "d.jpg", "e.jpg"]))
+        
+        assert events == [('removed', 2, 2)]
+        assert self.filenames(model) == ["a.jpg", "b.jpg", "d.jpg", "e.jpg"]
+        
+    def test_remove_head_and_tail(self, model, events):
+        """Test removing rows at both ends of the queue."""
+        model.set_items(make_items(["b.jpg", "c.jpg", "d.jpg", "e.jpg"]))
+        model.set_items(make_items(["b.jpg", "c.jpg", "d.jpg"]))
+        
+        assert events == [('removed', 0, 0), ('removed', 3, 3)]
+        assert self.filenames(model) == ["b.jpg", "c.jpg", "d.jpg"]
+        
+    def test_status_change_updates_only_that_row(self, model, events):
+        """Test that a kept row whose displayed values changed is reported."""
+        items = make_items(["a.jpg", "b.jpg", "c.jpg", "d.jpg", "e.jpg"])
+        items[3]['status'] = 'completed'
+        
+        model.set_items(items)
+        
+        assert events == [('changed', 3, 3)]
+        assert model.index(3, QueueItemsModel.STATUS_COLUMN).data() == 'completed'
+        assert model.index(3, QueueItemsModel.ACTIONS_COLUMN).data(QueueItemsModel.REMOVABLE_ROLE) is False
+        
+    def test_replace_middle_rows(self, model, events):
+        """Test that rows between the kept head and tail are replaced."""
+        model.set_items(make_items(["a.jpg", "x.jpg", "y.jpg", "z.jpg", "e.jpg"]))
+        
+        assert events == [('removed', 1, 3), ('inserted', 1, 3)]
+        assert self.filenames(model) == ["a.jpg", "x.jpg", "y.jpg", "z.jpg", "e.jpg"]
+        
+    def test_clear(self, model, events):
+        """Test that emptying the queue removes every row."""
+        model.set_items([])
+        
+        assert events == [('removed', 0, 4)]
+        assert model.rowCount() == 0
+
+
+class TestQueueItemsThumbnails:
+    """Test cases for the filename column thumbnails."""
+    
+    def test_thumbnail_uses_shared_cache(self, app, tmp_path):
+        """Test that queue thumbnails are decoded at icon size through the shared thumbnail cache."""
+        image_path = tmp_path / "photo.jpg"
+        Image.new('RGB', (400, 300)).save(image_path)
+        items = make_items(["photo.jpg"])
+        items[0]['path'] = str(image_path)
+        model = QueueItemsModel()
+        model.set_items(items)
+        index = model.index(0, QueueItemsModel.FILENAME_COLUMN)
+        
+        alt_text_widget._load_thumbnail.cache_clear()
+        with patch.object(alt_text_widget, "_thumbnail_cache_dir", return_value=tmp_path / "thumbs"):
+            assert index.data(Qt.DecorationRole) is None
+            alt_text_widget._get_thumbnail_pool().waitForDone()
+            app.processEvents()
+            
+        thumbnail = index.data(Qt.DecorationRole)
+        assert (thumbnail.width(), thumbnail.height()) == (20, 15)
+        assert len(list((tmp_path / "thumbs").glob("*.png"))) == 1
+        alt_text_widget._load_thumbnail.cache_clear()
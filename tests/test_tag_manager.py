@@ -0,0 +1,116 @@
+"""
+Tests for the TagManager class.
+Verifies semantic tag organization and AI status reporting.
+"""
+
+import pytest
+
+from footfix.core.tag_manager import TagManager
+
+
+class TestTagOrganization:
+    """Test cases for TagManager.organize_tags_semantically."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a fresh TagManager instance."""
+        return TagManager()
+
+    def test_single_word_categories(self, manager):
+        """Test that known single-word tags land in their category."""
+        result = manager.organize_tags_semantically(
+            ["woman", "building", "vintage", "macro", "office", "cheerful"]
+        )
+
+        assert result == {
+            "People": ["woman"],
+            "Content": ["building"],
+            "Style": ["vintage"],
+            "Technical": ["macro"],
+            "Context": ["office"],
+            "Mood": ["cheerful"],
+        }
+
+    def test_group_order(self, manager):
+        """Test that groups come back in display order, not matching priority."""
+        result = manager.organize_tags_semantically(
+            ["cheerful", "office", "macro", "vintage", "woman", "building"]
+        )
+
+        assert list(result) == ["Content", "People", "Style", "Technical", "Context", "Mood"]
+
+    def test_matching_is_case_insensitive(self, manager):
+        """Test that tag casing does not affect categorization."""
+        result = manager.organize_tags_semantically(["Woman", "OFFICE"])
+
+        assert result == {"People": ["Woman"], "Context": ["OFFICE"]}
+
+    def test_category_priority(self, manager):
+        """Test that earlier categories win when a tag matches several."""
+        # 'professional' appears in People, Technical and Mood rules
+        result = manager.organize_tags_semantically(["professional", "office modern"])
+
+        assert result == {"People": ["professional"], "Style": ["office modern"]}
+
+    def test_uncategorized_fallback(self, manager):
+        """Test the heuristic fallback for tags without a pattern match."""
+        result = manager.organize_tags_semantically(["zebra", "golden hour"])
+
+        assert result == {"Content": ["zebra"], "Style": ["golden hour"]}
+
+    def test_disabled_categories_use_fallback(self, manager):
+        """Test that only the configured semantic categories are matched."""
+        manager.set_config({'semantic_categories': ['Mood', 'People']})
+
+        assert manager.semantic_categories == ("People", "Mood")
+        assert manager.organize_tags_semantically(
+            ["woman", "cheerful", "office", "office modern"]
+        ) == {
+            "People": ["woman"],
+            "Content": ["office"],
+            "Style": ["office modern"],
+            "Mood": ["cheerful"],
+        }
+
+    def test_semantic_categories_reject_string(self, manager):
+        """Test that a single name must be given in a list, not as a bare string."""
+        categories = manager.semantic_categories
+
+        with pytest.raises(TypeError):
+            manager.semantic_categories = "People"
+        with pytest.raises(TypeError):
+            manager.semantic_categories = None
+
+        assert manager.semantic_categories == categories
+        assert manager.set_config({'semantic_categories': "People"}) is False
+
+    def test_empty_categories_removed(self, manager):
+        """Test that categories without tags are omitted."""
+        assert manager.organize_tags_semantically([]) == {}
+
+
+class TestAIStatus:
+    """Test cases for TagManager.get_ai_status."""
+
+    def test_status_reflects_settings(self):
+        """Test that setting changes are visible in the status dict."""
+        manager = TagManager()
+        manager.set_config({
+            'ai_confidence_threshold': 0.9,
+            'ai_max_tags_per_category': 5,
+            'fallback_to_patterns': False,
+        })
+
+        assert manager.get_ai_status() == {
+            "ai_enabled": False,
+            "confidence_threshold": 0.9,
+            "max_tags_per_category": 5,
+            "fallback_enabled": False,
+        }
+
+    def test_status_is_a_copy(self):
+        """Test that mutating the returned status leaves settings untouched."""
+        manager = TagManager()
+        manager.get_ai_status()["ai_enabled"] = True
+
+        assert manager.ai_generation_enabled is False